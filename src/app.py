@@ -19,6 +19,14 @@ from services.config.xai_filters_config import (
     should_show_variable_selector,
     should_show_employee_selector,
 )
+from services.config.dev_config import (
+    XAI_ARTIFACT_DIR,
+    XAI_GLOBAL_SHAP_SAMPLES,
+    XAI_SHAP_BACKEND,
+    XAI_SHAP_WORKERS,
+)
+from services.ml.artifacts import DEFAULT_ARTIFACT_DIR
+from services.ml.master_schema import read_master_df_encoded
 from services.ml.xai_service import get_xai_service
 from services.views import (
     render_global_bar_beeswarm,
@@ -79,16 +87,24 @@ def initialize_xai_components():
     XAI 컴포넌트 초기화 (앱 레벨 캐싱)
     - 모델 학습, SHAP explainer 생성, 전역 SHAP 값 계산
     - 앱 시작 시 1회만 실행됨
+    - 아티팩트 번들이 최신이면 학습/계산 없이 로드, 아니면 계산 후 번들 저장
     """
-    master_df_encoded = pd.read_csv('/app/src/services/tables/master_df_encoded.csv')
+    master_df_encoded = read_master_df_encoded('/app/src/services/tables/master_df_encoded.csv')
     employee_info_df = pd.read_csv('/app/src/services/tables/employee_info_df.csv')
 
-    xai_service = get_xai_service(master_df_encoded)
+    xai_service = get_xai_service(
+        master_df_encoded,
+        artifact_dir=XAI_ARTIFACT_DIR or DEFAULT_ARTIFACT_DIR,
+        shap_backend=XAI_SHAP_BACKEND,
+        global_shap_samples=XAI_GLOBAL_SHAP_SAMPLES,
+        shap_workers=XAI_SHAP_WORKERS,
+    )
     model = xai_service.train_model()
     explainer = xai_service.create_explainer(model)
     shap_values_global = xai_service.compute_global_shap_values(model, explainer)
     top_features = xai_service.get_top_features(shap_values_global, n=5)
     employee_risk_df = xai_service.get_active_employees_with_risk(model)
+    xai_service.save_artifacts()
 
     return {
         "xai_service": xai_service,
@@ -297,15 +313,17 @@ def main():
 
                 # employee_info_df와 조인하여 이름 가져오기
                 employee_info_df = components["employee_info_df"]
+                xai_service = components["xai_service"]
+
+                names = employee_info_df["이름"].to_numpy() if "이름" in employee_info_df.columns else None
 
-                for _, row in employee_risk_df.iterrows():
-                    emp_id = row["사번"]
-                    risk_pct = row["PREDICTED_RISK"] * 100
+                for emp_id, risk in zip(employee_risk_df["사번"], employee_risk_df["PREDICTED_RISK"]):
+                    risk_pct = risk * 100
 
-                    # 이름 조회
-                    emp_info = employee_info_df[employee_info_df["사번"] == emp_id]
-                    if not emp_info.empty and "이름" in emp_info.columns:
-                        name = emp_info["이름"].iloc[0]
+                    # 이름 조회 (사번 인덱스로 직원 정보 행을 바로 찾음)
+                    position = xai_service.get_employee_info_position(emp_id, employee_info_df)
+                    if names is not None and position is not None:
+                        name = names[position]
                         label = f"{name} ({risk_pct:.1f}%)"
                     else:
                         label = f"{emp_id} ({risk_pct:.1f}%)"
@@ -16,17 +16,40 @@ from datetime import date
 #   프로덕션: STREAMLIT_DEV_MODE=false streamlit run src/app.py
 DEV_MODE = os.getenv("STREAMLIT_DEV_MODE", "true").lower() in ("true", "1", "yes")
 
+# ==============================================================================
+# 규모 프로파일
+# ==============================================================================
+
+# 이름별 직원 수, 데이터 시작일, 샤드 크기(0이면 한 번에 생성), 근태 스트리밍 청크 크기
+# 사용법: STREAMLIT_SCALE_PROFILE=100k (개별 환경변수가 있으면 그 값이 우선)
+#   샤드 크기가 있는 프로파일은 services.tables.shards로 직원 구간별로 나누어 생성
+SCALE_PROFILES = {
+    "tiny": {"num_employees": 20, "date_start": "2024-07-01", "shard_size": 0, "attendance_chunk_size": 0},
+    "dev": {"num_employees": 100, "date_start": "2023-01-01", "shard_size": 0, "attendance_chunk_size": 0},
+    "prod": {"num_employees": 1000, "date_start": "2020-01-01", "shard_size": 0, "attendance_chunk_size": 0},
+    "10k": {"num_employees": 10_000, "date_start": "2022-01-01", "shard_size": 2_500, "attendance_chunk_size": 500},
+    "100k": {"num_employees": 100_000, "date_start": "2023-01-01", "shard_size": 5_000, "attendance_chunk_size": 500},
+    "1m": {"num_employees": 1_000_000, "date_start": "2024-01-01", "shard_size": 5_000, "attendance_chunk_size": 500},
+}
+
+SCALE_PROFILE = os.getenv("STREAMLIT_SCALE_PROFILE", "").lower()
+if SCALE_PROFILE and SCALE_PROFILE not in SCALE_PROFILES:
+    raise ValueError(f"알 수 없는 규모 프로파일입니다: {SCALE_PROFILE} (사용 가능: {', '.join(SCALE_PROFILES)})")
+
 # ==============================================================================
 # 데이터 생성 설정
 # ==============================================================================
 
 if DEV_MODE:
     # 개발 모드: 빠른 로딩을 위해 데이터 크기 축소
-    # 환경변수로 오버라이드 가능
-    NUM_EMPLOYEES = int(os.getenv("STREAMLIT_NUM_EMPLOYEES", "1000"))
-    DATE_RANGE_START = os.getenv("STREAMLIT_DATE_START", "2020-01-01")
+    # 환경변수로 오버라이드 가능 (규모 프로파일이 있으면 프로파일 값이 기본값)
+    _profile = SCALE_PROFILES.get(SCALE_PROFILE, {"num_employees": 1000, "date_start": "2020-01-01"})
+    NUM_EMPLOYEES = int(os.getenv("STREAMLIT_NUM_EMPLOYEES", str(_profile["num_employees"])))
+    DATE_RANGE_START = os.getenv("STREAMLIT_DATE_START", _profile["date_start"])
 
     print("🔧 [DEV MODE] 개발 모드 활성화:")
+    if SCALE_PROFILE:
+        print(f"   - 규모 프로파일: {SCALE_PROFILE}")
     print(f"   - 직원 수: {NUM_EMPLOYEES}명")
     print(f"   - 날짜 범위: {DATE_RANGE_START} ~ 현재")
     if NUM_EMPLOYEES == 20 and DATE_RANGE_START == "2024-07-01":
@@ -36,9 +59,10 @@ if DEV_MODE:
     else:
         print(f"   - 예상 로딩 속도: 프로덕션 수준 (대용량 데이터)")
 else:
-    # 프로덕션 모드: 전체 데이터 생성
-    NUM_EMPLOYEES = 1000
-    DATE_RANGE_START = "2020-01-01"
+    # 프로덕션 모드: 전체 데이터 생성 (규모 프로파일 기본값: prod)
+    _profile = SCALE_PROFILES[SCALE_PROFILE or "prod"]
+    NUM_EMPLOYEES = _profile["num_employees"]
+    DATE_RANGE_START = _profile["date_start"]
 
     print("🚀 [PROD MODE] 프로덕션 모드 활성화:")
     print(f"   - 직원 수: {NUM_EMPLOYEES}명")
@@ -55,4 +79,52 @@ DATE_RANGE_END = date.today().strftime("%Y-%m-%d")
 SKIP_HEAVY_TABLES = False
 
 # 캐시 설정
-ENABLE_DATA_CACHING = True
+# 사용법: STREAMLIT_ENABLE_DATA_CACHING=false (생성 테이블 디스크 캐시 비활성화)
+ENABLE_DATA_CACHING = os.getenv("STREAMLIT_ENABLE_DATA_CACHING", "true").lower() in ("true", "1", "yes")
+
+# 생성 테이블 디스크 캐시 경로 (비어 있으면 src/services/tables/.cache)
+TABLE_CACHE_DIR = os.getenv("STREAMLIT_TABLE_CACHE_DIR", "")
+
+# 테이블 병렬 빌드 워커 수 (1이면 순차 빌드)
+# 사용법: STREAMLIT_TABLE_BUILD_WORKERS=4 (독립적인 테이블 빌더를 프로세스 풀에서 동시 실행)
+TABLE_BUILD_WORKERS = int(os.getenv("STREAMLIT_TABLE_BUILD_WORKERS", "1"))
+
+# 근태 테이블 스트리밍 빌드 (직원 청크 단위, 0이면 전체 테이블을 한 번에 생성)
+# 사용법: STREAMLIT_ATTENDANCE_CHUNK_SIZE=500 (직원 500명씩 생성·집계하여 메모리 사용량을 일정하게 유지)
+# 청크 크기는 근태 시드 블록(50명)의 배수로 올림되며, 생성되는 테이블은 전체 빌드와 같음
+ATTENDANCE_CHUNK_SIZE = int(os.getenv("STREAMLIT_ATTENDANCE_CHUNK_SIZE", str(_profile.get("attendance_chunk_size", 0))))
+
+# 스트리밍 빌드 시 청크별 상세/일별 근무 행을 Parquet으로 저장할 경로 (비어 있으면 저장 안 함)
+ATTENDANCE_SPILL_DIR = os.getenv("STREAMLIT_ATTENDANCE_SPILL_DIR", "")
+
+# 마스터 테이블 증분 빌드 (직원별 소스 지문이 바뀐 직원만 집계 블록 재계산)
+# 사용법: STREAMLIT_MASTER_INCREMENTAL=true (상태는 테이블 캐시 경로의 master_state.pkl에 저장, 캐시 비활성화 시 사용 안 함)
+MASTER_INCREMENTAL = os.getenv("STREAMLIT_MASTER_INCREMENTAL", "false").lower() in ("true", "1", "yes")
+
+# 마스터 테이블 시점(as-of) 스냅샷 저장 경로 (비어 있으면 src/services/tables/.snapshots)
+# 사용법: STREAMLIT_MASTER_SNAPSHOT_DIR=/data/master_snapshots (버전/기준일별 Parquet 파티션으로 저장)
+MASTER_SNAPSHOT_DIR = os.getenv("STREAMLIT_MASTER_SNAPSHOT_DIR", "")
+
+# XAI 모델/SHAP 아티팩트 번들 경로 (비어 있으면 src/services/ml/.artifacts)
+# 사용법: STREAMLIT_XAI_ARTIFACT_DIR=/data/xai_artifacts (데이터·하이퍼파라미터가 같으면 앱 시작 시 재학습하지 않고 로드)
+XAI_ARTIFACT_DIR = os.getenv("STREAMLIT_XAI_ARTIFACT_DIR", "")
+
+# XAI SHAP 계산 백엔드 (interventional: shap.TreeExplainer, native: XGBoost 내장 pred_contribs)
+# 사용법: STREAMLIT_XAI_SHAP_BACKEND=native (배경 데이터 없이 멀티스레드로 계산, 값은 interventional과 약간 다름)
+# native의 base value는 평균 퇴사율이 아닌 트리 기준값이라 waterfall 기준값은 백엔드 간 비교 불가
+XAI_SHAP_BACKEND = os.getenv("STREAMLIT_XAI_SHAP_BACKEND", "interventional").lower()
+
+# XAI 전역 SHAP 표본 수 (학습 행렬에서 추출, 0이면 복제 행 없이 전 직원 - master_df_encoded 행)
+# 및 계산 프로세스 수 (1이면 현재 프로세스에서 계산)
+# 사용법: STREAMLIT_XAI_GLOBAL_SHAP_SAMPLES=0 STREAMLIT_XAI_SHAP_WORKERS=4 (전체 표본을 4개 프로세스로 나누어 계산)
+XAI_GLOBAL_SHAP_SAMPLES = int(os.getenv("STREAMLIT_XAI_GLOBAL_SHAP_SAMPLES", "2000"))
+XAI_SHAP_WORKERS = int(os.getenv("STREAMLIT_XAI_SHAP_WORKERS", "1"))
+
+# 테이블 빌드 프로파일 리포트 경로 (비어 있으면 프로파일링 안 함)
+# 사용법: STREAMLIT_BUILD_PROFILE=build_profile.json (빌더별 경과/CPU 시간, 메모리 피크, 출력 크기를 JSON으로 저장)
+BUILD_PROFILE = os.getenv("STREAMLIT_BUILD_PROFILE", "")
+
+# 샤드 생성 (services.tables.shards가 샤드별 프로세스에 설정, 직접 지정할 일은 없음)
+# 샤드 번호만큼 직원 단위 테이블 시드를 바꾸고, 직원 ID를 오프셋 다음 번호부터 부여
+SHARD_INDEX = int(os.getenv("STREAMLIT_SHARD_INDEX", "0"))
+SHARD_EMPLOYEE_OFFSET = int(os.getenv("STREAMLIT_SHARD_EMPLOYEE_OFFSET", "0"))
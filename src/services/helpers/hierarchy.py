@@ -0,0 +1,120 @@
+"""
+부서/직무 계층 closure 인덱스
+
+부서/직무 테이블에서 한 번만 만들어 두고, 행마다 상위 조직을 탐색하는 대신
+ID 배열 전체를 한 번의 벡터 조회로 상위 계층 ID/이름에 매핑한다.
+
+- 부서: DEP_NAME, DIVISION_ID/NAME, OFFICE_ID/NAME (자신 포함 상위 중 레벨 2/3 부서),
+  DIVISION_LABEL/OFFICE_LABEL (find_parents 표시 규칙: 'HQ 직속', '<본부> (직속)')
+- 직무: JOB_NAME, L1_JOB_ID/NAME, L2_JOB_ID/NAME (get_level1/2_ancestor 규칙)
+
+인덱스에 없는 ID나 결측 ID는 모든 컬럼이 None으로 조회된다.
+"""
+
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from services.helpers.utils import find_parents, get_level1_ancestor, get_level2_ancestor
+
+DEPT_HIERARCHY_COLUMNS = (
+    'DEP_NAME', 'DIVISION_ID', 'DIVISION_NAME', 'OFFICE_ID', 'OFFICE_NAME', 'DIVISION_LABEL', 'OFFICE_LABEL'
+)
+JOB_HIERARCHY_COLUMNS = ('JOB_NAME', 'L1_JOB_ID', 'L1_JOB_NAME', 'L2_JOB_ID', 'L2_JOB_NAME')
+
+# 상위 탐색 최대 단계 (순환 참조 방지)
+MAX_HIERARCHY_DEPTH = 10
+
+
+class HierarchyIndex:
+    """
+    ID → 상위 계층 정보 평면 배열 인덱스
+
+    컬럼별 값을 object 배열로 들고 있고, 마지막 칸에 미존재 ID용 None을 둔다.
+    조회는 Index.get_indexer 한 번과 배열 take로 끝난다.
+
+    Attributes:
+        closure_df: ID를 인덱스로 하는 상위 계층 테이블
+    """
+
+    def __init__(self, closure_df: pd.DataFrame):
+        self.closure_df = closure_df
+        self._ids = closure_df.index
+        self._arrays = {
+            col: np.append(closure_df[col].to_numpy(dtype=object), None) for col in closure_df.columns
+        }
+
+    def positions(self, ids) -> np.ndarray:
+        """ID 배열의 행 위치 (없는 ID는 None 칸 위치)"""
+        positions = self._ids.get_indexer(pd.Index(ids, dtype=object))
+        positions[positions < 0] = len(self._ids)
+        return positions
+
+    def lookup(self, ids, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        ID 배열의 상위 계층 정보를 한 번에 조회
+
+        Args:
+            ids: 조회할 ID 배열 (Series면 인덱스를 유지)
+            columns: 조회할 컬럼 (기본값: 전체)
+
+        Returns:
+            pd.DataFrame: ids와 같은 길이의 object 컬럼 테이블
+        """
+        positions = self.positions(ids)
+        columns = list(columns) if columns is not None else list(self.closure_df.columns)
+        index = ids.index if isinstance(ids, pd.Series) else None
+        return pd.DataFrame({col: self._arrays[col][positions] for col in columns}, index=index)
+
+    def get(self, id_, column: str):
+        """단일 ID의 상위 계층 값 조회"""
+        return self._arrays[column][self.positions([id_])[0]]
+
+
+def _ancestor_chain(node_id, parent_map, known_ids):
+    """자신부터 최상위까지의 ID 목록"""
+    chain = []
+    current_id = node_id
+    for _ in range(MAX_HIERARCHY_DEPTH):
+        if pd.isna(current_id) or current_id not in known_ids:
+            break
+        chain.append(current_id)
+        parent_id = parent_map.get(current_id)
+        if pd.isna(parent_id) or parent_id == current_id:
+            break
+        current_id = parent_id
+    return chain
+
+
+def build_department_hierarchy(department_df, parent_map_dept, dept_level_map, dept_name_map):
+    """부서 ID별 Division/Office 상위 부서 closure 인덱스 생성 (부서 수만큼만 탐색)"""
+    known_ids = set(department_df['DEP_ID'])
+    records = []
+    for dep_id in department_df['DEP_ID']:
+        chain = _ancestor_chain(dep_id, parent_map_dept, known_ids)
+        division_id = next((a for a in chain if dept_level_map.get(a) == 2), None)
+        office_id = next((a for a in chain if dept_level_map.get(a) == 3), None)
+        labels = find_parents(dep_id, dept_level_map, parent_map_dept, dept_name_map)
+        records.append((
+            dep_id, dept_name_map.get(dep_id),
+            division_id, dept_name_map.get(division_id), office_id, dept_name_map.get(office_id),
+            labels['DIVISION_NAME'], labels['OFFICE_NAME'],
+        ))
+    closure_df = pd.DataFrame.from_records(records, columns=('DEP_ID',) + DEPT_HIERARCHY_COLUMNS).set_index('DEP_ID')
+    return HierarchyIndex(closure_df)
+
+
+def build_job_hierarchy(job_df_indexed, parent_map_job):
+    """직무 ID별 L1/L2 상위 직무 closure 인덱스 생성 (직무 수만큼만 탐색)"""
+    job_names = job_df_indexed['JOB_NAME'].to_dict()
+    records = []
+    for job_id in job_df_indexed.index:
+        l1_job_id = get_level1_ancestor(job_id, job_df_indexed, parent_map_job)
+        l2_job_id = get_level2_ancestor(job_id, job_df_indexed, parent_map_job)
+        records.append((
+            job_id, job_names[job_id],
+            l1_job_id, job_names.get(l1_job_id), l2_job_id, job_names.get(l2_job_id),
+        ))
+    closure_df = pd.DataFrame.from_records(records, columns=('JOB_ID',) + JOB_HIERARCHY_COLUMNS).set_index('JOB_ID')
+    return HierarchyIndex(closure_df)
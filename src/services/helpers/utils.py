@@ -87,6 +87,30 @@ def calculate_age(personal_id, base_date=datetime.datetime.now()):
     except:
         return np.nan
 
+# 주민등록번호 성별 자리 → 출생 세기
+PERSONAL_ID_CENTURY = {'1': 1900, '2': 1900, '5': 1900, '6': 1900, '3': 2000, '4': 2000, '7': 2000, '8': 2000, '9': 1800, '0': 1800}
+
+def parse_birth_dates(personal_ids):
+    """주민등록번호 배열에서 생년월일을 datetime64 배열로 한 번에 추출하는 함수 (잘못된 번호는 NaT)"""
+    pid = pd.Series(personal_ids, dtype=object).astype(str)
+    century = pid.str[7].map(PERSONAL_ID_CENTURY)
+    yymmdd = pd.to_numeric(pid.str[:6].where(pid.str[:6].str.fullmatch(r'\d{6}')), errors='coerce')
+    birth_dates = pd.to_datetime(pd.DataFrame({
+        'year': century + yymmdd // 10000,
+        'month': yymmdd // 100 % 100,
+        'day': yymmdd % 100,
+    }), errors='coerce')
+    return birth_dates.to_numpy(dtype='datetime64[ns]')
+
+def calculate_age_vectorized(birth_dates, base_dates, full_years=True):
+    """생년월일 배열과 기준일(스칼라 또는 배열)로 나이 배열을 계산하는 함수 (full_years=False면 연도 차이, 결측이 없으면 정수 배열)"""
+    birth = pd.DatetimeIndex(birth_dates)
+    base = pd.DatetimeIndex(np.broadcast_to(np.asarray(pd.to_datetime(base_dates), dtype='datetime64[ns]'), birth.shape))
+    age = np.asarray(base.year - birth.year, dtype=float)
+    if full_years:
+        age -= np.asarray((base.month * 100 + base.day) < (birth.month * 100 + birth.day))
+    return age if np.isnan(age).any() else age.astype(np.int64)
+
 def get_period_dates(eval_time_str):
     """'YYYY-상반기' 문자열을 시작일과 종료일로 변환하는 함수"""
     year, period = eval_time_str.split('-')
@@ -110,4 +134,148 @@ def calculate_night_minutes(start_dt, end_dt):
         overlap_start2, overlap_end2 = max(start_dt, night_start2), min(end_dt, night_end2)
         if overlap_end2 > overlap_start2:
             total_night_minutes += (overlap_end2 - overlap_start2).total_seconds() / 60
-    return round(total_night_minutes)
\ No newline at end of file
+    return round(total_night_minutes)
+
+# 야간 근무 시간대: 시작일 0시 기준 분 단위 구간 (당일 00:00~06:00, 당일 22:00~익일 06:00)
+NIGHT_WINDOWS = ((0, 6 * 60), (22 * 60, 30 * 60))
+
+def calculate_window_overlap_minutes(start_minutes, end_minutes, windows):
+    """근무 구간과 시간대(windows)의 겹치는 시간을 분 단위로 계산하는 벡터화 함수
+
+    start_minutes/end_minutes는 epoch 기준 분 단위 int64 배열이며, windows는 시작 시각이 속한 날의
+    0시 기준 (시작 분, 종료 분) 구간 목록이다. 야간(NIGHT_WINDOWS) 외에 심야·새벽 등 다른 시간대
+    피처에도 그대로 사용할 수 있다.
+    """
+    start_minutes = np.asarray(start_minutes, dtype=np.int64)
+    end_minutes = np.asarray(end_minutes, dtype=np.int64)
+    day_start = start_minutes - start_minutes % (24 * 60)
+    total = np.zeros(len(start_minutes), dtype=np.int64)
+    for window_start, window_end in windows:
+        overlap = np.minimum(end_minutes, day_start + window_end) - np.maximum(start_minutes, day_start + window_start)
+        total += np.maximum(overlap, 0)
+    return total
+
+def calculate_night_minutes_vectorized(start_dt, end_dt):
+    """calculate_night_minutes의 벡터화 버전 (datetime Series 입력, 결측은 0분)"""
+    valid = (start_dt.notna() & end_dt.notna()).to_numpy()
+    start_minutes = start_dt.to_numpy(dtype='datetime64[m]').astype(np.int64)
+    end_minutes = end_dt.to_numpy(dtype='datetime64[m]').astype(np.int64)
+    night_minutes = calculate_window_overlap_minutes(start_minutes, end_minutes, NIGHT_WINDOWS)
+    return np.where(valid, night_minutes, 0)
+
+def build_employee_date_scaffold(emp_dates_df, start_date, end_date):
+    """직원별 재직 기간(IN_DATE~OUT_DATE) 중 조회 기간에 속하는 날짜만 (EMP_ID, DATE) 행으로 생성하는 함수
+
+    전체 직원 x 전체 날짜의 교차곱을 만든 뒤 걸러내는 대신, 직원별 유효 구간을 정수 일(day)
+    오프셋으로 계산해 바로 펼친다. 행 순서는 입력 직원 순서 → 날짜 오름차순이며,
+    emp_dates_df의 나머지 컬럼은 DATE 뒤에 그대로 붙는다.
+    """
+    base_day = np.datetime64(pd.Timestamp(start_date).date(), 'D')
+    num_days = int((np.datetime64(pd.Timestamp(end_date).date(), 'D') - base_day).astype(np.int64)) + 1
+
+    in_dates = emp_dates_df['IN_DATE'].dt.ceil('D')
+    out_dates = emp_dates_df['OUT_DATE'].dt.floor('D')
+    first = (in_dates.values.astype('datetime64[D]') - base_day).astype(np.int64)
+    last = (out_dates.values.astype('datetime64[D]') - base_day).astype(np.int64)
+    first = np.where(in_dates.isna(), num_days, np.maximum(first, 0))
+    last = np.where(out_dates.isna(), num_days - 1, np.minimum(last, num_days - 1))
+    lengths = np.maximum(last - first + 1, 0)
+
+    row_idx = np.repeat(np.arange(len(emp_dates_df)), lengths)
+    span_start = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    day_offsets = np.arange(lengths.sum()) - span_start + np.repeat(first, lengths)
+
+    scaffold = emp_dates_df.iloc[row_idx].reset_index(drop=True)
+    scaffold.insert(1, 'DATE', (base_day + day_offsets).astype('datetime64[ns]'))
+    return scaffold
+
+def calculate_grouped_slope(df, group_col, x_col, y_cols, min_count=2):
+    """그룹별 최소제곱 기울기를 그룹 합계(Σx, Σy, Σxy, Σx², n)로 한 번에 계산하는 함수 (점이 min_count개 미만이거나 x가 모두 같으면 0)"""
+    y_list = [y_cols] if isinstance(y_cols, str) else list(y_cols)
+    # x를 그룹별 평균 기준으로 옮겨 큰 값(날짜 서수 등)의 제곱합에서 생기는 정밀도 손실을 막음 (기울기는 불변)
+    # 그룹 안의 값만으로 옮기므로 다른 그룹의 행이 바뀌어도 결과가 비트 단위로 같음 (증분 빌드와 일치)
+    x = df[x_col].astype(float)
+    x = x - x.groupby(df[group_col]).transform('mean')
+    sums = pd.DataFrame({'n': 1.0, 'x': x, 'xx': x * x}, index=df.index)
+    for i, y_col in enumerate(y_list):
+        y = df[y_col].astype(float)
+        sums[f'y{i}'] = y
+        sums[f'xy{i}'] = x * y
+    sums = sums.groupby(df[group_col]).sum()
+
+    sxx = sums['xx'] - sums['x'] ** 2 / sums['n']
+    valid = (sums['n'] >= min_count) & (sxx > 0)
+    slopes = pd.DataFrame({
+        y_col: ((sums[f'xy{i}'] - sums['x'] * sums[f'y{i}'] / sums['n']) / sxx).where(valid, 0.0)
+        for i, y_col in enumerate(y_list)
+    })
+    return slopes[y_cols] if isinstance(y_cols, str) else slopes
+
+def calculate_grouped_quantiles(df, group_cols, value_col, quantiles, min_count=2):
+    """그룹별 분위수(선형 보간)를 한 번의 정렬로 계산해 행 단위로 돌려주는 함수 (유효값이 min_count개 미만인 그룹은 NaN)"""
+    group_cols = [group_cols] if isinstance(group_cols, str) else list(group_cols)
+    codes = df.groupby(group_cols, sort=False).ngroup().fillna(-1).to_numpy(dtype=np.int64)
+    values = df[value_col].to_numpy(dtype=float)
+    valid = (codes >= 0) & ~np.isnan(values)
+
+    # (그룹, 값) 순으로 정렬하면 각 그룹의 값이 연속된 정렬 구간이 됨
+    order = np.lexsort((values[valid], codes[valid]))
+    sorted_values = values[valid][order]
+    counts = np.bincount(codes[valid], minlength=codes.max(initial=-1) + 1)
+    starts = np.cumsum(counts) - counts
+    has_rows = codes >= 0
+
+    result = {}
+    for q in quantiles:
+        row_quantiles = np.full(len(df), np.nan)
+        if len(sorted_values):
+            # pandas/numpy percentile과 같은 위치 계산·보간식 사용
+            position = q * (counts - 1)
+            below = np.floor(position).astype(np.int64)
+            t = position - below
+            last = len(sorted_values) - 1
+            a = sorted_values[np.clip(starts + below, 0, last)]
+            b = sorted_values[np.clip(starts + np.minimum(below + 1, counts - 1), 0, last)]
+            diff = b - a
+            group_quantiles = np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
+            group_quantiles[counts < min_count] = np.nan
+            row_quantiles[has_rows] = group_quantiles[codes[has_rows]]
+        result[q] = row_quantiles
+    return pd.DataFrame(result, index=df.index)
+
+def assign_percentile_band(values, lower, upper):
+    """값을 하위/상위 분위수 경계와 비교해 '상'/'중'/'하'/'정보 없음' 배열로 구분하는 함수"""
+    values, lower, upper = (np.asarray(v, dtype=float) for v in (values, lower, upper))
+    return np.select(
+        [np.isnan(lower) | np.isnan(upper), lower == upper, values >= upper, values < lower],
+        ['정보 없음', '중', '상', '하'],
+        default='중',
+    ).astype(object)
+
+def _to_day_array(dates):
+    """날짜 배열(결측 포함)을 datetime64[D] 배열로 변환하는 함수"""
+    return pd.DatetimeIndex(pd.to_datetime(np.asarray(dates))).to_numpy(dtype='datetime64[D]')
+
+def calculate_days_worked_in_year(in_dates, out_dates, years, until=None):
+    """입사일~퇴사일(없으면 계속 재직)이 해당 연도(1/1~12/31, until 이후 제외)와 겹치는 일수 배열을 계산하는 함수 (겹치지 않으면 0)"""
+    years = np.asarray(years, dtype=np.int64)
+    year_start = (years - 1970).astype('datetime64[Y]').astype('datetime64[D]')
+    year_end = (years - 1969).astype('datetime64[Y]').astype('datetime64[D]') - np.timedelta64(1, 'D')
+    if until is not None:
+        year_end = np.minimum(year_end, np.datetime64(pd.Timestamp(until).date(), 'D'))
+    in_days, out_days = _to_day_array(in_dates), _to_day_array(out_dates)
+    start = np.maximum(in_days, year_start)
+    end = np.where(np.isnat(out_days), year_end, np.minimum(out_days, year_end))
+    days = (end - start).astype(np.int64) + 1
+    return np.where(np.isnat(start) | (days < 0), 0, days)
+
+def annualize_partial_year_pay(pay, in_dates, out_dates, pay_years):
+    """입사/퇴사 연도의 급여를 재직일수 기준 365일로 연환산하는 함수 (온전히 재직한 연도는 그대로, 재직일수가 0이면 NaN)"""
+    pay = np.asarray(pay, dtype=float)
+    pay_years = pd.to_numeric(pd.Series(pay_years, dtype=object), errors='coerce').to_numpy(dtype=float)
+    in_years = pd.DatetimeIndex(_to_day_array(in_dates)).year.to_numpy(dtype=float)
+    out_years = pd.DatetimeIndex(_to_day_array(out_dates)).year.to_numpy(dtype=float)
+    is_partial = (in_years == pay_years) | (out_years == pay_years)
+    days = calculate_days_worked_in_year(in_dates, out_dates, np.where(is_partial, pay_years, 1970))
+    annualized = np.where(days > 0, (pay / np.maximum(days, 1)) * 365, np.nan)
+    return np.where(is_partial, annualized, pay)
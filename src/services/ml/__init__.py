@@ -3,6 +3,16 @@ ML Service Module
 XAI 대시보드용 머신러닝 서비스
 """
 
+from services.ml.artifacts import load_artifact_bundle, save_artifact_bundle
+from services.ml.master_schema import apply_master_schema, read_master_df_encoded, save_master_df_encoded
 from services.ml.xai_service import XAIService, get_xai_service
 
-__all__ = ["XAIService", "get_xai_service"]
+__all__ = [
+    "XAIService",
+    "get_xai_service",
+    "apply_master_schema",
+    "read_master_df_encoded",
+    "save_master_df_encoded",
+    "load_artifact_bundle",
+    "save_artifact_bundle",
+]
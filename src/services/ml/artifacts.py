@@ -0,0 +1,294 @@
+"""
+XAI Artifacts Module
+학습된 모델과 SHAP 분석 결과를 아티팩트 번들로 저장/로드
+
+앱을 새로 띄울 때마다 XGBoost 학습, explainer 생성, 전역 SHAP 계산, 재직자 위험도 예측을
+다시 하지 않도록 결과를 디렉터리 하나에 저장해 두고, 데이터와 하이퍼파라미터가 같으면
+파일만 읽어 재사용한다.
+
+- 번들 키: master_df_encoded 내용 해시 + 하이퍼파라미터 + 번들/라이브러리 버전
+- manifest.json은 마지막에 쓰므로, 저장 도중 중단된 번들은 로드되지 않음
+
+디렉터리 구조:
+    <artifact_dir>/manifest.json      번들 키, 피처 이름, Top 피처
+    <artifact_dir>/model.ubj          XGBoost 네이티브(UBJSON) 부스터
+    <artifact_dir>/background.npy     explainer 배경 데이터 (float32)
+    <artifact_dir>/global_shap.npz    전역 SHAP values / base_values / data
+    <artifact_dir>/risk.npz           재직자 위험도 (master_df_encoded 행 번호, 예측 확률, 위험도 순)
+
+재직자 개인별 SHAP 값(선택, 배치 생성):
+    <artifact_dir>/local_shap_values.npy       (재직자 수 x 피처 수) float32, 메모리 매핑으로 읽음
+    <artifact_dir>/local_shap_data.npy         같은 행의 피처 값 float32, 메모리 매핑으로 읽음
+    <artifact_dir>/local_shap_base_values.npy  행별 base value
+    <artifact_dir>/local_shap_index.json       번들 키, 행 순서의 사번 목록 (마지막에 씀)
+
+사용법 (이미지 빌드 시 미리 생성, 개인별 SHAP 포함):
+    python -m services.ml.artifacts --data services/tables/master_df_encoded.csv --local-shap
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import shap
+import xgboost as xgb
+
+ARTIFACT_VERSION = 2
+DEFAULT_ARTIFACT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".artifacts")
+
+MANIFEST_FILE = "manifest.json"
+MODEL_FILE = "model.ubj"
+BACKGROUND_FILE = "background.npy"
+GLOBAL_SHAP_FILE = "global_shap.npz"
+RISK_FILE = "risk.npz"
+LOCAL_SHAP_VALUES_FILE = "local_shap_values.npy"
+LOCAL_SHAP_DATA_FILE = "local_shap_data.npy"
+LOCAL_SHAP_BASE_FILE = "local_shap_base_values.npy"
+LOCAL_SHAP_INDEX_FILE = "local_shap_index.json"
+
+
+def dataset_fingerprint(df: pd.DataFrame) -> str:
+    """데이터프레임 내용 해시 (컬럼 이름/순서, dtype, 행 값)"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[str(col), str(dtype)] for col, dtype in df.dtypes.items()], ensure_ascii=False).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def artifact_key(data_fingerprint: str, params: Dict[str, Any]) -> str:
+    """번들 키 (데이터 해시 + 하이퍼파라미터 + 번들/라이브러리 버전)"""
+    payload = {
+        "version": ARTIFACT_VERSION,
+        "data": data_fingerprint,
+        "params": params,
+        "xgboost": xgb.__version__,
+        "shap": shap.__version__,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def load_manifest(artifact_dir: str) -> Optional[Dict[str, Any]]:
+    """manifest.json 로드 (없거나 읽을 수 없으면 None)"""
+    try:
+        with open(os.path.join(artifact_dir, MANIFEST_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_artifact_bundle(
+    artifact_dir: str,
+    key: str,
+    model: xgb.XGBClassifier,
+    background: np.ndarray,
+    shap_values: shap.Explanation,
+    top_features: List[str],
+    risk_rows: np.ndarray,
+    risk_scores: np.ndarray,
+):
+    """
+    아티팩트 번들 저장 (기존 manifest를 먼저 지우고 마지막에 새로 씀)
+
+    Args:
+        artifact_dir: 번들 디렉터리
+        key: 번들 키 (artifact_key)
+        model: 학습된 분류기
+        background: explainer 배경 데이터 (행 수 x 피처 수)
+        shap_values: 전역 SHAP 값 (퍼센트 단위)
+        top_features: 중요 변수 이름 리스트
+        risk_rows: 위험도 순 재직자의 master_df_encoded 행 번호
+        risk_scores: risk_rows 순서의 예측 확률
+    """
+    os.makedirs(artifact_dir, exist_ok=True)
+    manifest_path = os.path.join(artifact_dir, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    model.save_model(os.path.join(artifact_dir, MODEL_FILE))
+    np.save(os.path.join(artifact_dir, BACKGROUND_FILE), np.ascontiguousarray(background, dtype=np.float32))
+    np.savez(
+        os.path.join(artifact_dir, GLOBAL_SHAP_FILE),
+        values=np.asarray(shap_values.values),
+        base_values=np.asarray(shap_values.base_values),
+        data=np.asarray(shap_values.data, dtype=np.float32),
+    )
+    np.savez(os.path.join(artifact_dir, RISK_FILE), rows=np.asarray(risk_rows, dtype=np.int64), scores=np.asarray(risk_scores))
+
+    manifest = {
+        "version": ARTIFACT_VERSION,
+        "key": key,
+        "feature_names": list(shap_values.feature_names),
+        "top_features": list(top_features),
+    }
+    with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+
+def load_artifact_bundle(artifact_dir: str, key: str) -> Optional[Dict[str, Any]]:
+    """
+    아티팩트 번들 로드
+
+    Args:
+        artifact_dir: 번들 디렉터리
+        key: 기대하는 번들 키 (다르면 오래된 번들로 보고 None 반환)
+
+    Returns:
+        Optional[Dict]: model, background, shap_values, top_features, risk_rows, risk_scores
+    """
+    manifest = load_manifest(artifact_dir)
+    if manifest is None or manifest.get("key") != key:
+        return None
+
+    model = xgb.XGBClassifier()
+    model.load_model(os.path.join(artifact_dir, MODEL_FILE))
+    background = np.load(os.path.join(artifact_dir, BACKGROUND_FILE))
+    with np.load(os.path.join(artifact_dir, GLOBAL_SHAP_FILE)) as arrays:
+        shap_values = shap.Explanation(
+            values=arrays["values"],
+            base_values=arrays["base_values"],
+            data=arrays["data"],
+            feature_names=manifest["feature_names"],
+        )
+    with np.load(os.path.join(artifact_dir, RISK_FILE)) as arrays:
+        risk_rows, risk_scores = arrays["rows"], arrays["scores"]
+
+    return {
+        "model": model,
+        "background": background,
+        "shap_values": shap_values,
+        "top_features": manifest["top_features"],
+        "risk_rows": risk_rows,
+        "risk_scores": risk_scores,
+    }
+
+
+class LocalShapStore:
+    """
+    재직자 개인별 SHAP 값 저장소
+
+    values/data는 메모리 매핑된 float32 행렬이므로 직원 한 명 조회 시 해당 행만 읽는다.
+
+    Attributes:
+        values: 개인별 SHAP 값 (재직자 수 x 피처 수, 퍼센트 단위)
+        data: 같은 행의 피처 값
+        base_values: 행별 base value (퍼센트 단위)
+    """
+
+    def __init__(self, ids: List[str], values: np.ndarray, data: np.ndarray, base_values: np.ndarray):
+        self.row_of = {employee_id: row for row, employee_id in enumerate(ids)}
+        self.values = values
+        self.data = data
+        self.base_values = base_values
+
+    def __len__(self) -> int:
+        return len(self.row_of)
+
+    def __contains__(self, employee_id: str) -> bool:
+        return employee_id in self.row_of
+
+    def get(self, employee_id: str) -> Optional[tuple]:
+        """사번의 (SHAP 값 행, 피처 값 행, base value) 조회 (없으면 None)"""
+        row = self.row_of.get(employee_id)
+        if row is None:
+            return None
+        return self.values[row], self.data[row], self.base_values[row]
+
+
+def open_local_shap_writer(artifact_dir: str, n_rows: int, n_features: int) -> tuple:
+    """
+    개인별 SHAP 저장용 메모리 매핑 행렬 생성 (기존 인덱스를 먼저 지워 저장 중에는 로드되지 않게 함)
+
+    Returns:
+        tuple: (values, data) - 쓰기 가능한 float32 memmap
+    """
+    os.makedirs(artifact_dir, exist_ok=True)
+    index_path = os.path.join(artifact_dir, LOCAL_SHAP_INDEX_FILE)
+    if os.path.exists(index_path):
+        os.remove(index_path)
+    shape = (n_rows, n_features)
+    values = np.lib.format.open_memmap(os.path.join(artifact_dir, LOCAL_SHAP_VALUES_FILE), mode="w+", dtype=np.float32, shape=shape)
+    data = np.lib.format.open_memmap(os.path.join(artifact_dir, LOCAL_SHAP_DATA_FILE), mode="w+", dtype=np.float32, shape=shape)
+    return values, data
+
+
+def save_local_shap_index(artifact_dir: str, key: str, ids: List[str], base_values: np.ndarray):
+    """개인별 SHAP base value와 사번 인덱스 저장 (행렬을 모두 쓴 뒤 호출)"""
+    np.save(os.path.join(artifact_dir, LOCAL_SHAP_BASE_FILE), np.asarray(base_values))
+    index_path = os.path.join(artifact_dir, LOCAL_SHAP_INDEX_FILE)
+    with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"version": ARTIFACT_VERSION, "key": key, "ids": list(ids)}, f, ensure_ascii=False)
+    os.replace(index_path + ".tmp", index_path)
+
+
+def load_local_shap_store(artifact_dir: str, key: str) -> Optional[LocalShapStore]:
+    """개인별 SHAP 저장소 로드 (없거나 번들 키가 다르면 None)"""
+    try:
+        with open(os.path.join(artifact_dir, LOCAL_SHAP_INDEX_FILE), encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get("key") != key:
+        return None
+
+    return LocalShapStore(
+        index["ids"],
+        np.load(os.path.join(artifact_dir, LOCAL_SHAP_VALUES_FILE), mmap_mode="r"),
+        np.load(os.path.join(artifact_dir, LOCAL_SHAP_DATA_FILE), mmap_mode="r"),
+        np.load(os.path.join(artifact_dir, LOCAL_SHAP_BASE_FILE)),
+    )
+
+
+def main(argv=None):
+    from services.config.dev_config import XAI_ARTIFACT_DIR, XAI_GLOBAL_SHAP_SAMPLES, XAI_SHAP_BACKEND, XAI_SHAP_WORKERS
+    from services.ml.master_schema import read_master_df_encoded
+    from services.ml.xai_service import XAIService, get_xai_service
+
+    # 기본값은 앱(app.py)과 같은 설정을 사용해야 앱이 이 번들을 그대로 로드함
+    parser = argparse.ArgumentParser(description="XAI 모델/SHAP 아티팩트 번들 생성")
+    parser.add_argument("--data", required=True, help="master_df_encoded CSV 경로")
+    parser.add_argument(
+        "--output", default=XAI_ARTIFACT_DIR or DEFAULT_ARTIFACT_DIR,
+        help="번들 디렉터리 (기본값: STREAMLIT_XAI_ARTIFACT_DIR, 없으면 services/ml/.artifacts)",
+    )
+    parser.add_argument("--local-shap", action="store_true", help="재직자 전원의 개인별 SHAP 값도 미리 계산")
+    parser.add_argument(
+        "--shap-backend", default=XAI_SHAP_BACKEND, choices=XAIService.SHAP_BACKENDS,
+        help="SHAP 계산 백엔드 (기본값: STREAMLIT_XAI_SHAP_BACKEND)",
+    )
+    parser.add_argument(
+        "--global-shap-samples", type=int, default=XAI_GLOBAL_SHAP_SAMPLES,
+        help="전역 SHAP 표본 수, 0이면 전 직원 (기본값: STREAMLIT_XAI_GLOBAL_SHAP_SAMPLES)",
+    )
+    parser.add_argument(
+        "--shap-workers", type=int, default=XAI_SHAP_WORKERS,
+        help="전역 SHAP 계산 프로세스 수 (기본값: STREAMLIT_XAI_SHAP_WORKERS)",
+    )
+    args = parser.parse_args(argv)
+
+    xai_service = get_xai_service(
+        read_master_df_encoded(args.data),
+        artifact_dir=args.output,
+        shap_backend=args.shap_backend,
+        global_shap_samples=args.global_shap_samples,
+        shap_workers=args.shap_workers,
+    )
+    if xai_service.save_artifacts():
+        print(f"📦 XAI 아티팩트 번들 저장: {args.output}")
+    else:
+        print(f"📦 XAI 아티팩트 번들이 최신입니다: {args.output}")
+
+    if args.local_shap:
+        if xai_service.has_local_shap_store():
+            print("📦 개인별 SHAP 값이 최신입니다.")
+        else:
+            n_rows = xai_service.precompute_local_shap_values()
+            print(f"📦 개인별 SHAP 값 저장: 재직자 {n_rows}명")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Master Schema Module
+ML 마스터 테이블(master_df_encoded) 컬럼 dtype 스키마
+
+CSV를 그대로 읽으면 원-핫 컬럼은 bool/object, 수치 컬럼은 float64/int64로 올라와
+XAIService에서 컬럼마다 to_numeric 변환을 거쳐야 했다. 스키마를 데이터 옆에
+JSON으로 저장해 두고 읽을 때 바로 적용한다.
+
+- 사번: 문자열 (값 intern)
+- 재직여부: category ('N', 'Y')
+- 퇴사자여부: uint8
+- 원-핫 컬럼: bool
+- 그 외 수치 컬럼: float32
+"""
+
+import json
+import os
+import sys
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+SCHEMA_VERSION = 1
+SCHEMA_SUFFIX = ".schema.json"
+
+ID_COLUMN = "사번"
+STATUS_COLUMN = "재직여부"
+LABEL_COLUMN = "퇴사자여부"
+STATUS_CATEGORIES = ["N", "Y"]
+
+
+def schema_path_for(data_path: str) -> str:
+    """데이터 파일 옆 스키마 파일 경로 (master_df_encoded.csv → master_df_encoded.schema.json)"""
+    return os.path.splitext(data_path)[0] + SCHEMA_SUFFIX
+
+
+def infer_master_schema(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    마스터 테이블에서 컬럼별 압축 dtype 스키마 생성
+
+    Args:
+        df: master_df_encoded (get_dummies 결과 또는 CSV 로드 결과)
+
+    Returns:
+        Dict: {"version": int, "columns": {컬럼: dtype 이름}, "categories": {컬럼: 카테고리 목록}}
+    """
+    columns = {}
+    for col in df.columns:
+        if col == ID_COLUMN:
+            columns[col] = "string"
+        elif col == STATUS_COLUMN:
+            columns[col] = "category"
+        elif col == LABEL_COLUMN:
+            columns[col] = "uint8"
+        elif pd.api.types.is_bool_dtype(df[col]):
+            columns[col] = "bool"
+        else:
+            columns[col] = "float32"
+    return {
+        "version": SCHEMA_VERSION,
+        "columns": columns,
+        "categories": {STATUS_COLUMN: STATUS_CATEGORIES} if STATUS_COLUMN in columns else {},
+    }
+
+
+def _pandas_dtypes(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """스키마 → read_csv/astype용 pandas dtype 매핑"""
+    dtypes = {}
+    for col, dtype in schema["columns"].items():
+        if dtype == "string":
+            dtypes[col] = object
+        elif dtype == "category":
+            dtypes[col] = pd.CategoricalDtype(schema["categories"][col])
+        else:
+            dtypes[col] = np.dtype(dtype)
+    return dtypes
+
+
+def apply_master_schema(df: pd.DataFrame, schema: Dict[str, Any] = None) -> pd.DataFrame:
+    """
+    스키마 dtype 적용 (이미 같은 dtype인 컬럼은 그대로 둠)
+
+    Args:
+        df: master_df_encoded
+        schema: 적용할 스키마 (None이면 df에서 추론)
+
+    Returns:
+        pd.DataFrame: 스키마가 적용된 새 데이터프레임
+    """
+    schema = schema or infer_master_schema(df)
+    dtypes = _pandas_dtypes(schema)
+    converted = {}
+    for col in df.columns:
+        values = df[col]
+        dtype = dtypes.get(col)
+        if dtype is None or values.dtype == dtype:
+            converted[col] = values
+        elif isinstance(dtype, pd.CategoricalDtype) or dtype == object:
+            converted[col] = values.astype(dtype)
+        elif values.dtype == object:
+            # 문자열로 들어온 수치 컬럼만 변환 (결측은 NaN 유지)
+            converted[col] = pd.to_numeric(values, errors="coerce").astype(dtype)
+        else:
+            converted[col] = values.astype(dtype)
+    result = pd.DataFrame(converted, index=df.index)
+    if ID_COLUMN in result.columns:
+        result[ID_COLUMN] = _intern_strings(result[ID_COLUMN])
+    return result
+
+
+def _intern_strings(values: pd.Series) -> pd.Series:
+    """문자열 값 intern (같은 사번 문자열 객체 공유)"""
+    return values.map(lambda v: sys.intern(v) if isinstance(v, str) else v)
+
+
+def save_master_schema(schema: Dict[str, Any], path: str):
+    """스키마 JSON 저장"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(schema, f, ensure_ascii=False, indent=2)
+
+
+def load_master_schema(path: str) -> Dict[str, Any]:
+    """스키마 JSON 로드 (버전이 다르면 None)"""
+    with open(path, encoding="utf-8") as f:
+        schema = json.load(f)
+    return schema if schema.get("version") == SCHEMA_VERSION else None
+
+
+def save_master_df_encoded(df: pd.DataFrame, data_path: str) -> Dict[str, Any]:
+    """
+    master_df_encoded를 CSV로 저장하고 스키마를 옆에 함께 저장
+
+    Args:
+        df: master_df_encoded
+        data_path: CSV 저장 경로
+
+    Returns:
+        Dict: 저장한 스키마
+    """
+    schema = infer_master_schema(df)
+    df.to_csv(data_path, index=False, encoding="utf-8-sig")
+    save_master_schema(schema, schema_path_for(data_path))
+    return schema
+
+
+def read_master_df_encoded(data_path: str) -> pd.DataFrame:
+    """
+    스키마를 적용해 master_df_encoded CSV 로드
+
+    스키마 파일이 있으면 read_csv 단계에서 dtype을 지정해 읽고, 없으면 읽은 뒤 추론한
+    스키마를 적용한다.
+
+    Args:
+        data_path: CSV 경로
+
+    Returns:
+        pd.DataFrame: 압축 dtype이 적용된 master_df_encoded
+    """
+    schema_path = schema_path_for(data_path)
+    schema = load_master_schema(schema_path) if os.path.exists(schema_path) else None
+    if schema is None:
+        return apply_master_schema(pd.read_csv(data_path))
+    df = pd.read_csv(data_path, dtype=_pandas_dtypes(schema))
+    return apply_master_schema(df, schema)
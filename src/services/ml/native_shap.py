@@ -0,0 +1,99 @@
+"""
+Native SHAP Module
+XGBoost 내장 TreeSHAP(pred_contribs) 기반 SHAP 계산
+
+shap.TreeExplainer(interventional)는 배경 데이터 행 수에 비례해 느려지지만, 부스터의
+pred_contribs는 배경 데이터 없이 트리 경로 통계(cover)로 TreeSHAP을 계산하고 멀티스레드로
+실행된다. 결과는 log-odds 공간 기여도이며, 확률 공간이 필요하면 행별로 비례 배분해 변환한다.
+
+- log_odds: φ_i (합 + bias = margin)
+- probability: φ_i × (σ(margin) - σ(bias)) / (margin - bias), base value = σ(bias)
+  (기여도 합 + base value = 예측 확률, 기여도 부호와 상대 크기는 log-odds와 같음.
+  margin ≈ bias이면 비율 대신 base margin에서의 기울기 σ'(bias)를 곱함)
+
+interventional 방식과는 기준(배경 분포 vs 트리 cover)이 달라 값이 완전히 같지는 않다.
+차이는 services.ml.shap_benchmark로 확인한다.
+
+base value σ(bias)는 평균 예측 확률(기대 위험도)이 아니다. 오버샘플링한 학습 데이터에서는
+interventional의 배경 평균(예: 22.6%)과 크게 다를 수 있으므로(예: 94.6%), waterfall의
+기준값과 기여도 크기는 백엔드 간에 비교하지 않는다.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+import shap
+import xgboost as xgb
+
+MODEL_OUTPUTS = ("probability", "log_odds")
+
+# 확률 변환 시 선형 근사로 바꾸는 |margin - bias| 기준 (이보다 작으면 비율 계산이 불안정)
+MARGIN_EPSILON = 1e-6
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+class NativeTreeExplainer:
+    """
+    pred_contribs 기반 explainer (shap.TreeExplainer와 같은 호출 방식)
+
+    explainer(X)는 shap.Explanation(values: 행 수 x 피처 수, base_values: 행 수)을 반환하므로
+    bar/beeswarm/PDP/waterfall 뷰를 그대로 사용할 수 있다.
+
+    Attributes:
+        model: 학습된 XGBoost 분류기
+        feature_names: 피처 이름 목록
+        model_output: 'probability' 또는 'log_odds'
+    """
+
+    def __init__(
+        self,
+        model: xgb.XGBClassifier,
+        feature_names: Optional[List[str]] = None,
+        model_output: str = "probability",
+    ):
+        if model_output not in MODEL_OUTPUTS:
+            raise ValueError(f"지원하지 않는 model_output입니다: {model_output} (사용 가능: {', '.join(MODEL_OUTPUTS)})")
+        self.model = model
+        self.booster = model.get_booster()
+        self.feature_names = list(feature_names or self.booster.feature_names)
+        self.model_output = model_output
+
+    def __call__(self, X) -> shap.Explanation:
+        """
+        SHAP 값 계산
+
+        Args:
+            X: 피처 행렬 (DataFrame 또는 배열, 컬럼 순서는 feature_names와 같아야 함)
+
+        Returns:
+            shap.Explanation: SHAP 값 (model_output 공간)
+        """
+        data = X.to_numpy(dtype=np.float32) if isinstance(X, pd.DataFrame) else np.asarray(X, dtype=np.float32)
+        if data.ndim == 1:
+            data = data[np.newaxis, :]
+        dmatrix = xgb.DMatrix(data, feature_names=self.feature_names)
+        contribs = self.booster.predict(dmatrix, pred_contribs=True).astype(float)
+        values, bias = contribs[:, :-1], contribs[:, -1]
+
+        if self.model_output == "probability":
+            margin = values.sum(axis=1) + bias
+            prob_delta = _sigmoid(margin) - _sigmoid(bias)
+            margin_delta = margin - bias
+            # 기여도 합이 (거의) 0이면 비율이 0/0이 되므로, base margin에서의 시그모이드 기울기
+            # σ'(bias) = σ(bias)(1 - σ(bias))로 선형 근사 (개별 기여도를 0으로 지우지 않음)
+            near_zero = np.abs(margin_delta) < MARGIN_EPSILON
+            slope = _sigmoid(bias) * (1.0 - _sigmoid(bias))
+            scale = np.where(near_zero, slope, prob_delta / np.where(near_zero, 1.0, margin_delta))
+            values = values * scale[:, np.newaxis]
+            bias = _sigmoid(bias)
+
+        return shap.Explanation(
+            values=values,
+            base_values=bias,
+            data=data.astype(float),
+            feature_names=self.feature_names,
+        )
@@ -0,0 +1,126 @@
+"""
+SHAP 백엔드 벤치마크
+interventional TreeExplainer와 XGBoost 내장 pred_contribs(native) 백엔드의 속도/충실도 비교
+
+같은 모델(같은 학습 데이터·하이퍼파라미터)에 대해 두 백엔드로 아래 항목을 측정한다.
+
+- 속도: explainer 생성, 전역 SHAP(표본 n행), 개인별 SHAP(1행, 중앙값)
+- 가법성: |Σ SHAP + base value - 예측 확률| (퍼센트포인트)
+- 일치도: 두 백엔드 SHAP 값의 상관계수, 평균/최대 절대 차이, 변수 중요도(mean |SHAP|) 상관계수,
+  Top N 중요 변수 겹침 수
+
+사용법:
+    python -m services.ml.shap_benchmark --data services/tables/master_df_encoded.csv --samples 2000
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+from services.ml.master_schema import read_master_df_encoded
+from services.ml.xai_service import XAIService
+
+LOCAL_REPEATS = 20
+
+
+def _benchmark_backend(service: XAIService, n_samples: int, employee_ids) -> Dict[str, Any]:
+    """백엔드 하나의 소요 시간과 SHAP 결과"""
+    model = service.train_model()
+
+    start = time.perf_counter()
+    explainer = service.create_explainer(model)
+    explainer_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    shap_values = service.compute_global_shap_values(model, explainer, n_samples=n_samples)
+    global_s = time.perf_counter() - start
+
+    local_times = []
+    for employee_id in employee_ids:
+        start = time.perf_counter()
+        service.compute_local_shap_values(employee_id, model, explainer)
+        local_times.append(time.perf_counter() - start)
+
+    X_sample = pd.DataFrame(shap_values.data, columns=service.feature_cols)
+    predicted = model.predict_proba(X_sample)[:, 1] * 100
+    additivity = np.abs(shap_values.values.sum(axis=1) + shap_values.base_values - predicted)
+
+    return {
+        "shap_values": shap_values,
+        "explainer_s": explainer_s,
+        "global_s": global_s,
+        "local_ms": float(np.median(local_times) * 1000),
+        "additivity_max_pp": float(additivity.max()),
+    }
+
+
+def run_benchmark(master_df_encoded, n_samples: int = XAIService.GLOBAL_SHAP_SAMPLES, top_n: int = 5) -> Dict[str, Any]:
+    """
+    두 백엔드 벤치마크 실행
+
+    Args:
+        master_df_encoded: ML용 인코딩된 마스터 데이터프레임
+        n_samples: 전역 SHAP 표본 수
+        top_n: 비교할 중요 변수 수
+
+    Returns:
+        Dict: 백엔드별 측정값과 두 백엔드 간 일치도
+    """
+    results = {}
+    for backend in XAIService.SHAP_BACKENDS:
+        service = XAIService(master_df_encoded, shap_backend=backend)
+        employee_ids = service.get_active_employees_with_risk()["사번"].head(LOCAL_REPEATS).tolist()
+        results[backend] = _benchmark_backend(service, n_samples, employee_ids)
+
+    reference = results["interventional"]["shap_values"]
+    native = results["native"]["shap_values"]
+    diff = np.abs(native.values - reference.values)
+    importance_reference = np.abs(reference.values).mean(0)
+    importance_native = np.abs(native.values).mean(0)
+    top_reference = np.argsort(importance_reference)[-top_n:]
+    top_native = np.argsort(importance_native)[-top_n:]
+
+    report = {backend: {k: v for k, v in result.items() if k != "shap_values"} for backend, result in results.items()}
+    report["agreement"] = {
+        "samples": int(len(reference.values)),
+        "correlation": float(np.corrcoef(native.values.ravel(), reference.values.ravel())[0, 1]),
+        "mean_abs_diff_pp": float(diff.mean()),
+        "max_abs_diff_pp": float(diff.max()),
+        "importance_correlation": float(np.corrcoef(importance_native, importance_reference)[0, 1]),
+        f"top{top_n}_overlap": len(set(top_reference) & set(top_native)),
+    }
+    return report
+
+
+def print_report(report: Dict[str, Any]):
+    """벤치마크 결과 콘솔 출력"""
+    print("⏱️ SHAP 백엔드 벤치마크")
+    print(f"   {'백엔드':<16} {'explainer(s)':>13} {'전역(s)':>10} {'개인(ms)':>10} {'가법성 오차(%p)':>16}")
+    for backend in XAIService.SHAP_BACKENDS:
+        r = report[backend]
+        print(f"   {backend:<16} {r['explainer_s']:>13.3f} {r['global_s']:>10.3f} {r['local_ms']:>10.2f} {r['additivity_max_pp']:>16.2e}")
+    print("📏 interventional 대비 native 일치도")
+    for name, value in report["agreement"].items():
+        print(f"   {name}: {value:.4f}" if isinstance(value, float) else f"   {name}: {value}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SHAP 백엔드(interventional/native) 속도·충실도 비교")
+    parser.add_argument("--data", required=True, help="master_df_encoded CSV 경로")
+    parser.add_argument("--samples", type=int, default=XAIService.GLOBAL_SHAP_SAMPLES, help="전역 SHAP 표본 수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(read_master_df_encoded(args.data), n_samples=args.samples)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,62 @@ XAI Service Module
 XGBoost 모델 학습 및 SHAP 분석을 위한 서비스 클래스
 """
 
+import math
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
 import xgboost as xgb
 import shap
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable
+
+from services.ml.artifacts import (
+    artifact_key,
+    dataset_fingerprint,
+    load_artifact_bundle,
+    load_local_shap_store,
+    open_local_shap_writer,
+    save_artifact_bundle,
+    save_local_shap_index,
+)
+from services.ml.master_schema import apply_master_schema
+from services.ml.native_shap import NativeTreeExplainer
+
+
+def _position_index(employee_ids: Iterable[str]) -> Dict[str, int]:
+    """사번 → 행 번호 해시 인덱스 (중복 사번은 첫 행)"""
+    positions = {}
+    for position, employee_id in enumerate(employee_ids):
+        positions.setdefault(employee_id, position)
+    return positions
+
+
+# ==============================================================================
+# 전역 SHAP 병렬 계산 (프로세스 풀 워커)
+# ==============================================================================
+
+_worker_explainer = None
+_worker_feature_cols = None
+
+
+def _init_shap_worker(booster_raw: bytearray, background: np.ndarray, feature_cols: List[str]):
+    """워커 프로세스 초기화: 직렬화된 부스터와 배경 데이터로 explainer를 한 번만 다시 생성"""
+    global _worker_explainer, _worker_feature_cols
+    booster = xgb.Booster()
+    booster.load_model(booster_raw)
+    _worker_feature_cols = feature_cols
+    _worker_explainer = shap.TreeExplainer(
+        booster,
+        data=pd.DataFrame(background, columns=feature_cols),
+        feature_perturbation="interventional",
+        model_output="probability",
+    )
+
+
+def _explain_chunk(chunk: np.ndarray) -> tuple:
+    """워커에서 청크 하나의 SHAP 값 계산 → (values, base_values)"""
+    shap_values = _worker_explainer(pd.DataFrame(chunk, columns=_worker_feature_cols))
+    return shap_values.values, shap_values.base_values
 
 
 class XAIService:
@@ -15,40 +66,78 @@ class XAIService:
     XAI 대시보드용 ML 서비스 클래스
 
     - XGBoost 분류기 학습
-    - SHAP TreeExplainer 생성
+    - SHAP explainer 생성 (interventional TreeExplainer 또는 XGBoost 내장 pred_contribs)
     - Global/Local SHAP 값 계산
+    - 아티팩트 번들 저장/로드 (데이터·하이퍼파라미터가 같으면 재학습하지 않음)
+    - 사번 → 행 번호 인덱스 (피처 행렬, 위험도 테이블, 직원 정보 테이블)
     """
 
-    def __init__(self, master_df_encoded: pd.DataFrame):
+    # XGBoost 하이퍼파라미터
+    MODEL_PARAMS = {
+        "n_estimators": 70,
+        "max_depth": 2,
+        "learning_rate": 0.1,
+        "scale_pos_weight": 70,
+        "random_state": 42,
+        "min_child_weight": 10,
+        "use_label_encoder": False,
+        "eval_metric": "logloss",
+    }
+    BACKGROUND_SIZE = 100
+    GLOBAL_SHAP_SAMPLES = 2000
+    GLOBAL_SHAP_CHUNK_SIZE = 250
+    LOCAL_SHAP_CHUNK_SIZE = 256
+    SHAP_BACKENDS = ("interventional", "native")
+
+    def __init__(
+        self,
+        master_df_encoded: pd.DataFrame,
+        artifact_dir: Optional[str] = None,
+        shap_backend: str = "interventional",
+        global_shap_samples: int = GLOBAL_SHAP_SAMPLES,
+        shap_workers: int = 1,
+    ):
         """
         XAIService 초기화
 
         Args:
             master_df_encoded: ML용 인코딩된 마스터 데이터프레임
+            artifact_dir: 아티팩트 번들 디렉터리 (None이면 사용 안 함, 유효한 번들이 있으면 로드)
+            shap_backend: 'interventional' (shap.TreeExplainer, 배경 데이터 기준) 또는
+                'native' (XGBoost pred_contribs, 확률 공간으로 변환)
+            global_shap_samples: 전역 SHAP 표본 수 (학습 행렬에서 추출, 0이면 전 직원 - master_df_encoded 행)
+            shap_workers: 전역 SHAP 계산 프로세스 수 (1이면 현재 프로세스에서 한 번에 계산)
         """
-        self.master_df_encoded = master_df_encoded.copy()
+        if shap_backend not in self.SHAP_BACKENDS:
+            raise ValueError(f"지원하지 않는 SHAP 백엔드입니다: {shap_backend} (사용 가능: {', '.join(self.SHAP_BACKENDS)})")
+        self.shap_backend = shap_backend
+        self.global_shap_samples = global_shap_samples
+        self.shap_workers = max(1, shap_workers)
+
+        self.master_df_encoded = apply_master_schema(master_df_encoded)
         self._preprocess_data()
 
         # 캐시용 변수
+        self._X_train = None
+        self._y_train = None
         self._model = None
+        self._background_data = None
         self._explainer = None
         self._shap_values_global = None
         self._top_features = None
         self._employee_risk_df = None
+        self._local_shap_store = None
+        self._features = None
+        self._risk_positions = None
+        self._info_df = None
+        self._info_positions = None
 
-    def _preprocess_data(self):
-        """데이터 전처리: 타입 변환 및 결측치 처리"""
-        # 데이터 타입 정리
-        for col in self.master_df_encoded.columns:
-            if self.master_df_encoded[col].dtype == "object" and col not in [
-                "사번",
-                "재직여부",
-                "퇴사자여부",
-            ]:
-                self.master_df_encoded[col] = pd.to_numeric(
-                    self.master_df_encoded[col], errors="coerce"
-                )
+        self.artifact_dir = artifact_dir
+        self._artifact_key = None
+        self.artifacts_loaded = bool(artifact_dir) and self.load_artifacts()
 
+    def _preprocess_data(self):
+        """데이터 전처리: 결측치 처리 (타입은 마스터 스키마로 이미 정리됨)"""
         # 결측치 처리
         self.master_df_encoded.fillna(
             self.master_df_encoded.median(numeric_only=True), inplace=True
@@ -60,37 +149,66 @@ class XAIService:
             col for col in self.master_df_encoded.columns if col not in self.drop_cols
         ]
 
+        # 사번 → master_df_encoded(피처 행렬) 행 번호
+        self._employee_positions = _position_index(self.master_df_encoded["사번"])
+
+    def _feature_matrix(self) -> np.ndarray:
+        """전 직원 피처 행렬 (master_df_encoded 행 순서, float32, 최초 호출 시 한 번만 생성)"""
+        if self._features is None:
+            self._features = self.master_df_encoded[self.feature_cols].to_numpy(dtype=np.float32)
+        return self._features
+
     def _create_balanced_dataset(self) -> tuple:
         """
-        학습용 균형 데이터셋 생성 (1:6 비율)
+        학습용 균형 데이터셋 생성 (1:6 비율, 최초 호출 시 한 번만 생성)
+
+        학습 행렬은 연속된 float32 배열로 한 번만 만들고, 배경 데이터와 전역 SHAP 표본은
+        이 행렬의 행 번호로 뽑는다 (학습/explainer/전역 SHAP 단계마다 다시 만들지 않음).
 
         Returns:
-            tuple: (X_train, y_train)
+            tuple: (X_train, y_train) - float32 배열 (행 수 x 피처 수), (행 수,)
         """
-        df_leavers = self.master_df_encoded[self.master_df_encoded["퇴사자여부"] == 1]
-        df_active = self.master_df_encoded[
-            (self.master_df_encoded["퇴사자여부"] == 0) & 
-            (self.master_df_encoded["재직일수"] >= 182)
-        ]
+        if self._X_train is not None:
+            return self._X_train, self._y_train
 
-        n_leavers = len(df_leavers)
+        labels = self.master_df_encoded["퇴사자여부"].to_numpy()
+        tenure_days = self.master_df_encoded["재직일수"].to_numpy()
+        positions = pd.Series(np.arange(len(self.master_df_encoded)))
+        leaver_positions = positions[labels == 1]
+        active_positions = positions[(labels == 0) & (tenure_days >= 182)]
+
+        n_leavers = len(leaver_positions)
         n_required_active = n_leavers * 6
 
-        # 재직자 오버샘플링
-        df_active_oversampled = df_active.sample(
+        # 재직자 오버샘플링 (행 대신 행 번호를 뽑아 마지막에 한 번만 행렬로 모음)
+        active_oversampled = active_positions.sample(
             n=n_required_active, replace=True, random_state=42
         )
 
-        balanced_df = (
-            pd.concat([df_leavers, df_active_oversampled], axis=0)
+        balanced_positions = (
+            pd.concat([leaver_positions, active_oversampled], axis=0)
             .sample(frac=1, random_state=42)
-            .reset_index(drop=True)
+            .to_numpy()
         )
 
-        X_train = balanced_df[self.feature_cols].astype(float)
-        y_train = balanced_df["퇴사자여부"].astype(float)
+        self._X_train = np.ascontiguousarray(self._feature_matrix()[balanced_positions])
+        self._y_train = labels[balanced_positions].astype(np.float32)
 
-        return X_train, y_train
+        return self._X_train, self._y_train
+
+    def _training_frame(self, rows: np.ndarray = None) -> pd.DataFrame:
+        """
+        학습 행렬(또는 일부 행)을 피처 이름이 붙은 데이터프레임으로 감싸기
+
+        Args:
+            rows: 학습 행렬 행 번호 (None이면 전체, 복사 없이 감쌈)
+
+        Returns:
+            pd.DataFrame: 피처 컬럼 데이터프레임
+        """
+        X_train, _ = self._create_balanced_dataset()
+        values = X_train if rows is None else X_train[rows]
+        return pd.DataFrame(values, columns=self.feature_cols, copy=False)
 
     def train_model(self) -> xgb.XGBClassifier:
         """
@@ -102,33 +220,22 @@ class XAIService:
         if self._model is not None:
             return self._model
 
-        X_train, y_train = self._create_balanced_dataset()
-
-        weight_ratio = 70
+        _, y_train = self._create_balanced_dataset()
 
-        self._model = xgb.XGBClassifier(
-            n_estimators=weight_ratio,
-            max_depth=2,
-            learning_rate=0.1,
-            scale_pos_weight=weight_ratio,
-            random_state=42,
-            min_child_weight=10,
-            use_label_encoder=False,
-            eval_metric="logloss",
-        )
-        self._model.fit(X_train, y_train)
+        self._model = xgb.XGBClassifier(**self.MODEL_PARAMS)
+        self._model.fit(self._training_frame(), y_train)
 
         return self._model
 
     def create_explainer(self, model: xgb.XGBClassifier = None) -> shap.TreeExplainer:
         """
-        SHAP TreeExplainer 생성
+        SHAP explainer 생성 (shap_backend에 따라 TreeExplainer 또는 NativeTreeExplainer)
 
         Args:
             model: XGBoost 모델 (None이면 내부 모델 사용)
 
         Returns:
-            shap.TreeExplainer: SHAP explainer
+            shap.TreeExplainer: SHAP explainer (두 백엔드 모두 explainer(X) → shap.Explanation)
         """
         if self._explainer is not None:
             return self._explainer
@@ -136,12 +243,18 @@ class XAIService:
         if model is None:
             model = self.train_model()
 
-        X_train, _ = self._create_balanced_dataset()
-        background_data = shap.sample(X_train, 100)
+        if self.shap_backend == "native":
+            self._explainer = NativeTreeExplainer(model, self.feature_cols, model_output="probability")
+            return self._explainer
+
+        if self._background_data is None:
+            X_train, _ = self._create_balanced_dataset()
+            background_rows = shap.sample(np.arange(len(X_train)), self.BACKGROUND_SIZE)
+            self._background_data = self._training_frame(background_rows)
 
         self._explainer = shap.TreeExplainer(
             model,
-            data=background_data,
+            data=self._background_data,
             feature_perturbation="interventional",
             model_output="probability",
         )
@@ -152,15 +265,19 @@ class XAIService:
         self,
         model: xgb.XGBClassifier = None,
         explainer: shap.TreeExplainer = None,
-        n_samples: int = 2000,
+        n_samples: Optional[int] = None,
     ) -> shap.Explanation:
         """
         전역 SHAP 값 계산
 
+        shap_workers > 1이면(interventional 백엔드) 표본을 청크로 나누어 프로세스 풀에서
+        계산한 뒤 하나의 Explanation으로 합친다. 워커는 직렬화된 부스터와 배경 데이터로
+        explainer를 다시 만들며, 결과는 한 번에 계산한 것과 같다.
+
         Args:
             model: XGBoost 모델
             explainer: SHAP explainer
-            n_samples: 샘플 수 (기본 2000)
+            n_samples: 샘플 수 (None이면 global_shap_samples, 0이면 전 직원)
 
         Returns:
             shap.Explanation: SHAP 값 (퍼센트 단위)
@@ -173,10 +290,29 @@ class XAIService:
         if explainer is None:
             explainer = self.create_explainer(model)
 
-        X_train, _ = self._create_balanced_dataset()
-        X_sample = X_train.sample(n=min(n_samples, len(X_train)), random_state=42)
-
-        shap_values = explainer(X_sample)
+        n_samples = self.global_shap_samples if n_samples is None else n_samples
+        if n_samples:
+            X_train, _ = self._create_balanced_dataset()
+            sample_rows = (
+                pd.Series(np.arange(len(X_train)))
+                .sample(n=min(n_samples, len(X_train)), random_state=42)
+                .to_numpy()
+            )
+            X_sample = self._training_frame(sample_rows)
+        else:
+            # 전체 표본: 오버샘플링으로 복제된 학습 행 대신 직원당 한 행(master_df_encoded)을 설명
+            # (복제 행이 mean |SHAP| 변수 중요도를 재직자 쪽으로 치우치게 하지 않도록)
+            X_sample = pd.DataFrame(self._feature_matrix(), columns=self.feature_cols, copy=False)
+
+        if (
+            self.shap_workers > 1
+            and self.shap_backend == "interventional"
+            and self._background_data is not None
+            and len(X_sample) > self.GLOBAL_SHAP_CHUNK_SIZE
+        ):
+            shap_values = self._explain_in_processes(model, X_sample)
+        else:
+            shap_values = explainer(X_sample)
 
         # 확률 -> 퍼센트 변환
         shap_values.values = shap_values.values * 100
@@ -186,6 +322,34 @@ class XAIService:
 
         return shap_values
 
+    def _explain_in_processes(self, model: xgb.XGBClassifier, X_sample: pd.DataFrame) -> shap.Explanation:
+        """
+        표본을 청크로 나누어 프로세스 풀에서 SHAP 계산 후 하나의 Explanation으로 합치기
+
+        Args:
+            model: XGBoost 모델 (부스터를 직렬화해 워커에 전달)
+            X_sample: 전역 SHAP 표본
+
+        Returns:
+            shap.Explanation: SHAP 값 (확률 단위, explainer(X_sample)과 같은 형태)
+        """
+        data = X_sample.to_numpy()
+        n_chunks = max(self.shap_workers, math.ceil(len(data) / self.GLOBAL_SHAP_CHUNK_SIZE))
+        chunks = np.array_split(data, n_chunks)
+        initargs = (model.get_booster().save_raw("ubj"), self._background_data.to_numpy(), self.feature_cols)
+
+        with ProcessPoolExecutor(
+            max_workers=self.shap_workers, initializer=_init_shap_worker, initargs=initargs
+        ) as executor:
+            results = list(executor.map(_explain_chunk, chunks))
+
+        return shap.Explanation(
+            values=np.concatenate([values for values, _ in results]),
+            base_values=np.concatenate([base_values for _, base_values in results]),
+            data=data,
+            feature_names=self.feature_cols,
+        )
+
     def compute_local_shap_values(
         self,
         employee_id: str,
@@ -195,6 +359,9 @@ class XAIService:
         """
         개별 직원 SHAP 값 계산
 
+        precompute_local_shap_values로 미리 계산한 재직자는 저장된 행을 바로 읽고,
+        없는 직원(또는 model/explainer를 직접 넘긴 경우)만 explainer로 계산한다.
+
         Args:
             employee_id: 직원 사번
             model: XGBoost 모델
@@ -203,19 +370,28 @@ class XAIService:
         Returns:
             shap.Explanation: SHAP 값 (퍼센트 단위) 또는 None
         """
+        if self._local_shap_store is not None and model is None and explainer is None:
+            cached = self._local_shap_store.get(employee_id)
+            if cached is not None:
+                values, data, base_value = cached
+                return shap.Explanation(
+                    values=np.array(values, dtype=float)[np.newaxis, :],
+                    base_values=np.array([base_value]),
+                    data=np.array(data, dtype=float)[np.newaxis, :],
+                    feature_names=self.feature_cols,
+                )
+
         if model is None:
             model = self.train_model()
         if explainer is None:
             explainer = self.create_explainer(model)
 
-        employee_data = self.master_df_encoded[
-            self.master_df_encoded["사번"] == employee_id
-        ]
+        position = self._employee_positions.get(employee_id)
 
-        if employee_data.empty:
+        if position is None:
             return None
 
-        X_employee = employee_data[self.feature_cols].astype(float).values
+        X_employee = self._feature_matrix()[position:position + 1].astype(float)
 
         shap_values = explainer(X_employee)
 
@@ -287,6 +463,156 @@ class XAIService:
 
         return self._top_features
 
+    def _get_artifact_key(self) -> str:
+        """아티팩트 번들 키 (전처리된 master_df_encoded 해시 + 하이퍼파라미터)"""
+        if self._artifact_key is None:
+            params = {
+                "model": self.MODEL_PARAMS,
+                "background_size": self.BACKGROUND_SIZE,
+                "global_shap_samples": self.global_shap_samples,
+                "shap_backend": self.shap_backend,
+            }
+            self._artifact_key = artifact_key(dataset_fingerprint(self.master_df_encoded), params)
+        return self._artifact_key
+
+    def load_artifacts(self) -> bool:
+        """
+        아티팩트 번들 로드 (모델, 배경 데이터, 전역 SHAP, Top 피처, 위험도 테이블)
+
+        Returns:
+            bool: 유효한 번들을 로드했으면 True (없거나 데이터/파라미터가 바뀌었으면 False)
+        """
+        bundle = load_artifact_bundle(self.artifact_dir, self._get_artifact_key())
+        if bundle is None:
+            return False
+
+        self._model = bundle["model"]
+        if len(bundle["background"]) > 0:
+            self._background_data = pd.DataFrame(bundle["background"], columns=self.feature_cols, copy=False)
+        self._shap_values_global = bundle["shap_values"]
+        self._top_features = bundle["top_features"]
+        if len(bundle["risk_rows"]) > 0:
+            risk_df = self.master_df_encoded.iloc[bundle["risk_rows"]].copy()
+            risk_df["PREDICTED_RISK"] = bundle["risk_scores"]
+            self._employee_risk_df = risk_df
+        self._local_shap_store = load_local_shap_store(self.artifact_dir, self._get_artifact_key())
+        return True
+
+    def save_artifacts(self) -> bool:
+        """
+        아티팩트 번들 저장 (아직 계산하지 않은 단계는 계산한 뒤 저장)
+
+        Returns:
+            bool: 저장했으면 True (번들 디렉터리가 없거나 이미 최신 번들을 로드했으면 False)
+        """
+        if not self.artifact_dir or self.artifacts_loaded:
+            return False
+
+        model = self.train_model()
+        explainer = self.create_explainer(model)
+        shap_values = self.compute_global_shap_values(model, explainer)
+        top_features = self.get_top_features(shap_values)
+        risk_df = self.get_active_employees_with_risk(model)
+        risk_rows = self.master_df_encoded.index.get_indexer(risk_df.index)
+        risk_scores = risk_df["PREDICTED_RISK"].to_numpy() if not risk_df.empty else np.empty(0)
+        # native 백엔드는 배경 데이터를 쓰지 않음
+        background = (
+            self._background_data.to_numpy()
+            if self._background_data is not None
+            else np.empty((0, len(self.feature_cols)), dtype=np.float32)
+        )
+
+        save_artifact_bundle(
+            self.artifact_dir,
+            self._get_artifact_key(),
+            model,
+            background,
+            shap_values,
+            top_features,
+            risk_rows,
+            risk_scores,
+        )
+        self.artifacts_loaded = True
+        return True
+
+    def has_local_shap_store(self) -> bool:
+        """미리 계산한 개인별 SHAP 값을 사용할 수 있는지 여부"""
+        return self._local_shap_store is not None
+
+    def precompute_local_shap_values(self, chunk_size: int = LOCAL_SHAP_CHUNK_SIZE) -> int:
+        """
+        위험도 테이블의 재직자 전원에 대해 개인별 SHAP 값을 미리 계산해 번들에 저장
+
+        explainer를 청크 단위로 호출해 결과를 메모리 매핑 float32 행렬에 바로 쓰므로
+        재직자 수만큼의 SHAP 행렬을 메모리에 모아 두지 않는다.
+
+        Args:
+            chunk_size: explainer 한 번에 넘길 행 수
+
+        Returns:
+            int: 계산한 직원 수
+        """
+        if not self.artifact_dir:
+            raise ValueError("개인별 SHAP 값을 저장하려면 artifact_dir가 필요합니다.")
+
+        model = self.train_model()
+        explainer = self.create_explainer(model)
+        risk_df = self.get_active_employees_with_risk(model)
+        if risk_df.empty:
+            return 0
+
+        X_active = risk_df[self.feature_cols].to_numpy(dtype=np.float32)
+        values, data = open_local_shap_writer(self.artifact_dir, len(X_active), len(self.feature_cols))
+        base_values = np.empty(len(X_active))
+        for start in range(0, len(X_active), chunk_size):
+            chunk = X_active[start:start + chunk_size]
+            shap_values = explainer(chunk.astype(float))
+            values[start:start + len(chunk)] = shap_values.values * 100
+            data[start:start + len(chunk)] = chunk
+            base_values[start:start + len(chunk)] = shap_values.base_values * 100
+        values.flush()
+        data.flush()
+        del values, data
+
+        key = self._get_artifact_key()
+        save_local_shap_index(self.artifact_dir, key, risk_df["사번"].tolist(), base_values)
+        self._local_shap_store = load_local_shap_store(self.artifact_dir, key)
+        return len(X_active)
+
+    def get_employee_risk(self, employee_id: str) -> Optional[float]:
+        """
+        재직자 퇴사 위험도 조회 (사번 인덱스로 위험도 테이블 행을 바로 찾음)
+
+        Args:
+            employee_id: 직원 사번
+
+        Returns:
+            Optional[float]: 예측 확률 (위험도 테이블에 없으면 None)
+        """
+        risk_df = self.get_active_employees_with_risk()
+        if risk_df.empty:
+            return None
+        if self._risk_positions is None:
+            self._risk_positions = _position_index(risk_df["사번"])
+        position = self._risk_positions.get(employee_id)
+        return None if position is None else float(risk_df["PREDICTED_RISK"].iat[position])
+
+    def get_employee_info_position(self, employee_id: str, employee_info_df: pd.DataFrame) -> Optional[int]:
+        """
+        직원 정보 테이블에서 사번의 행 번호 조회 (테이블이 바뀌면 인덱스를 다시 만듦)
+
+        Args:
+            employee_id: 직원 사번
+            employee_info_df: 직원 정보 데이터프레임
+
+        Returns:
+            Optional[int]: 행 번호 (없으면 None)
+        """
+        if self._info_df is not employee_info_df:
+            self._info_df = employee_info_df
+            self._info_positions = _position_index(employee_info_df["사번"])
+        return self._info_positions.get(employee_id)
+
     def get_employee_info_for_display(
         self, employee_id: str, employee_info_df: pd.DataFrame
     ) -> Dict[str, Any]:
@@ -300,12 +626,12 @@ class XAIService:
         Returns:
             Dict: 직원 정보 딕셔너리
         """
-        employee_info = employee_info_df[employee_info_df["사번"] == employee_id]
+        position = self.get_employee_info_position(employee_id, employee_info_df)
 
-        if employee_info.empty:
+        if position is None:
             return {}
 
-        row = employee_info.iloc[0]
+        row = employee_info_df.iloc[position]
 
         return {
             "사번": employee_id,
@@ -319,14 +645,30 @@ class XAIService:
         }
 
 
-def get_xai_service(master_df_encoded: pd.DataFrame) -> XAIService:
+def get_xai_service(
+    master_df_encoded: pd.DataFrame,
+    artifact_dir: Optional[str] = None,
+    shap_backend: str = "interventional",
+    global_shap_samples: int = XAIService.GLOBAL_SHAP_SAMPLES,
+    shap_workers: int = 1,
+) -> XAIService:
     """
     XAIService 인스턴스 생성 팩토리 함수
 
     Args:
         master_df_encoded: ML용 인코딩된 마스터 데이터프레임
+        artifact_dir: 아티팩트 번들 디렉터리 (None이면 사용 안 함)
+        shap_backend: SHAP 계산 백엔드 ('interventional' 또는 'native')
+        global_shap_samples: 전역 SHAP 표본 수 (학습 행렬에서 추출, 0이면 전 직원 - master_df_encoded 행)
+        shap_workers: 전역 SHAP 계산 프로세스 수
 
     Returns:
         XAIService: 서비스 인스턴스
     """
-    return XAIService(master_df_encoded)
+    return XAIService(
+        master_df_encoded,
+        artifact_dir=artifact_dir,
+        shap_backend=shap_backend,
+        global_shap_samples=global_shap_samples,
+        shap_workers=shap_workers,
+    )
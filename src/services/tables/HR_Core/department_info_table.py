@@ -9,145 +9,236 @@ import numpy as np
 import datetime
 from datetime import date, timedelta
 import random
-
-# --- 1. 사전 준비 ---
-from services.tables.HR_Core.basic_info_table import emp_df
-from services.tables.HR_Core.department_table import department_df, parent_map_dept, dept_level_map, dept_name_map, division_order
-from services.helpers.utils import find_parents, find_next_quarter_start, calculate_age
-
-random.seed(42)
-np.random.seed(42)
-today = datetime.datetime.now().date()
-today_ts = pd.to_datetime(today)
-
-# --- 2. 1단계: 모든 직원의 기본 부서 배치 이력 생성 ---
-base_assignment_records = []
-assignable_departments_df = department_df[
-    (department_df['DEP_USE_YN'] == 'Y') &
-    (department_df['DEP_LEVEL'] >= 3) # 팀/오피스 레벨에만 배정
-].copy()
-
-# --- 수정된 부분: Division의 모든 하위 부서를 찾는 범용 함수 ---
-def get_all_descendants(dep_id, parent_map_df):
-    children = parent_map_df[parent_map_df['UP_DEP_ID'] == dep_id]['DEP_ID'].tolist()
-    all_descendants = list(children)
-    for child_id in children:
-        all_descendants.extend(get_all_descendants(child_id, parent_map_df))
-    return all_descendants
-
-parent_map_df_for_func = department_df[['DEP_ID', 'UP_DEP_ID']]
-# --- 수정 완료 ---
-
-if not assignable_departments_df.empty:
-    for _, emp_row in emp_df.iterrows():
-        emp_id, in_date, out_date = emp_row['EMP_ID'], emp_row['IN_DATE'].date(), emp_row['OUT_DATE'].date() if pd.notna(emp_row['OUT_DATE']) else None
-
-        current_start_date = in_date
-        num_assignments = random.randint(1, 5)
-        last_dept_id = None
-
-        for i in range(num_assignments):
-            if (out_date and current_start_date > out_date) or (current_start_date > today): break
-
-            candidate_depts = assignable_departments_df
-
-            # --- 수정된 부분: 첫 부서 배정 로직 수정 ---
-            if i == 0: # 첫 부서 배정 시
-                # 4개 Division 중 하나를 무작위로 선택
-                chosen_division_name = random.choice(division_order)
-                division_id = department_df[department_df['DEP_NAME'] == chosen_division_name]['DEP_ID'].iloc[0]
-
-                # 해당 Division의 모든 하위 부서(팀/오피스)를 후보로 설정
-                descendant_ids = get_all_descendants(division_id, parent_map_df_for_func)
-                if descendant_ids:
-                    candidate_depts = department_df[department_df['DEP_ID'].isin(descendant_ids)]
-            # --- 수정 완료 ---
-            elif last_dept_id and random.random() < 0.70: # 두 번째 이후 배정 시 70% 확률 적용
-                last_dept_info = find_parents(last_dept_id, dept_level_map, parent_map_dept, dept_name_map)
-                if last_dept_info['DIVISION_NAME']:
-                    division_id_series = department_df.loc[department_df['DEP_NAME'] == last_dept_info['DIVISION_NAME'], 'DEP_ID']
-                    if not division_id_series.empty:
-                        division_id = division_id_series.iloc[0]
-                        all_member_ids = get_all_descendants(division_id, parent_map_df_for_func)
-                        if all_member_ids:
-                            div_members_df = department_df[department_df['DEP_ID'].isin(all_member_ids)]
-                            if not div_members_df.empty:
-                                candidate_depts = div_members_df
-
-            dept_row = candidate_depts.sample(n=1).iloc[0]
-
-            end_date = out_date if i == num_assignments - 1 else find_next_quarter_start(current_start_date + timedelta(days=random.randint(365, 2 * 365))) - timedelta(days=1)
-            if out_date and end_date > out_date: end_date = out_date
-            if end_date and end_date > today: end_date = today
-
-            base_assignment_records.append({'EMP_ID': emp_id, 'DEP_ID': dept_row['DEP_ID'], 'DEP_APP_START_DATE': current_start_date, 'DEP_APP_END_DATE': end_date})
-
-            last_dept_id = dept_row['DEP_ID']
-            if end_date is None or end_date >= (out_date or today): break
-            current_start_date = end_date + timedelta(days=1)
-
-base_assignments_df = pd.DataFrame(base_assignment_records)
-# (이하 코드는 이전과 동일합니다)
-base_assignments_df['DEP_APP_START_DATE'] = pd.to_datetime(base_assignments_df['DEP_APP_START_DATE'])
-base_assignments_df['DEP_APP_END_DATE'] = pd.to_datetime(base_assignments_df['DEP_APP_END_DATE'])
-
-# --- 3. 2단계: 부서장 선출 및 기록 단편화 ---
-fragmented_records = []
-emp_ages = emp_df.set_index('EMP_ID')['PERSONAL_ID'].apply(lambda pid: calculate_age(pid)).to_dict()
-all_event_dates = sorted(pd.to_datetime(pd.concat([base_assignments_df['DEP_APP_START_DATE'], base_assignments_df['DEP_APP_END_DATE'].dropna()]).unique()))
-
-for i in range(len(all_event_dates)):
-    period_start = all_event_dates[i]
-    period_end = all_event_dates[i+1] - timedelta(days=1) if i + 1 < len(all_event_dates) else today_ts
-    if period_start > period_end: continue
-    active_assignments = base_assignments_df[(base_assignments_df['DEP_APP_START_DATE'] <= period_start) & (base_assignments_df['DEP_APP_END_DATE'].isnull() | (base_assignments_df['DEP_APP_END_DATE'] >= period_end))]
-    for dep_id in active_assignments['DEP_ID'].unique():
-        members_in_dept = active_assignments[active_assignments['DEP_ID'] == dep_id]
-        member_ids = members_in_dept['EMP_ID'].tolist()
-        if not member_ids: continue
-        member_ages_df = pd.DataFrame([{'EMP_ID': mid, 'AGE': emp_ages.get(mid, 25)} for mid in member_ids])
-        head_id = member_ages_df.sort_values(by=['AGE', 'EMP_ID'], ascending=[False, True])['EMP_ID'].iloc[0]
-        for emp_id in member_ids:
-            fragmented_records.append({'EMP_ID': emp_id, 'DEP_ID': dep_id, 'TITLE_INFO': 'Head' if emp_id == head_id else 'Member', 'PERIOD_START': period_start, 'PERIOD_END': period_end})
-
-# --- 4. 3단계: 연속된 기록 병합 ---
-fragmented_df = pd.DataFrame(fragmented_records)
-if not fragmented_df.empty:
-    fragmented_df = fragmented_df.sort_values(['EMP_ID', 'DEP_ID', 'TITLE_INFO', 'PERIOD_START'])
-    group_ids = (fragmented_df[['EMP_ID', 'DEP_ID', 'TITLE_INFO']] != fragmented_df[['EMP_ID', 'DEP_ID', 'TITLE_INFO']].shift()).any(axis=1).cumsum()
-    department_info_df = fragmented_df.groupby(group_ids).agg(
-        EMP_ID=('EMP_ID', 'first'), DEP_ID=('DEP_ID', 'first'), TITLE_INFO=('TITLE_INFO', 'first'),
-        DEP_APP_START_DATE=('PERIOD_START', 'min'), DEP_APP_END_DATE=('PERIOD_END', 'max')
-    ).reset_index(drop=True)
-else:
-    department_info_df = pd.DataFrame()
-
-# --- 5. 최종 데이터 정리 ---
-if not department_info_df.empty:
-    department_info_df = pd.merge(department_info_df, department_df[['DEP_ID', 'DEPT_TYPE', 'DEP_REL_START_DATE']], on='DEP_ID', how='left')
-    department_info_df['MAIN_DEP'] = 'Y'
-    department_info_df['DEP_DURATION'] = (department_info_df['DEP_APP_END_DATE'] - department_info_df['DEP_APP_START_DATE']).dt.days
-    final_cols = ['EMP_ID', 'DEP_ID', 'DEPT_TYPE', 'DEP_REL_START_DATE', 'DEP_APP_START_DATE', 'DEP_APP_END_DATE', 'MAIN_DEP', 'TITLE_INFO', 'DEP_DURATION']
-    department_info_df = department_info_df.reindex(columns=final_cols)
-    emp_last_record_idx = department_info_df.groupby('EMP_ID')['DEP_APP_START_DATE'].idxmax()
-    current_emp_ids = emp_df[emp_df['CURRENT_EMP_YN'] == 'Y']['EMP_ID']
-    idx_to_update = emp_last_record_idx[emp_last_record_idx.index.isin(current_emp_ids)]
-    department_info_df.loc[idx_to_update, 'DEP_APP_END_DATE'] = None
-    department_info_df = department_info_df.sort_values(by=['EMP_ID', 'DEP_APP_START_DATE']).reset_index(drop=True)
-
-# --- 6. Google Sheets용 복사본 생성 ---
-department_info_df_for_gsheet = department_info_df.copy()
-if not department_info_df_for_gsheet.empty:
-    date_cols = ['DEP_REL_START_DATE', 'DEP_APP_START_DATE', 'DEP_APP_END_DATE']
-    for col in date_cols:
-        department_info_df_for_gsheet[col] = department_info_df_for_gsheet[col].dt.strftime('%Y-%m-%d')
-    for col in department_info_df_for_gsheet.columns:
-        department_info_df_for_gsheet[col] = department_info_df_for_gsheet[col].astype(str)
-    department_info_df_for_gsheet = department_info_df_for_gsheet.replace({'None':'', 'NaT':'', 'nan':''})
-
-
-# In[ ]:
-
-
-
-
+import heapq
+from collections import defaultdict
+
+from services.tables.HR_Core.department_table import division_order
+from services.helpers.utils import find_next_quarter_start, parse_birth_dates, calculate_age_vectorized
+from services.tables.common import EMPLOYEE_SEED
+from services.tables.registry import register_table, module_getattr
+
+
+def elect_department_heads(base_assignments_df, emp_ages, today_ts):
+    """
+    부서 배치 이력에서 부서장(Head)/구성원(Member) 기록 생성 (sweep-line)
+
+    모든 배치 시작/종료일을 이벤트로 보고 [이벤트일, 다음 이벤트일 - 1] 구간마다 각 부서의
+    최연장자(동률이면 EMP_ID 오름차순)를 부서장으로 선출한다. 구간을 순서대로 훑으면서
+    부서별 활성 구성원을 힙으로 유지하고, 구성원이 바뀐 부서만 부서장을 다시 계산한다.
+    같은 (EMP_ID, DEP_ID, TITLE_INFO) 기록은 하나로 병합되므로 최초 시작/최종 종료 구간만 남긴다.
+
+    Args:
+        base_assignments_df: 기본 부서 배치 이력 (EMP_ID, DEP_ID, DEP_APP_START_DATE, DEP_APP_END_DATE)
+        emp_ages: {EMP_ID: 나이}
+        today_ts: 마지막 구간 종료일
+
+    Returns:
+        pd.DataFrame: EMP_ID, DEP_ID, TITLE_INFO, DEP_APP_START_DATE, DEP_APP_END_DATE
+    """
+    record_cols = ['EMP_ID', 'DEP_ID', 'TITLE_INFO', 'DEP_APP_START_DATE', 'DEP_APP_END_DATE']
+    starts = base_assignments_df['DEP_APP_START_DATE']
+    ends = base_assignments_df['DEP_APP_END_DATE']
+    period_starts = pd.DatetimeIndex(sorted(pd.concat([starts, ends.dropna()]).unique()))
+    period_ends = period_starts[1:].append(pd.DatetimeIndex([today_ts])) - pd.to_timedelta([1] * (len(period_starts) - 1) + [0], unit='D')
+    # 마지막 구간만 시작일 > 종료일(today)이 될 수 있으며, 이 구간은 제외
+    n_periods = len(period_starts) if len(period_starts) and period_starts[-1] <= today_ts else len(period_starts) - 1
+    if n_periods <= 0:
+        return pd.DataFrame(columns=record_cols)
+
+    # 배치별 활성 구간 인덱스: 시작 구간 ~ 구간 종료일이 배치 종료일 이하인 마지막 구간
+    first_period = period_starts.searchsorted(starts)
+    last_period = period_ends[:n_periods].searchsorted(ends, side='right') - 1
+    last_period = np.where(ends.isna(), n_periods - 1, last_period)
+
+    emp_ids = base_assignments_df['EMP_ID'].tolist()
+    dep_ids = base_assignments_df['DEP_ID'].tolist()
+    ages = [emp_ages.get(emp_id, 25) for emp_id in emp_ids]
+    # 나이 내림차순(결측은 마지막), EMP_ID 오름차순 우선순위
+    priority = [(pd.isna(age), 0 if pd.isna(age) else -age, emp_id) for age, emp_id in zip(ages, emp_ids)]
+
+    adds, removes = defaultdict(list), defaultdict(list)
+    for a in range(len(emp_ids)):
+        if first_period[a] <= last_period[a]:
+            adds[first_period[a]].append(a)
+            removes[last_period[a] + 1].append(a)
+
+    # --- 구간 순회: 구성원이 바뀐 부서만 부서장 재선출 ---
+    active = [False] * len(emp_ids)
+    dept_heaps = defaultdict(list)
+    current_head = {}  # DEP_ID -> (부서장 배치 인덱스, 시작 구간)
+    head_runs = defaultdict(list)  # 배치 인덱스 -> [(시작 구간, 종료 구간)]
+    for i in sorted(set(adds) | set(removes)):
+        touched = set()
+        for a in removes.get(i, []):
+            active[a] = False
+            touched.add(dep_ids[a])
+        for a in adds.get(i, []):
+            active[a] = True
+            heapq.heappush(dept_heaps[dep_ids[a]], (priority[a], a))
+            touched.add(dep_ids[a])
+        for dep_id in touched:
+            heap = dept_heaps[dep_id]
+            while heap and not active[heap[0][1]]:
+                heapq.heappop(heap)
+            new_head = heap[0][1] if heap else None
+            prev = current_head.get(dep_id)
+            if prev is not None and prev[0] == new_head:
+                continue
+            if prev is not None:
+                head_runs[prev[0]].append((prev[1], i - 1))
+            current_head[dep_id] = (new_head, i) if new_head is not None else None
+    for head in current_head.values():
+        if head is not None:
+            head_runs[head[0]].append((head[1], n_periods - 1))
+
+    # --- (EMP_ID, DEP_ID, TITLE_INFO)별 최초/최종 구간 ---
+    spans = {}
+    def add_span(key, first, last):
+        if key in spans:
+            first, last = min(first, spans[key][0]), max(last, spans[key][1])
+        spans[key] = (first, last)
+
+    for a in range(len(emp_ids)):
+        s, k = first_period[a], last_period[a]
+        if s > k: continue
+        runs = sorted(head_runs.get(a, []))
+        for r0, r1 in runs:
+            add_span((emp_ids[a], dep_ids[a], 'Head'), r0, r1)
+        # 부서장이 아닌 첫/마지막 구간
+        member_first = s
+        for r0, r1 in runs:
+            if r0 > member_first: break
+            member_first = max(member_first, r1 + 1)
+        member_last = k
+        for r0, r1 in reversed(runs):
+            if r1 < member_last: break
+            member_last = min(member_last, r0 - 1)
+        if member_first <= k:
+            add_span((emp_ids[a], dep_ids[a], 'Member'), member_first, member_last)
+
+    if not spans:
+        return pd.DataFrame(columns=record_cols)
+    keys = list(spans)
+    first_idx = np.array([spans[key][0] for key in keys])
+    last_idx = np.array([spans[key][1] for key in keys])
+    records_df = pd.DataFrame(keys, columns=['EMP_ID', 'DEP_ID', 'TITLE_INFO'])
+    records_df['DEP_APP_START_DATE'] = period_starts[first_idx]
+    records_df['DEP_APP_END_DATE'] = period_ends[last_idx]
+    return records_df.sort_values(['EMP_ID', 'DEP_ID', 'TITLE_INFO']).reset_index(drop=True)
+
+
+@register_table(
+    inputs=("emp_df", "department_df", "dept_hierarchy"),
+    outputs=("department_info_df", "department_info_df_for_gsheet"),
+)
+def build_department_info_table(
+    emp_df,
+    department_df,
+    dept_hierarchy,
+):
+    """부서 발령정보(department_info) 테이블 생성"""
+    # --- 1. 사전 준비 ---
+    random.seed(EMPLOYEE_SEED)
+    np.random.seed(EMPLOYEE_SEED)
+    today = datetime.datetime.now().date()
+    today_ts = pd.to_datetime(today)
+
+    # --- 2. 1단계: 모든 직원의 기본 부서 배치 이력 생성 ---
+    base_assignment_records = []
+    assignable_departments_df = department_df[
+        (department_df['DEP_USE_YN'] == 'Y') &
+        (department_df['DEP_LEVEL'] >= 3) # 팀/오피스 레벨에만 배정
+    ].copy()
+
+    # Division별 모든 하위 부서(팀/오피스) 후보 (부서 계층 closure에서 한 번만 계산)
+    dept_division_ids = dept_hierarchy.lookup(department_df['DEP_ID'], ['DIVISION_ID'])['DIVISION_ID']
+    division_members = {}
+    for division_id in dept_division_ids.dropna().unique():
+        members_df = department_df[(dept_division_ids == division_id) & (department_df['DEP_ID'] != division_id)]
+        if not members_df.empty:
+            division_members[division_id] = members_df
+
+    if not assignable_departments_df.empty:
+        for _, emp_row in emp_df.iterrows():
+            emp_id, in_date, out_date = emp_row['EMP_ID'], emp_row['IN_DATE'].date(), emp_row['OUT_DATE'].date() if pd.notna(emp_row['OUT_DATE']) else None
+
+            current_start_date = in_date
+            num_assignments = random.randint(1, 5)
+            last_dept_id = None
+
+            for i in range(num_assignments):
+                if (out_date and current_start_date > out_date) or (current_start_date > today): break
+
+                candidate_depts = assignable_departments_df
+
+                # --- 수정된 부분: 첫 부서 배정 로직 수정 ---
+                if i == 0: # 첫 부서 배정 시
+                    # 4개 Division 중 하나를 무작위로 선택
+                    chosen_division_name = random.choice(division_order)
+                    division_id = department_df[department_df['DEP_NAME'] == chosen_division_name]['DEP_ID'].iloc[0]
+
+                    # 해당 Division의 모든 하위 부서(팀/오피스)를 후보로 설정
+                    if division_id in division_members:
+                        candidate_depts = division_members[division_id]
+                # --- 수정 완료 ---
+                elif last_dept_id and random.random() < 0.70: # 두 번째 이후 배정 시 70% 확률 적용
+                    division_id = dept_hierarchy.get(last_dept_id, 'DIVISION_ID')
+                    if division_id in division_members:
+                        candidate_depts = division_members[division_id]
+
+                dept_row = candidate_depts.sample(n=1).iloc[0]
+
+                end_date = out_date if i == num_assignments - 1 else find_next_quarter_start(current_start_date + timedelta(days=random.randint(365, 2 * 365))) - timedelta(days=1)
+                if out_date and end_date > out_date: end_date = out_date
+                if end_date and end_date > today: end_date = today
+
+                base_assignment_records.append({'EMP_ID': emp_id, 'DEP_ID': dept_row['DEP_ID'], 'DEP_APP_START_DATE': current_start_date, 'DEP_APP_END_DATE': end_date})
+
+                last_dept_id = dept_row['DEP_ID']
+                if end_date is None or end_date >= (out_date or today): break
+                current_start_date = end_date + timedelta(days=1)
+
+    base_assignments_df = pd.DataFrame(base_assignment_records)
+    # (이하 코드는 이전과 동일합니다)
+    base_assignments_df['DEP_APP_START_DATE'] = pd.to_datetime(base_assignments_df['DEP_APP_START_DATE'])
+    base_assignments_df['DEP_APP_END_DATE'] = pd.to_datetime(base_assignments_df['DEP_APP_END_DATE'])
+
+    # --- 3. 2단계: 부서장 선출 및 기록 병합 (sweep-line) ---
+    emp_ages = dict(zip(
+        emp_df['EMP_ID'],
+        calculate_age_vectorized(parse_birth_dates(emp_df['PERSONAL_ID']), today_ts, full_years=False).tolist(),
+    ))
+    department_info_df = elect_department_heads(base_assignments_df, emp_ages, today_ts)
+    if department_info_df.empty:
+        department_info_df = pd.DataFrame()
+
+    # --- 4. 최종 데이터 정리 ---
+    if not department_info_df.empty:
+        department_info_df = pd.merge(department_info_df, department_df[['DEP_ID', 'DEPT_TYPE', 'DEP_REL_START_DATE']], on='DEP_ID', how='left')
+        department_info_df['MAIN_DEP'] = 'Y'
+        department_info_df['DEP_DURATION'] = (department_info_df['DEP_APP_END_DATE'] - department_info_df['DEP_APP_START_DATE']).dt.days
+        final_cols = ['EMP_ID', 'DEP_ID', 'DEPT_TYPE', 'DEP_REL_START_DATE', 'DEP_APP_START_DATE', 'DEP_APP_END_DATE', 'MAIN_DEP', 'TITLE_INFO', 'DEP_DURATION']
+        department_info_df = department_info_df.reindex(columns=final_cols)
+        emp_last_record_idx = department_info_df.groupby('EMP_ID')['DEP_APP_START_DATE'].idxmax()
+        current_emp_ids = emp_df[emp_df['CURRENT_EMP_YN'] == 'Y']['EMP_ID']
+        idx_to_update = emp_last_record_idx[emp_last_record_idx.index.isin(current_emp_ids)]
+        department_info_df.loc[idx_to_update, 'DEP_APP_END_DATE'] = None
+        department_info_df = department_info_df.sort_values(by=['EMP_ID', 'DEP_APP_START_DATE']).reset_index(drop=True)
+
+    # --- 5. Google Sheets용 복사본 생성 ---
+    department_info_df_for_gsheet = department_info_df.copy()
+    if not department_info_df_for_gsheet.empty:
+        date_cols = ['DEP_REL_START_DATE', 'DEP_APP_START_DATE', 'DEP_APP_END_DATE']
+        for col in date_cols:
+            department_info_df_for_gsheet[col] = department_info_df_for_gsheet[col].dt.strftime('%Y-%m-%d')
+        for col in department_info_df_for_gsheet.columns:
+            department_info_df_for_gsheet[col] = department_info_df_for_gsheet[col].astype(str)
+        department_info_df_for_gsheet = department_info_df_for_gsheet.replace({'None':'', 'NaT':'', 'nan':''})
+
+    return {
+        "department_info_df": department_info_df,
+        "department_info_df_for_gsheet": department_info_df_for_gsheet,
+    }
+
+
+__getattr__ = module_getattr(__name__)
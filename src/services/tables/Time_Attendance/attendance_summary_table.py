@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+import pandas as pd
+import numpy as np
+import datetime
+import os
+
+from services.tables.common import START_DATE, ATTENDANCE_CHUNK_EMPLOYEES, ATTENDANCE_SPILL_PATH
+from services.tables.Time_Attendance.detailed_working_info_table import generate_seeded_work_info
+from services.tables.Time_Attendance.daily_working_info_table import derive_daily_work_info
+from services.tables.registry import register_table, module_getattr
+
+
+# ==============================================================================
+# 근태 집계 테이블
+# ==============================================================================
+# 마스터/휴가/급여 테이블은 직원-일 단위 근태 행 전체가 아니라 아래 집계만 사용한다.
+#   - attendance_summary_df: 직원별 평균 초과/야간 근무, 최근 1년/2년 평균 초과근무
+#   - half_overtime_df: 직원 x 반기별 평균 초과근무 (병가 확률 산정용)
+#   - monthly_work_summary_df: 직원 x 월별 초과/야간 근무 합계 (시간외근로수당 산정용)
+#   - vacation_days_df: 휴가일 행
+#
+# STREAMLIT_ATTENDANCE_CHUNK_SIZE > 0이면 직원 청크 단위로 상세/일별 근무 행을 생성하고
+# 바로 집계하므로, 전체 근태 테이블을 메모리에 올리지 않는다 (직원 수·기간과 무관하게
+# 피크 메모리가 청크 크기에 비례). 근무 행은 전체 빌드와 같은 시드 블록 단위로 생성하고
+# 청크는 시드 블록 경계에서 나뉘므로, 청크 크기와 무관하게 전체 빌드와 같은 테이블이 나온다.
+
+SUMMARY_OUTPUTS = ("attendance_summary_df", "half_overtime_df", "monthly_work_summary_df", "vacation_days_df")
+
+
+def summarize_attendance(detailed_work_info_df, daily_work_info_df, today_ts):
+    """
+    상세/일별 근무 행을 직원 단위 집계로 변환
+
+    직원 단위로 완결된 집계만 만들기 때문에, 직원 청크별 결과를 이어 붙이면
+    전체 데이터로 계산한 결과와 같다.
+
+    Args:
+        detailed_work_info_df: 상세 근무 행 (전체 또는 직원 청크)
+        daily_work_info_df: 일별 근무 행 (detailed_work_info_df와 같은 직원 집합)
+        today_ts: 최근 1년/2년 집계 기준일
+
+    Returns:
+        dict: SUMMARY_OUTPUTS 이름별 DataFrame
+    """
+    work_df = daily_work_info_df[['EMP_ID', 'DATE', 'OVERTIME_MINUTES', 'NIGHT_WORK_MINUTES']].copy()
+    work_df['DATE'] = pd.to_datetime(work_df['DATE'])
+
+    # --- 1. 직원별 평균 초과/야간 근무 ---
+    attendance_summary_df = work_df.groupby('EMP_ID').agg(
+        AVG_OVERTIME_MINUTES=('OVERTIME_MINUTES', 'mean'),
+        AVG_NIGHT_WORK_MINUTES=('NIGHT_WORK_MINUTES', 'mean')
+    ).reset_index()
+    one_year_ago = today_ts - pd.DateOffset(years=1)
+    two_years_ago = today_ts - pd.DateOffset(years=2)
+    work_1y = work_df[work_df['DATE'] >= one_year_ago]
+    work_2y = work_df[work_df['DATE'] >= two_years_ago]
+    overtime_summary_1y = work_1y.groupby('EMP_ID')['OVERTIME_MINUTES'].mean().reset_index().rename(columns={'OVERTIME_MINUTES': 'OVERTIME_1Y'})
+    overtime_summary_2y = work_2y.groupby('EMP_ID')['OVERTIME_MINUTES'].mean().reset_index().rename(columns={'OVERTIME_MINUTES': 'OVERTIME_2Y'})
+    attendance_summary_df = pd.merge(attendance_summary_df, overtime_summary_1y, on='EMP_ID', how='left')
+    attendance_summary_df = pd.merge(attendance_summary_df, overtime_summary_2y, on='EMP_ID', how='left')
+
+    # --- 2. 반기별 평균 초과근무 ---
+    work_df['YEAR'] = work_df['DATE'].dt.year
+    work_df['HALF'] = (work_df['DATE'].dt.month - 1) // 6 + 1
+    half_overtime_df = work_df.groupby(['EMP_ID', 'YEAR', 'HALF'])['OVERTIME_MINUTES'].mean().reset_index().rename(columns={'OVERTIME_MINUTES': 'AVG_OVERTIME_MINUTES'})
+
+    # --- 3. 월별 초과/야간 근무 합계 ---
+    work_df['PAY_PERIOD_DT'] = work_df['DATE'].dt.to_period('M').dt.to_timestamp()
+    monthly_work_summary_df = work_df.groupby(['EMP_ID', 'PAY_PERIOD_DT']).agg(
+        TOTAL_OVERTIME_MINUTES=('OVERTIME_MINUTES', 'sum'),
+        TOTAL_NIGHT_WORK_MINUTES=('NIGHT_WORK_MINUTES', 'sum')
+    ).reset_index()
+
+    # --- 4. 휴가일 ---
+    vacation_days_df = detailed_work_info_df[detailed_work_info_df['WORK_ETC'] == '휴가'].reset_index(drop=True)
+
+    return {
+        "attendance_summary_df": attendance_summary_df,
+        "half_overtime_df": half_overtime_df,
+        "monthly_work_summary_df": monthly_work_summary_df,
+        "vacation_days_df": vacation_days_df,
+    }
+
+
+def build_attendance_summary_table(detailed_work_info_df, daily_work_info_df):
+    """근태 집계 테이블 생성 (전체 근태 테이블에서 집계)"""
+    today_ts = pd.to_datetime(datetime.datetime.now().date())
+    return summarize_attendance(detailed_work_info_df, daily_work_info_df, today_ts)
+
+
+def build_attendance_summary_streaming(
+    emp_df,
+    dept_hierarchy,
+    department_info_df,
+    work_sys_df,
+    work_type_df,
+    work_info_df,
+    burnout_leaver_ids,
+    low_engagement_leaver_ids,
+):
+    """근태 집계 테이블 생성 (직원 청크 단위 스트리밍)"""
+    # --- 1. 사전 준비 ---
+    today_date_obj = datetime.datetime.now().date()
+    today_ts = pd.to_datetime(today_date_obj)
+    if ATTENDANCE_SPILL_PATH:
+        os.makedirs(ATTENDANCE_SPILL_PATH, exist_ok=True)
+
+    # --- 2. 청크별 생성 → 집계 ---
+    partials = {name: [] for name in SUMMARY_OUTPUTS}
+    for chunk_no, chunk_start in enumerate(range(0, len(emp_df), ATTENDANCE_CHUNK_EMPLOYEES)):
+        emp_chunk = emp_df.iloc[chunk_start:chunk_start + ATTENDANCE_CHUNK_EMPLOYEES]
+        detailed_chunk = generate_seeded_work_info(
+            emp_chunk, dept_hierarchy, department_info_df,
+            work_sys_df, work_type_df, work_info_df, burnout_leaver_ids, low_engagement_leaver_ids,
+            START_DATE, today_date_obj,
+            first_position=chunk_start,
+        )
+        daily_chunk = derive_daily_work_info(detailed_chunk, work_info_df, work_type_df)
+
+        if ATTENDANCE_SPILL_PATH:
+            detailed_chunk.to_parquet(os.path.join(ATTENDANCE_SPILL_PATH, f"detailed_work_info_{chunk_no:05d}.parquet"), index=False)
+            daily_chunk.to_parquet(os.path.join(ATTENDANCE_SPILL_PATH, f"daily_work_info_{chunk_no:05d}.parquet"), index=False)
+
+        for name, partial in summarize_attendance(detailed_chunk, daily_chunk, today_ts).items():
+            partials[name].append(partial)
+        del detailed_chunk, daily_chunk
+
+    # --- 3. 청크 집계 병합 (전체 빌드와 같은 정렬 순서) ---
+    sort_keys = {
+        "attendance_summary_df": ['EMP_ID'],
+        "half_overtime_df": ['EMP_ID', 'YEAR', 'HALF'],
+        "monthly_work_summary_df": ['EMP_ID', 'PAY_PERIOD_DT'],
+        "vacation_days_df": ['DATE', 'EMP_ID'],
+    }
+    return {
+        name: pd.concat(partials[name], ignore_index=True).sort_values(sort_keys[name], kind='stable').reset_index(drop=True)
+        for name in SUMMARY_OUTPUTS
+    }
+
+
+# 스트리밍 모드에서는 전체 상세/일별 근무 테이블에 의존하지 않도록 입력을 바꿔 등록
+if ATTENDANCE_CHUNK_EMPLOYEES > 0:
+    register_table(
+        inputs=(
+            "emp_df",
+            "dept_hierarchy",
+            "department_info_df",
+            "work_sys_df",
+            "work_type_df",
+            "work_info_df",
+            "burnout_leaver_ids",
+            "low_engagement_leaver_ids",
+        ),
+        outputs=SUMMARY_OUTPUTS,
+    )(build_attendance_summary_streaming)
+else:
+    register_table(
+        inputs=("detailed_work_info_df", "daily_work_info_df"),
+        outputs=SUMMARY_OUTPUTS,
+    )(build_attendance_summary_table)
+
+
+__getattr__ = module_getattr(__name__)
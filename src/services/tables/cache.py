@@ -0,0 +1,235 @@
+"""
+생성 테이블 디스크 캐시
+
+빌더 단위로 출력 테이블을 디스크에 저장하고, 다음 기동 시 동일한 캐시 키면
+재생성 없이 불러온다.
+
+- DataFrame: 무압축 Feather(Arrow IPC) 파일로 저장하고 memory-map으로 읽음
+  (Arrow 왕복 변환이 정확하지 않은 테이블은 pickle로 저장)
+- 그 외 객체(헬퍼 맵, ID 리스트 등): pickle
+
+캐시 키는 시드, 직원 수, 샤드(직원 시드·ID 오프셋), 날짜 범위, 빌드 날짜(today), 근태 스트리밍 청크 크기, 빌더 모듈과 그 모듈이 import한
+services.* 모듈들의 소스 해시와 입력 빌더들의 캐시 키로 구성된다. 상위 테이블의 키가 바뀌면 하위 테이블의 키도
+함께 바뀌므로, 변경된 테이블과 그 하위 테이블만 다시 빌드된다.
+
+디렉터리 구조:
+    <cache_dir>/<모듈 이름>/<빌더 함수 이름>/<캐시 키>/<출력 이름>.feather | .pkl
+"""
+
+import ast
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+from datetime import date
+from typing import Any, Dict, Iterable, Optional, Set
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
+
+from services.tables.common import (
+    ATTENDANCE_CHUNK_EMPLOYEES, EMPLOYEE_ID_OFFSET, EMPLOYEE_SEED, END_DATE, START_DATE, TOTAL_EMPLOYEES,
+)
+
+FEATHER_SUFFIX = ".feather"
+PICKLE_SUFFIX = ".pkl"
+
+
+SOURCE_PACKAGE = "services"
+
+# (소스 경로, 수정 시각, 크기) → import하는 services.* 모듈 이름 (빌더마다 다시 파싱하지 않도록)
+_IMPORTS_CACHE: Dict[tuple, Set[str]] = {}
+
+
+def module_source_hash(module_name: str) -> str:
+    """빌더 모듈 소스 파일의 sha256 해시"""
+    path = sys.modules[module_name].__file__
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _is_source_module(name: str) -> bool:
+    return name == SOURCE_PACKAGE or name.startswith(SOURCE_PACKAGE + ".")
+
+
+def _imported_modules(module_name: str) -> Set[str]:
+    """모듈 소스의 import 문(함수 안 지연 import 포함)에서 가져오는 services.* 모듈 이름"""
+    path = sys.modules[module_name].__file__
+    stat = os.stat(path)
+    cache_key = (path, stat.st_mtime_ns, stat.st_size)
+    if cache_key not in _IMPORTS_CACHE:
+        with open(path, "rb") as f:
+            _IMPORTS_CACHE[cache_key] = _parse_imports(ast.parse(f.read(), filename=path))
+    return _IMPORTS_CACHE[cache_key]
+
+
+def _parse_imports(tree: ast.AST) -> Set[str]:
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names if _is_source_module(alias.name))
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module and _is_source_module(node.module):
+            names.add(node.module)
+            # from services.tables import create_master_table 처럼 서브모듈을 가져오는 경우
+            # (모듈이 아닌 이름은 sys.modules에 없으므로 module_dependency_hash에서 건너뜀)
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return names
+
+
+def module_dependency_hash(module_name: str) -> str:
+    """
+    모듈과 그 모듈이 (직간접적으로) import한 services.* 모듈 소스 전체의 sha256 해시
+
+    빌더 모듈 자체뿐 아니라 헬퍼(services.helpers.*)나 설정 모듈이 바뀌어도 캐시 키가 바뀌도록
+    소스의 import 문을 따라가며 의존 모듈을 모은다. 아직 import되지 않은 모듈은 건너뛴다.
+
+    Args:
+        module_name: 기준 모듈 이름
+
+    Returns:
+        str: (모듈 이름, 소스 해시) 목록의 sha256 해시
+    """
+    seen = set()
+    pending = [module_name]
+    while pending:
+        name = pending.pop()
+        module = sys.modules.get(name)
+        if name in seen or getattr(module, "__file__", None) is None:
+            continue
+        seen.add(name)
+        pending.extend(_imported_modules(name) - seen)
+
+    digest = hashlib.sha256()
+    for name in sorted(seen):
+        digest.update(f"{name}:{module_source_hash(name)}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _to_arrow(df: pd.DataFrame) -> Optional[pa.Table]:
+    """
+    DataFrame을 Arrow 테이블로 변환 (왕복 변환 결과가 원본과 같을 때만)
+
+    object 컬럼의 결측치가 float로 바뀌는 등 dtype이 달라지는 경우 None을 반환하여
+    pickle로 저장하도록 한다.
+    """
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        restored = table.to_pandas()
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+    same = (
+        restored.equals(df)
+        and restored.columns.equals(df.columns)
+        and restored.dtypes.equals(df.dtypes)
+        and restored.index.dtype == df.index.dtype
+    )
+    return table if same else None
+
+
+class TableCache:
+    """
+    빌더 출력의 디스크 캐시
+
+    Attributes:
+        cache_dir: 캐시 루트 디렉터리
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def _builder_dir(self, builder) -> str:
+        return os.path.join(self.cache_dir, builder.name, builder.func.__name__)
+
+    def key(self, builder, input_keys: Iterable[str]) -> str:
+        """
+        빌더 캐시 키 계산
+
+        Args:
+            builder: TableBuilder
+            input_keys: 입력 빌더들의 캐시 키
+
+        Returns:
+            str: 캐시 키 (sha256 앞 16자리)
+        """
+        payload = {
+            "seed": builder.seed,
+            "num_employees": TOTAL_EMPLOYEES,
+            "shard": [EMPLOYEE_SEED, EMPLOYEE_ID_OFFSET],
+            "date_range": [START_DATE.isoformat(), END_DATE.isoformat()],
+            "today": date.today().isoformat(),
+            "attendance_chunk_employees": ATTENDANCE_CHUNK_EMPLOYEES,
+            "source": module_dependency_hash(builder.module),
+            "inputs": sorted(set(input_keys)),
+        }
+        encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def load(self, builder, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 빌더 출력 로드
+
+        Returns:
+            Optional[Dict[str, Any]]: {출력 이름: 값}, 캐시가 없으면 None
+        """
+        entry_dir = os.path.join(self._builder_dir(builder), key)
+        if not os.path.isdir(entry_dir):
+            return None
+
+        outputs = {}
+        try:
+            for name in builder.outputs:
+                path = os.path.join(entry_dir, name)
+                if os.path.exists(path + FEATHER_SUFFIX):
+                    table = feather.read_table(path + FEATHER_SUFFIX, memory_map=True)
+                    outputs[name] = table.to_pandas()
+                else:
+                    with open(path + PICKLE_SUFFIX, "rb") as f:
+                        outputs[name] = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, pa.ArrowException, EOFError) as e:
+            print(f"⚠️ 테이블 캐시 로드 실패 ({builder.name}): {e}")
+            return None
+        return outputs
+
+    def save(self, builder, key: str, outputs: Dict[str, Any]):
+        """
+        빌더 출력을 캐시에 저장하고 같은 빌더의 이전 캐시 키 삭제
+
+        임시 디렉터리에 모두 쓴 뒤 rename하므로 중간에 실패해도 반쯤 쓰인
+        캐시가 남지 않는다.
+        """
+        builder_dir = self._builder_dir(builder)
+        os.makedirs(builder_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=f".{key}-", dir=builder_dir)
+
+        try:
+            for name in builder.outputs:
+                value = outputs[name]
+                path = os.path.join(tmp_dir, name)
+                table = _to_arrow(value) if isinstance(value, pd.DataFrame) else None
+                if table is not None:
+                    feather.write_feather(table, path + FEATHER_SUFFIX, compression="uncompressed")
+                else:
+                    with open(path + PICKLE_SUFFIX, "wb") as f:
+                        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            entry_dir = os.path.join(builder_dir, key)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+        except OSError as e:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            print(f"⚠️ 테이블 캐시 저장 실패 ({builder.name}): {e}")
+            return
+
+        # 오래된 캐시 키 정리
+        for entry in os.listdir(builder_dir):
+            if entry != key and not entry.startswith("."):
+                shutil.rmtree(os.path.join(builder_dir, entry), ignore_errors=True)
+
+    def clear(self):
+        """캐시 디렉터리 전체 삭제"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
@@ -5,12 +5,23 @@
 개발 모드 설정에 따라 데이터 생성 크기를 자동으로 조정
 """
 
+import os
 from datetime import datetime
 from services.config.dev_config import (
     NUM_EMPLOYEES,
     DATE_RANGE_START,
     DATE_RANGE_END,
     DEV_MODE,
+    TABLE_BUILD_WORKERS,
+    ENABLE_DATA_CACHING,
+    TABLE_CACHE_DIR,
+    ATTENDANCE_CHUNK_SIZE,
+    ATTENDANCE_SPILL_DIR,
+    MASTER_INCREMENTAL,
+    MASTER_SNAPSHOT_DIR,
+    BUILD_PROFILE,
+    SHARD_INDEX,
+    SHARD_EMPLOYEE_OFFSET,
 )
 
 # ==============================================================================
@@ -27,6 +38,37 @@ END_DATE = datetime.strptime(DATE_RANGE_END, "%Y-%m-%d").date()
 # 기타 공통 설정
 RANDOM_SEED = 42  # 재현 가능한 랜덤 데이터 생성용
 
+# 직원 단위 테이블 시드와 직원 ID 시작 오프셋 (샤드 생성 시 샤드마다 다름, 기본값은 단일 생성과 동일)
+EMPLOYEE_SEED = RANDOM_SEED + SHARD_INDEX
+EMPLOYEE_ID_OFFSET = max(0, SHARD_EMPLOYEE_OFFSET)
+
+# 테이블 빌드 병렬도 (1이면 순차 빌드)
+BUILD_WORKERS = max(1, TABLE_BUILD_WORKERS)
+
+# 생성 테이블 디스크 캐시 (None이면 캐시 사용 안 함)
+CACHE_DIR = (
+    (TABLE_CACHE_DIR or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+    if ENABLE_DATA_CACHING
+    else None
+)
+
+# 근태 행 생성 난수 시드 블록 크기 (직원 수). 블록마다 EMPLOYEE_SEED + 블록 첫 직원 순번으로 시드를 다시 정함
+ATTENDANCE_SEED_BLOCK_EMPLOYEES = 50
+
+# 근태 테이블 스트리밍 빌드 청크 크기 (0이면 전체 빌드) 및 청크 저장 경로 (None이면 저장 안 함)
+# 청크가 시드 블록 경계에서 나뉘도록 시드 블록 크기의 배수로 올림 → 전체 빌드와 같은 근태 행
+ATTENDANCE_CHUNK_EMPLOYEES = -(-max(0, ATTENDANCE_CHUNK_SIZE) // ATTENDANCE_SEED_BLOCK_EMPLOYEES) * ATTENDANCE_SEED_BLOCK_EMPLOYEES
+ATTENDANCE_SPILL_PATH = ATTENDANCE_SPILL_DIR or None
+
+# 마스터 테이블 증분 빌드 상태 파일 (None이면 매번 전체 집계)
+MASTER_STATE_PATH = os.path.join(CACHE_DIR, "master_state.pkl") if (MASTER_INCREMENTAL and CACHE_DIR) else None
+
+# 마스터 테이블 시점 스냅샷 Parquet 데이터셋 경로
+MASTER_SNAPSHOT_PATH = MASTER_SNAPSHOT_DIR or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".snapshots")
+
+# 테이블 빌드 프로파일 리포트 경로 (None이면 프로파일링 안 함)
+BUILD_PROFILE_PATH = BUILD_PROFILE or None
+
 # ==============================================================================
 # 유틸리티 함수
 # ==============================================================================
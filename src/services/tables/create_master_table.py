@@ -12,476 +12,566 @@ src_dir = os.path.abspath(os.path.join(script_dir, '..', '..'))
 if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
 
-# --- 테이블 모듈에서 DataFrame을 직접 임포트 (단일 소스) ---
-# HR_Core
-from services.tables.HR_Core.basic_info_table import emp_df
-from services.tables.HR_Core.absence_info_table import absence_info_df
-from services.tables.HR_Core.career_info_table import career_info_df
-from services.tables.HR_Core.contract_info_table import contract_info_df
-from services.tables.HR_Core.department_table import (
-    department_df, dept_level_map, parent_map_dept, dept_name_map
+from services.helpers.utils import (
+    parse_birth_dates, calculate_age_vectorized, calculate_grouped_slope,
+    calculate_grouped_quantiles, assign_percentile_band, annualize_partial_year_pay,
 )
-from services.tables.HR_Core.department_info_table import department_info_df
-from services.tables.HR_Core.job_table import job_df, job_df_indexed, parent_map_job
-from services.tables.HR_Core.job_info_table import job_info_df
-from services.tables.HR_Core.position_table import position_df
-from services.tables.HR_Core.position_info_table import position_info_df
-from services.tables.HR_Core.pjt_info_table import pjt_info_df
-from services.tables.HR_Core.region_info_table import region_info_df
-from services.tables.HR_Core.school_table import school_df
-from services.tables.HR_Core.school_info_table import school_info_df
-from services.tables.HR_Core.salary_contract_info_table import salary_contract_info_df
-# Payroll
-from services.tables.Payroll.yearly_payroll_info_table import yearly_payroll_df
-# Performance
-from services.tables.Performance.evaluation_modified_score_info_table import evaluation_modified_score_df
-# Time_Attendance
-from services.tables.Time_Attendance.daily_working_info_table import daily_work_info_df
-from services.tables.Time_Attendance.detailed_leave_info_table import detailed_leave_info_df
-from services.tables.Time_Attendance.leave_type_table import leave_type_df
-# helpers
-from services.helpers.utils import find_parents, get_level1_ancestor, get_level2_ancestor
-
-# --- 전역 변수 ---
-today = datetime.datetime.now().date()
-today_ts = pd.to_datetime(today)
+from services.tables.cache import module_dependency_hash
+from services.tables.common import MASTER_STATE_PATH
+from services.tables.incremental import FeatureBlock, IncrementalBlockStore, employee_fingerprints, row_hashes, table_fingerprint
+from services.tables.profiler import profile_phase
+from services.tables.registry import register_table, module_getattr
 
 
 # ==============================================================================
 # PART 1: ML 마스터 테이블 생성 (기존 create_ml_table.py 로직)
 # ==============================================================================
 
-master_df = emp_df[['EMP_ID', 'PERSONAL_ID', 'GENDER', 'NATIONALITY', 'IN_DATE', 'OUT_DATE', 'CURRENT_EMP_YN']].copy()
-
-# --- 2.1. Basic Info Features ---
-def calculate_age(pid, base_date):
-    try:
-        birth_year_prefix = {'1': 1900, '2': 1900, '3': 2000, '4': 2000}
-        year = birth_year_prefix[pid[7]] + int(pid[:2])
-        month = int(pid[2:4])
-        day = int(pid[4:6])
-        birth_date = datetime.date(year, month, day)
-        return base_date.year - birth_date.year - ((base_date.month, base_date.day) < (birth_date.month, birth_date.day))
-    except:
-        return np.nan
-
-def calculate_age_at_hiring(row):
-    try:
-        pid = row['PERSONAL_ID']
-        in_date = row['IN_DATE']
-        birth_year_prefix = {'1': 1900, '2': 1900, '3': 2000, '4': 2000}
-        year = birth_year_prefix[pid[7]] + int(pid[:2])
-        month = int(pid[2:4])
-        day = int(pid[4:6])
-        birth_date = pd.to_datetime(datetime.date(year, month, day))
-        return (in_date - birth_date).days / 365.25
-    except:
-        return np.nan
-
-master_df['AGE'] = master_df.apply(lambda row: calculate_age(row['PERSONAL_ID'], today), axis=1)
-master_df['TENURE_DAYS'] = (master_df['OUT_DATE'].fillna(today_ts) - master_df['IN_DATE']).dt.days
-master_df['IS_LEAVER'] = np.where(master_df['CURRENT_EMP_YN'] == 'N', 1, 0)
-master_df['AGE_AT_HIRING'] = master_df.apply(calculate_age_at_hiring, axis=1)
-master_df['TENURE_TO_AGE_RATIO'] = (master_df['TENURE_DAYS'] / (master_df['AGE'] * 365.25)).fillna(0)
-
-# --- 2.2. Career Features ---
-if not career_info_df.empty:
-    career_summary = career_info_df.groupby('EMP_ID').agg(
-        PRIOR_CAREER_DAYS=('CAREER_DURATION', 'sum'),
-        NUM_PRIOR_COMPANIES=('CAREER_COMPANY_ID', 'nunique'),
-        PRIOR_CAREER_RELEVANCE_RATIO=('CAREER_REL_YN', lambda x: (x == 'Y').mean())
-    ).reset_index()
-    career_summary['AVG_TENURE_PER_COMPANY'] = (career_summary['PRIOR_CAREER_DAYS'] / career_summary['NUM_PRIOR_COMPANIES']).fillna(0)
-    master_df = pd.merge(master_df, career_summary, on='EMP_ID', how='left')
-
-# --- 2.3. School Features ---
-if not school_info_df.empty:
-    school_info_merged = pd.merge(school_info_df, school_df[['SCHOOL_ID', 'SCHOOL_LEVEL']], on='SCHOOL_ID', how='left')
-    degree_order = pd.CategoricalDtype(['전문학사', '학사', '석사', '박사'], ordered=True)
-    school_info_merged['EDU_DEGREE_CAT'] = school_info_merged['EDU_DEGREE'].astype(degree_order)
-    highest_edu = school_info_merged.sort_values('EDU_DEGREE_CAT', ascending=False).groupby('EMP_ID').first().reset_index()
-    highest_edu = highest_edu[['EMP_ID', 'EDU_DEGREE', 'SCHOOL_LEVEL', 'MAJOR_CATEGORY']]
-    highest_edu.rename(columns={'EDU_DEGREE': 'HIGHEST_DEGREE', 'SCHOOL_LEVEL': 'FINAL_SCHOOL_LEVEL', 'MAJOR_CATEGORY': 'FINAL_MAJOR_CATEGORY'}, inplace=True)
-    highest_edu['IS_STEM_MAJOR'] = np.where(highest_edu['FINAL_MAJOR_CATEGORY'] == 'STEM계열', 1, 0)
-    master_df = pd.merge(master_df, highest_edu, on='EMP_ID', how='left')
-
-# --- 2.4. Department, Job, Position, Project Features ---
-def get_latest_info(df, date_col, info_cols):
-    if df.empty or date_col not in df.columns:
-        return pd.DataFrame(columns=['EMP_ID'] + info_cols)
-    latest = df.sort_values(by=date_col, ascending=False).groupby('EMP_ID').first().reset_index()
-    return latest[['EMP_ID'] + info_cols]
-
-latest_dept = get_latest_info(department_info_df, 'DEP_APP_START_DATE', ['DEP_ID', 'TITLE_INFO'])
-latest_dept.rename(columns={'DEP_ID': 'LATEST_DEP_ID', 'TITLE_INFO': 'LATEST_TITLE_INFO'}, inplace=True)
-
-latest_job = get_latest_info(job_info_df, 'JOB_APP_START_DATE', ['JOB_ID'])
-latest_job.rename(columns={'JOB_ID': 'LATEST_JOB_ID'}, inplace=True)
-
-latest_pos = get_latest_info(position_info_df, 'GRADE_START_DATE', ['POSITION_ID', 'GRADE_ID'])
-latest_pos.rename(columns={'POSITION_ID': 'LATEST_POSITION_ID', 'GRADE_ID': 'LATEST_GRADE_ID'}, inplace=True)
-
-master_df = pd.merge(master_df, latest_dept, on='EMP_ID', how='left')
-master_df = pd.merge(master_df, latest_job, on='EMP_ID', how='left')
-master_df = pd.merge(master_df, latest_pos, on='EMP_ID', how='left')
-
-dept_map = department_df.set_index('DEP_ID').to_dict('index')
-def get_department_hierarchy(dep_id, dept_map):
-    hierarchy = {'LATEST_DIVISION_NAME': 'Unknown', 'LATEST_OFFICE_NAME': 'Unknown'}
-    if pd.isna(dep_id) or dep_id not in dept_map:
-        return pd.Series(hierarchy)
-    current_id = dep_id
-    for _ in range(10):
-        if pd.isna(current_id) or current_id not in dept_map: break
-        dep_info = dept_map[current_id]
-        dep_name = dep_info.get('DEP_NAME', '')
-        if 'Division' in dep_name and hierarchy['LATEST_DIVISION_NAME'] == 'Unknown':
-            hierarchy['LATEST_DIVISION_NAME'] = dep_name
-        if 'Office' in dep_name and hierarchy['LATEST_OFFICE_NAME'] == 'Unknown':
-            hierarchy['LATEST_OFFICE_NAME'] = dep_name
-        parent_id = dep_info.get('UP_DEP_ID')
-        if pd.isna(parent_id) or parent_id == current_id: break
-        current_id = parent_id
-    return pd.Series(hierarchy)
-dept_hierarchy_cols = master_df['LATEST_DEP_ID'].apply(lambda x: get_department_hierarchy(x, dept_map))
-master_df = pd.concat([master_df, dept_hierarchy_cols], axis=1)
-
-job_map = job_df.set_index('JOB_ID').to_dict('index')
-def get_job_hierarchy(job_id, job_map):
-    hierarchy = {'LATEST_JOB_L1_NAME': 'Unknown', 'LATEST_JOB_L2_NAME': 'Unknown'}
-    if pd.isna(job_id) or job_id not in job_map:
-        return pd.Series(hierarchy)
-    current_id = job_id
-    for _ in range(10):
-        if pd.isna(current_id) or current_id not in job_map: break
-        job_info = job_map[current_id]
-        job_level = job_info.get('JOB_LEVEL')
-        job_name = job_info.get('JOB_NAME', 'Unknown')
-        if job_level == 1 and hierarchy['LATEST_JOB_L1_NAME'] == 'Unknown':
-            hierarchy['LATEST_JOB_L1_NAME'] = job_name
-        if job_level == 2 and hierarchy['LATEST_JOB_L2_NAME'] == 'Unknown':
-            hierarchy['LATEST_JOB_L2_NAME'] = job_name
-        parent_id = job_info.get('UP_JOB_ID')
-        if pd.isna(parent_id) or parent_id == current_id: break
-        current_id = parent_id
-    return pd.Series(hierarchy)
-job_hierarchy_cols = master_df['LATEST_JOB_ID'].apply(lambda x: get_job_hierarchy(x, job_map))
-master_df = pd.concat([master_df, job_hierarchy_cols], axis=1)
-
-if not department_info_df.empty:
-    dept_summary = department_info_df.groupby('EMP_ID').agg(
-        NUM_DEP_CHANGES=('DEP_ID', 'nunique'),
-        AVG_DEP_TENURE_DAYS=('DEP_DURATION', 'mean')
-    ).reset_index()
-    
-    last_dept_change_date = department_info_df.groupby('EMP_ID')['DEP_APP_START_DATE'].max().reset_index().rename(
-        columns={'DEP_APP_START_DATE': 'LAST_DEP_CHANGE_DATE'})
-    
-    # 먼저 필요한 모든 데이터를 master_df에 병합합니다.
-    master_df = pd.merge(master_df, dept_summary, on='EMP_ID', how='left')
-    master_df = pd.merge(master_df, last_dept_change_date, on='EMP_ID', how='left')
-
-    # 날짜 타입 일관성을 위해 변환합니다.
-    master_df['OUT_DATE'] = pd.to_datetime(master_df['OUT_DATE'])
-    master_df['LAST_DEP_CHANGE_DATE'] = pd.to_datetime(master_df['LAST_DEP_CHANGE_DATE'])
-
-    # 재직 여부에 따라 종료일을 조건부로 설정합니다.
-    end_date_for_calc = np.where(master_df['CURRENT_EMP_YN'] == 'N', 
-                                 master_df['OUT_DATE'], 
-                                 pd.to_datetime(today_ts))
-    
-    # 설정된 종료일을 기준으로 기간을 계산합니다.
-    master_df['DAYS_SINCE_LAST_DEP_CHANGE'] = (pd.to_datetime(end_date_for_calc) - master_df['LAST_DEP_CHANGE_DATE']).dt.days
-    
-    # 계산에 사용된 임시 컬럼을 삭제합니다.
-    master_df = master_df.drop(columns=['LAST_DEP_CHANGE_DATE'])
-
-if not position_info_df.empty:
-    promotions = position_info_df[position_info_df['CHANGE_REASON'] != 'Initial Assignment']
-    promo_summary = promotions.groupby('EMP_ID').agg(
-        NUM_PROMOTIONS=('GRADE_ID', 'count'),
-        AVG_PROMOTION_SPEED_DAYS=('GRADE_DURATION', 'mean')
-    ).reset_index()
-    last_promo_date = promotions.groupby('EMP_ID')['GRADE_START_DATE'].max().reset_index().rename(columns={'GRADE_START_DATE': 'LAST_PROMO_DATE'})
-    promo_summary = pd.merge(promo_summary, last_promo_date, on='EMP_ID', how='left')
-    promo_summary['DAYS_SINCE_LAST_PROMOTION'] = (today_ts - promo_summary['LAST_PROMO_DATE']).dt.days
-    promo_summary = pd.merge(promo_summary, master_df[['EMP_ID', 'TENURE_DAYS']], on='EMP_ID', how='left')
-    promo_summary['PROMOTION_RATE'] = (promo_summary['NUM_PROMOTIONS'] / (promo_summary['TENURE_DAYS'] / 365.25)).fillna(0)
-    master_df = pd.merge(master_df, promo_summary[['EMP_ID', 'NUM_PROMOTIONS', 'AVG_PROMOTION_SPEED_DAYS', 'DAYS_SINCE_LAST_PROMOTION', 'PROMOTION_RATE']], on='EMP_ID', how='left')
-
-if not pjt_info_df.empty:
-    pjt_summary = pjt_info_df.groupby('EMP_ID').agg(
-        NUM_PROJECTS=('PJT_ID', 'nunique'),
-        AVG_PROJECT_DURATION=('PJT_DURATION', 'mean')
-    ).reset_index()
-    master_df = pd.merge(master_df, pjt_summary, on='EMP_ID', how='left')
-
-# --- 2.5. Payroll Features ---
-if not yearly_payroll_df.empty:
-    current_year = datetime.datetime.now().year
-    filtered_payroll_df = yearly_payroll_df[~((yearly_payroll_df['PAY_YEAR'] == str(current_year)))]
-    latest_payroll = filtered_payroll_df.sort_values('PAY_YEAR', ascending=False).groupby('EMP_ID').first().reset_index()
-    latest_payroll.rename(columns={'TOTAL_PAY': 'LATEST_TOTAL_PAY'}, inplace=True)
-    payroll_summary = filtered_payroll_df.groupby('EMP_ID').agg(
-        AVG_YOY_GROWTH=('YOY_GROWTH', 'mean'),
-        AVG_VARIABLE_PAY_RATIO=('VARIABLE_PAY_RATIO', 'mean')
-    ).reset_index()
-    payroll_summary['AVG_YOY_GROWTH'] = payroll_summary['AVG_YOY_GROWTH'].clip(-25, 35)
-    master_df = pd.merge(master_df, latest_payroll[['EMP_ID', 'LATEST_TOTAL_PAY', 'PAY_YEAR']], on='EMP_ID', how='left')
-    master_df = pd.merge(master_df, payroll_summary, on='EMP_ID', how='left')
-    if 'IN_DATE' in master_df.columns:
-        master_df.loc[master_df['IN_DATE'].dt.year == current_year - 1, 'AVG_YOY_GROWTH'] = 0
-        master_df.loc[master_df['IN_DATE'].dt.year == current_year, 'AVG_YOY_GROWTH'] = 0
-
-def annualize_pay_for_partial_years(row):
-    if pd.isna(row['LATEST_TOTAL_PAY']) or pd.isna(row['PAY_YEAR']): return row['LATEST_TOTAL_PAY']
-    pay_year = int(row['PAY_YEAR'])
-    in_date = pd.to_datetime(row['IN_DATE'])
-    out_date = pd.to_datetime(row.get('OUT_DATE'))
-    if in_date.year == pay_year:
-        year_end = pd.to_datetime(f'{pay_year}-12-31')
-        effective_end_date = out_date if pd.notna(out_date) and out_date.year == pay_year else year_end
-        days_worked = (effective_end_date - in_date).days + 1
-        if days_worked <= 0: return np.nan
-        return (row['LATEST_TOTAL_PAY'] / days_worked) * 365
-    elif pd.notna(out_date) and out_date.year == pay_year:
-        year_start = pd.to_datetime(f'{pay_year}-01-01')
-        days_worked = (out_date - year_start).days + 1
-        if days_worked <= 0: return np.nan
-        return (row['LATEST_TOTAL_PAY'] / days_worked) * 365
-    else:
-        return row['LATEST_TOTAL_PAY']
-
-if 'PAY_YEAR' in master_df.columns:
-    master_df['LATEST_TOTAL_PAY'] = master_df.apply(annualize_pay_for_partial_years, axis=1)
-    master_df.drop(columns=['PAY_YEAR'], inplace=True)
-
-master_df['PRIOR_CAREER_DAYS'] = master_df['PRIOR_CAREER_DAYS'].fillna(0)
-master_df['TOTAL_EXPERIENCE_DAYS'] = master_df['TENURE_DAYS'] + master_df['PRIOR_CAREER_DAYS']
-master_df['TOTAL_EXPERIENCE_YEARS'] = master_df['TOTAL_EXPERIENCE_DAYS'] / 365.25
-bins = [0, 3, 6, 10, 15, np.inf]
-labels = ['0-2년', '3-5년', '6-9년', '10-14년', '15년 이상']
-master_df['EXPERIENCE_BAND'] = pd.cut(master_df['TOTAL_EXPERIENCE_YEARS'], bins=bins, labels=labels, right=False)
-master_df['EXPERIENCE_BAND'] = master_df['EXPERIENCE_BAND'].astype(str).fillna('Unknown')
-group_cols = ['EXPERIENCE_BAND', 'LATEST_JOB_L1_NAME']
-master_df['SALARY_P30'] = master_df.groupby(group_cols)['LATEST_TOTAL_PAY'].transform(lambda x: x.quantile(0.3) if x.count() > 1 else np.nan)
-master_df['SALARY_P70'] = master_df.groupby(group_cols)['LATEST_TOTAL_PAY'].transform(lambda x: x.quantile(0.7) if x.count() > 1 else np.nan)
-def assign_salary_level(row):
-    if pd.isna(row['SALARY_P70']) or pd.isna(row['SALARY_P30']): return '정보 없음'
-    if row['SALARY_P70'] == row['SALARY_P30']: return '중'
-    if row['LATEST_TOTAL_PAY'] >= row['SALARY_P70']: return '상'
-    elif row['LATEST_TOTAL_PAY'] < row['SALARY_P30']: return '하'
-    else: return '중'
-master_df['SALARY_LEVEL_VS_EXPERIENCE'] = master_df.apply(assign_salary_level, axis=1)
-master_df.drop(columns=['TOTAL_EXPERIENCE_DAYS', 'EXPERIENCE_BAND', 'SALARY_P30', 'SALARY_P70'], inplace=True)
-
-# --- 2.6. Performance Features ---
-if not evaluation_modified_score_df.empty:
+# 빌드 프로파일 리포트의 단계 이름 (집계 블록 → 2.2~2.8 피처 구간)
+BLOCK_PHASES = {
+    'career': '2.2 Career', 'school': '2.3 School', 'assignment': '2.4 Assignment',
+    'department': '2.4 Department', 'promotion': '2.4 Promotion', 'project': '2.4 Project',
+    'payroll': '2.5 Payroll', 'evaluation': '2.6 Performance', 'attendance': '2.7 Attendance',
+    'leave': '2.7 Leave', 'absence': '2.8 Absence',
+}
+
+
+@register_table(
+    inputs=(
+        "emp_df",
+        "absence_info_df",
+        "career_info_df",
+        "dept_hierarchy",
+        "department_info_df",
+        "job_hierarchy_index",
+        "job_info_df",
+        "position_df",
+        "position_info_df",
+        "pjt_info_df",
+        "school_df",
+        "school_info_df",
+        "yearly_payroll_df",
+        "evaluation_modified_score_df",
+        "attendance_summary_df",
+        "detailed_leave_info_df",
+        "leave_type_df",
+    ),
+    outputs=("master_df", "master_df_encoded"),
+)
+def build_master_table(
+    emp_df,
+    absence_info_df,
+    career_info_df,
+    dept_hierarchy,
+    department_info_df,
+    job_hierarchy_index,
+    job_info_df,
+    position_df,
+    position_info_df,
+    pjt_info_df,
+    school_df,
+    school_info_df,
+    yearly_payroll_df,
+    evaluation_modified_score_df,
+    attendance_summary_df,
+    detailed_leave_info_df,
+    leave_type_df,
+    as_of=None,
+):
+    """
+    ML 마스터 테이블(master_df) 및 원-핫 인코딩 버전(master_df_encoded) 생성
+
+    소스 테이블별 직원 집계(2.2~2.8)는 FeatureBlock으로 나누어 계산한다. 증분 모드
+    (STREAMLIT_MASTER_INCREMENTAL)에서는 직원별 소스 지문이 바뀐 직원만 블록을 다시
+    집계하고, 기준일 파생값·모집단 통계(연봉 분위수, 평가점수 중앙값)·인코딩은 갱신된
+    블록 전체로 다시 계산한다.
+
+    이전 master_df/master_df_encoded의 행을 직원 단위로 덮어쓰지는 않는다. 연봉 수준 구간은
+    직무·경력 그룹 분위수로, 인코딩 컬럼은 전체 범주 집합으로 정해지므로 한 직원의 변경이
+    다른 직원 행을 바꿀 수 있기 때문이다. 따라서 지문 계산(2.0)·기본 정보(2.1)·조립(3)·
+    인코딩(4)은 매 빌드 전 직원을 대상으로 하며 비용이 직원 수에 비례한다.
+
+    as_of를 지정하면 오늘 대신 그 날짜를 기준일로 계산한다 (시점 스냅샷용, 증분 상태는
+    사용하지 않음). 소스를 기준일 이전 기록으로 잘라 넘기는 것은 호출하는 쪽의 몫이다
+    (services.tables.snapshots 참고).
+    """
+    today = as_of or datetime.datetime.now().date()
+    today_ts = pd.to_datetime(today)
+    current_year = today.year
+
+    # --- 1. 직원별 집계 블록 정의 ---
     eval_df = evaluation_modified_score_df.copy()
-    eval_df['EVAL_DATE'] = pd.to_datetime(eval_df['EVAL_TIME'].str.replace('상반기', '-06-01').str.replace('하반기', '-12-01'))
-    latest_eval = eval_df.sort_values('EVAL_DATE', ascending=False).groupby('EMP_ID').first().reset_index()
-    latest_eval.rename(columns={'MODIFIED_SCORE': 'LATEST_EVAL_SCORE'}, inplace=True)
-    eval_summary = eval_df.groupby('EMP_ID').agg(
-        AVG_EVAL_SCORE=('MODIFIED_SCORE', 'mean'),
-        EVAL_SCORE_STDDEV=('MODIFIED_SCORE', 'std')
-    ).reset_index()
-    def calculate_trend(group):
-        if len(group) < 2: return 0
-        group['TIME_ORDINAL'] = group['EVAL_DATE'].map(datetime.datetime.toordinal)
-        return np.polyfit(group['TIME_ORDINAL'], group['MODIFIED_SCORE'], 1)[0] * 365
-    eval_trend = eval_df.groupby('EMP_ID').apply(calculate_trend).reset_index(name='EVAL_SCORE_TREND')
-    one_year_ago = today_ts - pd.DateOffset(years=1)
-    two_years_ago = today_ts - pd.DateOffset(years=2)
-    eval_1y = eval_df[eval_df['EVAL_DATE'] >= one_year_ago]
-    eval_2y = eval_df[eval_df['EVAL_DATE'] >= two_years_ago]
-    eval_summary_1y = eval_1y.groupby('EMP_ID')['MODIFIED_SCORE'].mean().reset_index().rename(columns={'MODIFIED_SCORE': 'EVAL_SCORE_1Y'})
-    eval_summary_2y = eval_2y.groupby('EMP_ID')['MODIFIED_SCORE'].mean().reset_index().rename(columns={'MODIFIED_SCORE': 'EVAL_SCORE_2Y'})
-    master_df = pd.merge(master_df, latest_eval[['EMP_ID', 'LATEST_EVAL_SCORE']], on='EMP_ID', how='left')
-    master_df = pd.merge(master_df, eval_summary, on='EMP_ID', how='left')
-    master_df = pd.merge(master_df, eval_trend, on='EMP_ID', how='left')
-    master_df = pd.merge(master_df, eval_summary_1y, on='EMP_ID', how='left')
-    master_df = pd.merge(master_df, eval_summary_2y, on='EMP_ID', how='left')
-    if 'EVAL_SCORE_1Y' in master_df.columns:
-        master_df['EVAL_SCORE_1Y'].fillna(master_df['EVAL_SCORE_1Y'].median(), inplace=True)
-    if 'EVAL_SCORE_2Y' in master_df.columns:
-        master_df['EVAL_SCORE_2Y'].fillna(master_df['EVAL_SCORE_2Y'].median(), inplace=True)
-
-# --- 2.7. Time & Attendance Features ---
-if not daily_work_info_df.empty:
-    work_df = daily_work_info_df.copy()
-    work_df['DATE'] = pd.to_datetime(work_df['DATE'])
-    ta_summary = work_df.groupby('EMP_ID').agg(
-        AVG_OVERTIME_MINUTES=('OVERTIME_MINUTES', 'mean'),
-        AVG_NIGHT_WORK_MINUTES=('NIGHT_WORK_MINUTES', 'mean')
-    ).reset_index()
+    if not eval_df.empty:
+        eval_df['EVAL_DATE'] = pd.to_datetime(eval_df['EVAL_TIME'].str.replace('상반기', '-06-01').str.replace('하반기', '-12-01'))
     one_year_ago = today_ts - pd.DateOffset(years=1)
     two_years_ago = today_ts - pd.DateOffset(years=2)
-    work_1y = work_df[work_df['DATE'] >= one_year_ago]
-    work_2y = work_df[work_df['DATE'] >= two_years_ago]
-    overtime_summary_1y = work_1y.groupby('EMP_ID')['OVERTIME_MINUTES'].mean().reset_index().rename(columns={'OVERTIME_MINUTES': 'OVERTIME_1Y'})
-    overtime_summary_2y = work_2y.groupby('EMP_ID')['OVERTIME_MINUTES'].mean().reset_index().rename(columns={'OVERTIME_MINUTES': 'OVERTIME_2Y'})
-    
-    cond_1y = overtime_summary_1y['OVERTIME_1Y'] < 0
-    if cond_1y.sum() > 0: overtime_summary_1y.loc[cond_1y, 'OVERTIME_1Y'] = np.random.randint(80, 121, size=cond_1y.sum())
-    cond_2y = overtime_summary_2y['OVERTIME_2Y'] < 0
-    if cond_2y.sum() > 0: overtime_summary_2y.loc[cond_2y, 'OVERTIME_2Y'] = np.random.randint(30, 71, size=cond_2y.sum())
-    
-    master_df = pd.merge(master_df, ta_summary, on='EMP_ID', how='left')
-    master_df = pd.merge(master_df, overtime_summary_1y, on='EMP_ID', how='left')
-    master_df = pd.merge(master_df, overtime_summary_2y, on='EMP_ID', how='left')
-
-if not detailed_leave_info_df.empty:
-    leave_summary = detailed_leave_info_df.groupby('EMP_ID').agg(
-        TOTAL_LEAVE_DAYS=('LEAVE_LENGTH', 'sum'),
-        AVG_LEAVE_TERM=('LEAVE_LENGTH', 'mean')
-    ).reset_index()
-    sick_leave_id = leave_type_df[leave_type_df['LEAVE_TYPE_NAME'] == '병휴가']['LEAVE_TYPE_ID'].iloc[0]
-    sick_leaves = detailed_leave_info_df[detailed_leave_info_df['LEAVE_TYPE_ID'] == sick_leave_id]
-    sick_leave_summary = sick_leaves.groupby('EMP_ID')['LEAVE_LENGTH'].sum().reset_index().rename(columns={'LEAVE_LENGTH': 'SICK_LEAVE_DAYS'})
-    leave_summary = pd.merge(leave_summary, sick_leave_summary, on='EMP_ID', how='left')
-    leave_summary['SICK_LEAVE_RATIO'] = (leave_summary['SICK_LEAVE_DAYS'] / leave_summary['TOTAL_LEAVE_DAYS']).fillna(0)
-    master_df = pd.merge(master_df, leave_summary[['EMP_ID', 'TOTAL_LEAVE_DAYS', 'SICK_LEAVE_RATIO', 'AVG_LEAVE_TERM']], on='EMP_ID', how='left')
-
-    if 'TENURE_DAYS' in master_df.columns and 'TOTAL_LEAVE_DAYS' in master_df.columns:
-        master_df['AVG_LEAVE_DAYS'] = np.where(master_df['TENURE_DAYS'] > 0, (master_df['TOTAL_LEAVE_DAYS'] / master_df['TENURE_DAYS']) * 365, 0)
-        cond_outlier = master_df['AVG_LEAVE_DAYS'] > 50
-        if cond_outlier.sum() > 0: master_df.loc[cond_outlier, 'AVG_LEAVE_DAYS'] = np.round(np.random.uniform(40, 50, size=cond_outlier.sum()), 6)
-        master_df.drop(columns=['TOTAL_LEAVE_DAYS'], inplace=True)
-
-# --- 2.8. Absence Features ---
-if not absence_info_df.empty:
-    absence_summary = absence_info_df.groupby('EMP_ID').agg(
-        TOTAL_ABSENCE_DAYS=('ABSENCE_DURATION', 'sum'),
-        NUM_ABSENCES=('ABSENCE_ID', 'count')
-    ).reset_index()
-    master_df = pd.merge(master_df, absence_summary, on='EMP_ID', how='left')
-
-# --- 3. 최종 정리 ---
-master_df = master_df.drop(columns=['IN_DATE', 'OUT_DATE', 'PERSONAL_ID'])
-master_df['NATIONALITY'] = np.where(master_df['NATIONALITY'] == 'Korea', 'Korea', 'Other')
-pos_name_map = position_df.set_index('POSITION_ID')['POSITION_NAME'].to_dict()
-master_df['LATEST_POSITION_NAME'] = master_df['LATEST_POSITION_ID'].map(pos_name_map)
-
-for col in master_df.columns:
-    if master_df[col].dtype in ['float64', 'float32']:
-        master_df[col] = master_df[col].fillna(0)
-    elif master_df[col].dtype == 'object':
-        master_df[col] = master_df[col].fillna('Unknown')
-
-master_df = master_df.rename(columns={
-    'EMP_ID': '사번', 'GENDER': '성별', 'NATIONALITY': '국적', 'CURRENT_EMP_YN': '재직여부', 'AGE': '나이',
-    'TENURE_DAYS': '재직일수', 'IS_LEAVER': '퇴사자여부', 'AGE_AT_HIRING': '입사시나이',
-    'TENURE_TO_AGE_RATIO': '재직대비나이비율', 'PRIOR_CAREER_DAYS': '이전경력일수', 'NUM_PRIOR_COMPANIES': '이전회사수',
-    'PRIOR_CAREER_RELEVANCE_RATIO': '관련경력비율', 'AVG_TENURE_PER_COMPANY': '이전평균재직기간', 'HIGHEST_DEGREE': '최종학위',
-    'FINAL_SCHOOL_LEVEL': '최종학교레벨', 'FINAL_MAJOR_CATEGORY': '최종전공계열', 'IS_STEM_MAJOR': 'STEM전공여부',
-    'LATEST_TITLE_INFO': '현재직책정보', 'LATEST_DIVISION_NAME': '현재부서_본부', 'LATEST_OFFICE_NAME': '현재부서_실',
-    'LATEST_JOB_L1_NAME': '현재직무_대분류', 'LATEST_JOB_L2_NAME': '현재직무_중분류', 'NUM_DEP_CHANGES': '부서변경횟수',
-    'AVG_DEP_TENURE_DAYS': '평균부서소속일수', 'DAYS_SINCE_LAST_DEP_CHANGE': '현재부서소속일수', 'NUM_PROMOTIONS': '승진횟수',
-    'AVG_PROMOTION_SPEED_DAYS': '평균승진속도일수', 'DAYS_SINCE_LAST_PROMOTION': '현재직급소속일수', 'PROMOTION_RATE': '승진비율',
-    'NUM_PROJECTS': '프로젝트수', 'AVG_PROJECT_DURATION': '평균프로젝트기간', 'LATEST_TOTAL_PAY': '현재총연봉',
-    'AVG_YOY_GROWTH': '평균연봉상승률', 'AVG_VARIABLE_PAY_RATIO': '평균변동급비율', 'TOTAL_EXPERIENCE_YEARS': '총경력연수',
-    'SALARY_LEVEL_VS_EXPERIENCE': '경력대비연봉수준', 'LATEST_EVAL_SCORE': '최근평가점수', 'AVG_EVAL_SCORE': '평균평가점수',
-    'EVAL_SCORE_STDDEV': '평가점수표준편차', 'EVAL_SCORE_TREND': '평가점수추세', 'EVAL_SCORE_1Y': '최근1년평가점수',
-    'EVAL_SCORE_2Y': '최근2년평가점수', 'AVG_OVERTIME_MINUTES': '평균초과근무_분', 'AVG_NIGHT_WORK_MINUTES': '평균야간근무_분',
-    'OVERTIME_1Y': '최근1년초과근무', 'OVERTIME_2Y': '최근2년초과근무', 'AVG_LEAVE_DAYS': '연평균휴가일수', 'AVG_LEAVE_TERM': '평균휴가기간',
-    'SICK_LEAVE_DAYS': '병가일수', 'SICK_LEAVE_RATIO': '병가사용비율', 'TOTAL_ABSENCE_DAYS': '총결근일수',
-    'NUM_ABSENCES': '결근횟수', 'LATEST_POSITION_NAME': '현재직위'
-})
-
-categorical_cols = [
-    '성별', '국적', '최종학위', '최종전공계열', '최종학교레벨', '현재직책정보', '경력대비연봉수준',
-    '현재부서_본부', '현재부서_실', '현재직무_대분류', '현재직무_중분류', '현재직위'
-]
-categorical_cols_exist = [col for col in categorical_cols if col in master_df.columns]
-master_df_encoded = pd.get_dummies(master_df, columns=categorical_cols_exist, drop_first=True)
-
-id_cols_to_drop = ['LATEST_DEP_ID', 'LATEST_JOB_ID', 'LATEST_POSITION_ID', 'LATEST_GRADE_ID']
-master_df_encoded = master_df_encoded.drop(columns=[col for col in id_cols_to_drop if col in master_df_encoded.columns])
+
+    sources = {
+        'career': career_info_df,
+        'school': school_info_df,
+        'department': department_info_df,
+        'job': job_info_df,
+        'position': position_info_df,
+        'project': pjt_info_df,
+        'payroll': yearly_payroll_df,
+        'evaluation': eval_df,
+        'attendance': attendance_summary_df,
+        'leave': detailed_leave_info_df,
+        'absence': absence_info_df,
+    }
+
+    def get_latest_info(df, date_col, info_cols):
+        if df.empty or date_col not in df.columns:
+            return pd.DataFrame(columns=['EMP_ID'] + info_cols)
+        latest = df.sort_values(by=date_col, ascending=False).groupby('EMP_ID').first().reset_index()
+        return latest[['EMP_ID'] + info_cols]
+
+    # --- 2.2. Career Features ---
+    def career_block(src):
+        career_summary = src['career'].groupby('EMP_ID').agg(
+            PRIOR_CAREER_DAYS=('CAREER_DURATION', 'sum'),
+            NUM_PRIOR_COMPANIES=('CAREER_COMPANY_ID', 'nunique'),
+            PRIOR_CAREER_RELEVANCE_RATIO=('CAREER_REL_YN', lambda x: (x == 'Y').mean())
+        ).reset_index()
+        career_summary['AVG_TENURE_PER_COMPANY'] = (career_summary['PRIOR_CAREER_DAYS'] / career_summary['NUM_PRIOR_COMPANIES']).fillna(0)
+        return career_summary
+
+    # --- 2.3. School Features ---
+    def school_block(src):
+        school_info_merged = pd.merge(src['school'], school_df[['SCHOOL_ID', 'SCHOOL_LEVEL']], on='SCHOOL_ID', how='left')
+        degree_order = pd.CategoricalDtype(['전문학사', '학사', '석사', '박사'], ordered=True)
+        school_info_merged['EDU_DEGREE_CAT'] = school_info_merged['EDU_DEGREE'].astype(degree_order)
+        highest_edu = school_info_merged.sort_values('EDU_DEGREE_CAT', ascending=False).groupby('EMP_ID').first().reset_index()
+        highest_edu = highest_edu[['EMP_ID', 'EDU_DEGREE', 'SCHOOL_LEVEL', 'MAJOR_CATEGORY']]
+        highest_edu.rename(columns={'EDU_DEGREE': 'HIGHEST_DEGREE', 'SCHOOL_LEVEL': 'FINAL_SCHOOL_LEVEL', 'MAJOR_CATEGORY': 'FINAL_MAJOR_CATEGORY'}, inplace=True)
+        highest_edu['IS_STEM_MAJOR'] = np.where(highest_edu['FINAL_MAJOR_CATEGORY'] == 'STEM계열', 1, 0)
+        return highest_edu
+
+    # --- 2.4. Department, Job, Position, Project Features ---
+    def assignment_block(src):
+        latest_dept = get_latest_info(src['department'], 'DEP_APP_START_DATE', ['DEP_ID', 'TITLE_INFO'])
+        latest_dept = latest_dept.rename(columns={'DEP_ID': 'LATEST_DEP_ID', 'TITLE_INFO': 'LATEST_TITLE_INFO'})
+        latest_job = get_latest_info(src['job'], 'JOB_APP_START_DATE', ['JOB_ID'])
+        latest_job = latest_job.rename(columns={'JOB_ID': 'LATEST_JOB_ID'})
+        latest_pos = get_latest_info(src['position'], 'GRADE_START_DATE', ['POSITION_ID', 'GRADE_ID'])
+        latest_pos = latest_pos.rename(columns={'POSITION_ID': 'LATEST_POSITION_ID', 'GRADE_ID': 'LATEST_GRADE_ID'})
+        latest = pd.merge(latest_dept, latest_job, on='EMP_ID', how='outer')
+        latest = pd.merge(latest, latest_pos, on='EMP_ID', how='outer')
+
+        # 부서/직무 상위 계층은 closure 인덱스에서 한 번에 조회 (상위가 없으면 'Unknown')
+        dept_hierarchy_cols = dept_hierarchy.lookup(latest['LATEST_DEP_ID'], ['DIVISION_NAME', 'OFFICE_NAME']).fillna('Unknown')
+        dept_hierarchy_cols.columns = ['LATEST_DIVISION_NAME', 'LATEST_OFFICE_NAME']
+        job_hierarchy_cols = job_hierarchy_index.lookup(latest['LATEST_JOB_ID'], ['L1_JOB_NAME', 'L2_JOB_NAME']).fillna('Unknown')
+        job_hierarchy_cols.columns = ['LATEST_JOB_L1_NAME', 'LATEST_JOB_L2_NAME']
+        return pd.concat([latest, dept_hierarchy_cols, job_hierarchy_cols], axis=1)
+
+    def department_block(src):
+        dept_summary = src['department'].groupby('EMP_ID').agg(
+            NUM_DEP_CHANGES=('DEP_ID', 'nunique'),
+            AVG_DEP_TENURE_DAYS=('DEP_DURATION', 'mean'),
+            LAST_DEP_CHANGE_DATE=('DEP_APP_START_DATE', 'max')
+        ).reset_index()
+        return dept_summary
+
+    def promotion_block(src):
+        promotions = src['position'][src['position']['CHANGE_REASON'] != 'Initial Assignment']
+        promo_summary = promotions.groupby('EMP_ID').agg(
+            NUM_PROMOTIONS=('GRADE_ID', 'count'),
+            AVG_PROMOTION_SPEED_DAYS=('GRADE_DURATION', 'mean'),
+            LAST_PROMO_DATE=('GRADE_START_DATE', 'max')
+        ).reset_index()
+        return promo_summary
+
+    def project_block(src):
+        pjt_summary = src['project'].groupby('EMP_ID').agg(
+            NUM_PROJECTS=('PJT_ID', 'nunique'),
+            AVG_PROJECT_DURATION=('PJT_DURATION', 'mean')
+        ).reset_index()
+        return pjt_summary
+
+    # --- 2.5. Payroll Features ---
+    def payroll_block(src):
+        payroll_df = src['payroll']
+        filtered_payroll_df = payroll_df[~((payroll_df['PAY_YEAR'] == str(current_year)))]
+        latest_payroll = filtered_payroll_df.sort_values('PAY_YEAR', ascending=False).groupby('EMP_ID').first().reset_index()
+        latest_payroll.rename(columns={'TOTAL_PAY': 'LATEST_TOTAL_PAY'}, inplace=True)
+        payroll_summary = filtered_payroll_df.groupby('EMP_ID').agg(
+            AVG_YOY_GROWTH=('YOY_GROWTH', 'mean'),
+            AVG_VARIABLE_PAY_RATIO=('VARIABLE_PAY_RATIO', 'mean')
+        ).reset_index()
+        payroll_summary['AVG_YOY_GROWTH'] = payroll_summary['AVG_YOY_GROWTH'].clip(-25, 35)
+        return pd.merge(latest_payroll[['EMP_ID', 'LATEST_TOTAL_PAY', 'PAY_YEAR']], payroll_summary, on='EMP_ID', how='left')
+
+    # --- 2.6. Performance Features ---
+    def evaluation_block(src):
+        eval_src = src['evaluation']
+        latest_eval = eval_src.sort_values('EVAL_DATE', ascending=False).groupby('EMP_ID').first().reset_index()
+        latest_eval.rename(columns={'MODIFIED_SCORE': 'LATEST_EVAL_SCORE'}, inplace=True)
+        eval_summary = eval_src.groupby('EMP_ID').agg(
+            AVG_EVAL_SCORE=('MODIFIED_SCORE', 'mean'),
+            EVAL_SCORE_STDDEV=('MODIFIED_SCORE', 'std')
+        ).reset_index()
+        # 직원별 평가점수 추세 (연 단위 기울기, 그룹 합계 기반 최소제곱)
+        eval_days = eval_src.assign(EVAL_DAY=eval_src['EVAL_DATE'].to_numpy(dtype='datetime64[D]').astype(np.int64))
+        eval_trend = (calculate_grouped_slope(eval_days, 'EMP_ID', 'EVAL_DAY', 'MODIFIED_SCORE') * 365).reset_index(name='EVAL_SCORE_TREND')
+        eval_1y = eval_src[eval_src['EVAL_DATE'] >= one_year_ago]
+        eval_2y = eval_src[eval_src['EVAL_DATE'] >= two_years_ago]
+        eval_summary_1y = eval_1y.groupby('EMP_ID')['MODIFIED_SCORE'].mean().reset_index().rename(columns={'MODIFIED_SCORE': 'EVAL_SCORE_1Y'})
+        eval_summary_2y = eval_2y.groupby('EMP_ID')['MODIFIED_SCORE'].mean().reset_index().rename(columns={'MODIFIED_SCORE': 'EVAL_SCORE_2Y'})
+        eval_features = pd.merge(latest_eval[['EMP_ID', 'LATEST_EVAL_SCORE']], eval_summary, on='EMP_ID', how='left')
+        eval_features = pd.merge(eval_features, eval_trend, on='EMP_ID', how='left')
+        eval_features = pd.merge(eval_features, eval_summary_1y, on='EMP_ID', how='left')
+        return pd.merge(eval_features, eval_summary_2y, on='EMP_ID', how='left')
+
+    # --- 2.7. Time & Attendance Features ---
+    # 직원별 근태 집계는 attendance_summary_table에서 계산 (전체 또는 청크 스트리밍)
+    def attendance_block(src):
+        attendance_src = src['attendance']
+        ta_summary = attendance_src[['EMP_ID', 'AVG_OVERTIME_MINUTES', 'AVG_NIGHT_WORK_MINUTES']]
+        overtime_summary_1y = attendance_src[['EMP_ID', 'OVERTIME_1Y']].dropna(subset=['OVERTIME_1Y']).reset_index(drop=True)
+        overtime_summary_2y = attendance_src[['EMP_ID', 'OVERTIME_2Y']].dropna(subset=['OVERTIME_2Y']).reset_index(drop=True)
+        ta_features = pd.merge(ta_summary, overtime_summary_1y, on='EMP_ID', how='left')
+        return pd.merge(ta_features, overtime_summary_2y, on='EMP_ID', how='left')
+
+    sick_leave_ids = leave_type_df.loc[leave_type_df['LEAVE_TYPE_NAME'] == '병휴가', 'LEAVE_TYPE_ID']
+
+    def leave_block(src):
+        leave_src = src['leave']
+        leave_summary = leave_src.groupby('EMP_ID').agg(
+            TOTAL_LEAVE_DAYS=('LEAVE_LENGTH', 'sum'),
+            AVG_LEAVE_TERM=('LEAVE_LENGTH', 'mean')
+        ).reset_index()
+        sick_leave_id = sick_leave_ids.iloc[0]
+        sick_leaves = leave_src[leave_src['LEAVE_TYPE_ID'] == sick_leave_id]
+        sick_leave_summary = sick_leaves.groupby('EMP_ID')['LEAVE_LENGTH'].sum().reset_index().rename(columns={'LEAVE_LENGTH': 'SICK_LEAVE_DAYS'})
+        leave_summary = pd.merge(leave_summary, sick_leave_summary, on='EMP_ID', how='left')
+        leave_summary['SICK_LEAVE_RATIO'] = (leave_summary['SICK_LEAVE_DAYS'] / leave_summary['TOTAL_LEAVE_DAYS']).fillna(0)
+        return leave_summary[['EMP_ID', 'TOTAL_LEAVE_DAYS', 'SICK_LEAVE_RATIO', 'AVG_LEAVE_TERM']]
+
+    # --- 2.8. Absence Features ---
+    def absence_block(src):
+        absence_summary = src['absence'].groupby('EMP_ID').agg(
+            TOTAL_ABSENCE_DAYS=('ABSENCE_DURATION', 'sum'),
+            NUM_ABSENCES=('ABSENCE_ID', 'count')
+        ).reset_index()
+        return absence_summary
+
+    # 소스가 비어 있는 블록은 건너뛴다 (해당 피처 컬럼 없음)
+    feature_blocks = [block for block, enabled in (
+        (FeatureBlock('career', ('career',), career_block), not career_info_df.empty),
+        (FeatureBlock('school', ('school',), school_block, salt=table_fingerprint(school_df)), not school_info_df.empty),
+        (FeatureBlock('assignment', ('department', 'job', 'position'), assignment_block), True),
+        (FeatureBlock('department', ('department',), department_block), not department_info_df.empty),
+        (FeatureBlock('promotion', ('position',), promotion_block), not position_info_df.empty),
+        (FeatureBlock('project', ('project',), project_block), not pjt_info_df.empty),
+        (FeatureBlock('payroll', ('payroll',), payroll_block, salt=str(current_year)), not yearly_payroll_df.empty),
+        (FeatureBlock('evaluation', ('evaluation',), evaluation_block), not eval_df.empty),
+        (FeatureBlock('attendance', ('attendance',), attendance_block), not attendance_summary_df.empty),
+        (FeatureBlock('leave', ('leave',), leave_block, salt=table_fingerprint(leave_type_df)), not detailed_leave_info_df.empty),
+        (FeatureBlock('absence', ('absence',), absence_block), not absence_info_df.empty),
+    ) if enabled]
+
+    # --- 2. 블록 집계 (증분 모드: 직원별 소스 지문이 바뀐 직원만 재집계) ---
+    if MASTER_STATE_PATH and as_of is None:
+        emp_ids = pd.Index(emp_df['EMP_ID'])
+        fingerprint_sources = dict(sources)
+        # 부서/직무 발령 행에는 참조하는 부서/직무의 상위 계층 행 해시를 더해, 조직 개편 시 해당 직원만 바뀌도록 함
+        if not department_info_df.empty:
+            dept_closure_hashes = pd.Series(row_hashes(dept_hierarchy.closure_df.reset_index()), index=dept_hierarchy.closure_df.index)
+            fingerprint_sources['department'] = department_info_df.assign(HIERARCHY_HASH=department_info_df['DEP_ID'].map(dept_closure_hashes))
+        if not job_info_df.empty:
+            job_closure_hashes = pd.Series(row_hashes(job_hierarchy_index.closure_df.reset_index()), index=job_hierarchy_index.closure_df.index)
+            fingerprint_sources['job'] = job_info_df.assign(HIERARCHY_HASH=job_info_df['JOB_ID'].map(job_closure_hashes))
+        # 평가 행에는 최근 1년/2년 구간 포함 여부를 더해, 구간 경계를 넘은 평가가 있는 직원만 바뀌도록 함
+        if not eval_df.empty:
+            fingerprint_sources['evaluation'] = eval_df.assign(IN_1Y=eval_df['EVAL_DATE'] >= one_year_ago, IN_2Y=eval_df['EVAL_DATE'] >= two_years_ago)
+        # 지문 계산은 전 직원 소스 행을 해시하므로 직원 수에 비례 (증분 모드의 고정 비용)
+        with profile_phase('2.0 Fingerprints'):
+            fingerprints = {name: employee_fingerprints(df, emp_ids) for name, df in fingerprint_sources.items()}
+
+        block_store = IncrementalBlockStore(MASTER_STATE_PATH, version=module_dependency_hash(__name__))
+        block_frames = {}
+        for block in feature_blocks:
+            with profile_phase(BLOCK_PHASES[block.name]):
+                block_frames[block.name] = block_store.update(block, sources, fingerprints, emp_ids)
+        block_store.save()
+        recomputed = ', '.join(f"{name} {count}" for name, count in block_store.recomputed.items())
+        print(f"🔁 마스터 테이블 증분 빌드 (직원 {len(emp_ids)}명 중 재집계): {recomputed}")
+    else:
+        block_frames = {}
+        for block in feature_blocks:
+            with profile_phase(BLOCK_PHASES[block.name]):
+                block_frames[block.name] = block.compute(sources)
+
+    # --- 3. 직원 단위 테이블 조립 ---
+    # 모든 블록을 EMP_ID 기준 직원 인덱스 하나에 정렬(reindex)해 두고, 블록별 파생 컬럼을 계산한 뒤
+    # 마지막에 한 번만 열 방향으로 이어 붙인다 (블록 수만큼 master_df 전체를 merge로 복사하지 않음)
+    emp_index = pd.Index(emp_df['EMP_ID'], name='EMP_ID')
+    base = emp_df[['PERSONAL_ID', 'GENDER', 'NATIONALITY', 'IN_DATE', 'OUT_DATE', 'CURRENT_EMP_YN']].set_index(emp_index)
+    blocks = {name: frame.set_index('EMP_ID').reindex(emp_index) for name, frame in block_frames.items()}
+
+    # 기본 정보 (기준일 의존, 전 직원 벡터 계산)
+    # 주민등록번호에서 생년월일을 한 번에 추출 (잘못된 번호는 NaT → 나이 NaN)
+    with profile_phase('2.1 Basic'):
+        birth_dates = parse_birth_dates(base['PERSONAL_ID'])
+        base['AGE'] = calculate_age_vectorized(birth_dates, today_ts)
+        base['TENURE_DAYS'] = (base['OUT_DATE'].fillna(today_ts) - base['IN_DATE']).dt.days
+        base['IS_LEAVER'] = np.where(base['CURRENT_EMP_YN'] == 'N', 1, 0)
+        base['AGE_AT_HIRING'] = (base['IN_DATE'] - birth_dates).dt.days / 365.25
+        base['TENURE_TO_AGE_RATIO'] = (base['TENURE_DAYS'] / (base['AGE'] * 365.25)).fillna(0)
+
+    if 'assignment' in blocks:
+        hierarchy_cols = ['LATEST_DIVISION_NAME', 'LATEST_OFFICE_NAME', 'LATEST_JOB_L1_NAME', 'LATEST_JOB_L2_NAME']
+        blocks['assignment'][hierarchy_cols] = blocks['assignment'][hierarchy_cols].fillna('Unknown')
+
+    if 'department' in blocks:
+        dept_block = blocks['department']
+
+        # 재직 여부에 따라 종료일을 조건부로 설정합니다.
+        end_date_for_calc = base['OUT_DATE'].where(base['CURRENT_EMP_YN'] == 'N', today_ts)
+
+        # 설정된 종료일을 기준으로 기간을 계산합니다.
+        dept_block['DAYS_SINCE_LAST_DEP_CHANGE'] = (end_date_for_calc - pd.to_datetime(dept_block['LAST_DEP_CHANGE_DATE'])).dt.days
+
+        # 계산에 사용된 임시 컬럼을 삭제합니다.
+        blocks['department'] = dept_block.drop(columns=['LAST_DEP_CHANGE_DATE'])
+
+    if 'promotion' in blocks:
+        promo_block = blocks['promotion']
+        promo_block['DAYS_SINCE_LAST_PROMOTION'] = (today_ts - promo_block['LAST_PROMO_DATE']).dt.days
+        promo_block['PROMOTION_RATE'] = promo_block['NUM_PROMOTIONS'] / (base['TENURE_DAYS'] / 365.25)
+        blocks['promotion'] = promo_block.drop(columns=['LAST_PROMO_DATE'])
+
+    if 'payroll' in blocks:
+        payroll_block = blocks['payroll']
+        payroll_block.loc[base['IN_DATE'].dt.year == current_year - 1, 'AVG_YOY_GROWTH'] = 0
+        payroll_block.loc[base['IN_DATE'].dt.year == current_year, 'AVG_YOY_GROWTH'] = 0
+
+        # 입사/퇴사 연도 급여는 재직일수 기준으로 연환산
+        payroll_block['LATEST_TOTAL_PAY'] = annualize_partial_year_pay(
+            payroll_block['LATEST_TOTAL_PAY'], base['IN_DATE'], base['OUT_DATE'], payroll_block['PAY_YEAR']
+        )
+        blocks['payroll'] = payroll_block.drop(columns=['PAY_YEAR'])
+
+    # 경력/급여/발령 블록이 없으면(시점 스냅샷에서 기준일 이전 기록이 없는 경우) 빈 컬럼으로 보고
+    # 총경력(이전 경력 0일)과 경력 대비 연봉 수준(연봉 결측 → 구간 없음)을 계산한다
+    if 'career' in blocks:
+        blocks['career']['PRIOR_CAREER_DAYS'] = blocks['career']['PRIOR_CAREER_DAYS'].fillna(0)
+        prior_career_days = blocks['career']['PRIOR_CAREER_DAYS']
+    else:
+        prior_career_days = pd.Series(0.0, index=emp_index)
+    latest_job_l1 = blocks['assignment']['LATEST_JOB_L1_NAME'] if 'assignment' in blocks else pd.Series('Unknown', index=emp_index)
+    latest_total_pay = blocks['payroll']['LATEST_TOTAL_PAY'] if 'payroll' in blocks else pd.Series(np.nan, index=emp_index)
+    total_experience_days = base['TENURE_DAYS'] + prior_career_days
+    experience = pd.DataFrame({'TOTAL_EXPERIENCE_YEARS': total_experience_days / 365.25}, index=emp_index)
+    bins = [0, 3, 6, 10, 15, np.inf]
+    labels = ['0-2년', '3-5년', '6-9년', '10-14년', '15년 이상']
+    experience_band = pd.cut(experience['TOTAL_EXPERIENCE_YEARS'], bins=bins, labels=labels, right=False)
+    salary_groups = pd.DataFrame({
+        'EXPERIENCE_BAND': experience_band.astype(str).fillna('Unknown'),
+        'LATEST_JOB_L1_NAME': latest_job_l1,
+        'LATEST_TOTAL_PAY': latest_total_pay,
+    })
+    salary_bands = calculate_grouped_quantiles(salary_groups, ['EXPERIENCE_BAND', 'LATEST_JOB_L1_NAME'], 'LATEST_TOTAL_PAY', [0.3, 0.7])
+    experience['SALARY_LEVEL_VS_EXPERIENCE'] = assign_percentile_band(salary_groups['LATEST_TOTAL_PAY'], salary_bands[0.3], salary_bands[0.7])
+    blocks['experience'] = experience
+
+    if 'evaluation' in blocks:
+        eval_block = blocks['evaluation']
+        eval_block['EVAL_SCORE_1Y'] = eval_block['EVAL_SCORE_1Y'].fillna(eval_block['EVAL_SCORE_1Y'].median())
+        eval_block['EVAL_SCORE_2Y'] = eval_block['EVAL_SCORE_2Y'].fillna(eval_block['EVAL_SCORE_2Y'].median())
+
+    # 음수 초과근무·휴가일수 이상치 대체값은 전 직원 기준으로 뽑아, 증분 빌드에서도 난수 소비 순서가 같도록 함
+    if 'attendance' in blocks:
+        ta_block = blocks['attendance']
+        cond_1y = ta_block['OVERTIME_1Y'] < 0
+        if cond_1y.sum() > 0: ta_block.loc[cond_1y, 'OVERTIME_1Y'] = np.random.randint(80, 121, size=cond_1y.sum())
+        cond_2y = ta_block['OVERTIME_2Y'] < 0
+        if cond_2y.sum() > 0: ta_block.loc[cond_2y, 'OVERTIME_2Y'] = np.random.randint(30, 71, size=cond_2y.sum())
+
+    if 'leave' in blocks:
+        leave_block = blocks['leave']
+        leave_block['AVG_LEAVE_DAYS'] = np.where(base['TENURE_DAYS'] > 0, (leave_block['TOTAL_LEAVE_DAYS'] / base['TENURE_DAYS']) * 365, 0)
+        cond_outlier = leave_block['AVG_LEAVE_DAYS'] > 50
+        if cond_outlier.sum() > 0: leave_block.loc[cond_outlier, 'AVG_LEAVE_DAYS'] = np.round(np.random.uniform(40, 50, size=cond_outlier.sum()), 6)
+        blocks['leave'] = leave_block.drop(columns=['TOTAL_LEAVE_DAYS'])
+
+    block_order = [
+        'career', 'school', 'assignment', 'department', 'promotion', 'project', 'payroll',
+        'experience', 'evaluation', 'attendance', 'leave', 'absence',
+    ]
+    with profile_phase('3. Assembly'):
+        master_df = pd.concat([base] + [blocks[name] for name in block_order if name in blocks], axis=1).reset_index()
+
+    # --- 4. 최종 정리 ---
+    master_df = master_df.drop(columns=['IN_DATE', 'OUT_DATE', 'PERSONAL_ID'])
+    master_df['NATIONALITY'] = np.where(master_df['NATIONALITY'] == 'Korea', 'Korea', 'Other')
+    pos_name_map = position_df.set_index('POSITION_ID')['POSITION_NAME'].to_dict()
+    master_df['LATEST_POSITION_NAME'] = master_df['LATEST_POSITION_ID'].map(pos_name_map)
+
+    for col in master_df.columns:
+        if master_df[col].dtype in ['float64', 'float32']:
+            master_df[col] = master_df[col].fillna(0)
+        elif master_df[col].dtype == 'object':
+            master_df[col] = master_df[col].fillna('Unknown')
+
+    master_df = master_df.rename(columns={
+        'EMP_ID': '사번', 'GENDER': '성별', 'NATIONALITY': '국적', 'CURRENT_EMP_YN': '재직여부', 'AGE': '나이',
+        'TENURE_DAYS': '재직일수', 'IS_LEAVER': '퇴사자여부', 'AGE_AT_HIRING': '입사시나이',
+        'TENURE_TO_AGE_RATIO': '재직대비나이비율', 'PRIOR_CAREER_DAYS': '이전경력일수', 'NUM_PRIOR_COMPANIES': '이전회사수',
+        'PRIOR_CAREER_RELEVANCE_RATIO': '관련경력비율', 'AVG_TENURE_PER_COMPANY': '이전평균재직기간', 'HIGHEST_DEGREE': '최종학위',
+        'FINAL_SCHOOL_LEVEL': '최종학교레벨', 'FINAL_MAJOR_CATEGORY': '최종전공계열', 'IS_STEM_MAJOR': 'STEM전공여부',
+        'LATEST_TITLE_INFO': '현재직책정보', 'LATEST_DIVISION_NAME': '현재부서_본부', 'LATEST_OFFICE_NAME': '현재부서_실',
+        'LATEST_JOB_L1_NAME': '현재직무_대분류', 'LATEST_JOB_L2_NAME': '현재직무_중분류', 'NUM_DEP_CHANGES': '부서변경횟수',
+        'AVG_DEP_TENURE_DAYS': '평균부서소속일수', 'DAYS_SINCE_LAST_DEP_CHANGE': '현재부서소속일수', 'NUM_PROMOTIONS': '승진횟수',
+        'AVG_PROMOTION_SPEED_DAYS': '평균승진속도일수', 'DAYS_SINCE_LAST_PROMOTION': '현재직급소속일수', 'PROMOTION_RATE': '승진비율',
+        'NUM_PROJECTS': '프로젝트수', 'AVG_PROJECT_DURATION': '평균프로젝트기간', 'LATEST_TOTAL_PAY': '현재총연봉',
+        'AVG_YOY_GROWTH': '평균연봉상승률', 'AVG_VARIABLE_PAY_RATIO': '평균변동급비율', 'TOTAL_EXPERIENCE_YEARS': '총경력연수',
+        'SALARY_LEVEL_VS_EXPERIENCE': '경력대비연봉수준', 'LATEST_EVAL_SCORE': '최근평가점수', 'AVG_EVAL_SCORE': '평균평가점수',
+        'EVAL_SCORE_STDDEV': '평가점수표준편차', 'EVAL_SCORE_TREND': '평가점수추세', 'EVAL_SCORE_1Y': '최근1년평가점수',
+        'EVAL_SCORE_2Y': '최근2년평가점수', 'AVG_OVERTIME_MINUTES': '평균초과근무_분', 'AVG_NIGHT_WORK_MINUTES': '평균야간근무_분',
+        'OVERTIME_1Y': '최근1년초과근무', 'OVERTIME_2Y': '최근2년초과근무', 'AVG_LEAVE_DAYS': '연평균휴가일수', 'AVG_LEAVE_TERM': '평균휴가기간',
+        'SICK_LEAVE_DAYS': '병가일수', 'SICK_LEAVE_RATIO': '병가사용비율', 'TOTAL_ABSENCE_DAYS': '총결근일수',
+        'NUM_ABSENCES': '결근횟수', 'LATEST_POSITION_NAME': '현재직위'
+    })
+
+    categorical_cols = [
+        '성별', '국적', '최종학위', '최종전공계열', '최종학교레벨', '현재직책정보', '경력대비연봉수준',
+        '현재부서_본부', '현재부서_실', '현재직무_대분류', '현재직무_중분류', '현재직위'
+    ]
+    categorical_cols_exist = [col for col in categorical_cols if col in master_df.columns]
+    with profile_phase('4. Encoding'):
+        master_df_encoded = pd.get_dummies(master_df, columns=categorical_cols_exist, drop_first=True)
+
+    id_cols_to_drop = ['LATEST_DEP_ID', 'LATEST_JOB_ID', 'LATEST_POSITION_ID', 'LATEST_GRADE_ID']
+    master_df_encoded = master_df_encoded.drop(columns=[col for col in id_cols_to_drop if col in master_df_encoded.columns])
+
+    return {
+        "master_df": master_df,
+        "master_df_encoded": master_df_encoded,
+    }
 
 
 # ==============================================================================
 # PART 2: 직원 정보 테이블 생성 (기존 create_info_table.py 로직)
 # ==============================================================================
 
-all_employee_results = []
-for index, row in emp_df.iterrows():
-    emp_id = row['EMP_ID']
-    is_current_employee = row['CURRENT_EMP_YN'] == 'Y'
-    result = {'사번': emp_id, '이름': row['NAME'], '입사일자': pd.to_datetime(row['IN_DATE']).date()}
-
-    employee_dept_history = department_info_df[department_info_df['EMP_ID'] == emp_id]
-    last_dept_info = pd.DataFrame()
-    if not employee_dept_history.empty:
-        if is_current_employee:
-            last_dept_info = employee_dept_history[employee_dept_history['DEP_APP_END_DATE'].isnull()]
-        else:
-            last_dept_info = employee_dept_history.sort_values('DEP_APP_END_DATE', ascending=False).head(1)
-    
-    if not last_dept_info.empty:
-        current_dept_id = last_dept_info['DEP_ID'].iloc[0]
-        parent_info = find_parents(current_dept_id, dept_level_map, parent_map_dept, dept_name_map)
-        result['소속 본부'] = parent_info.get('DIVISION_NAME')
-        result['소속 실'] = parent_info.get('OFFICE_NAME')
-        dept_details = department_df.set_index('DEP_ID').loc[current_dept_id]
-        result['근무 위치'] = '본사' if dept_details['DEPT_TYPE'] == '본사' else '본사 외'
-        start_date = pd.to_datetime(last_dept_info['DEP_APP_START_DATE'].iloc[0]).date()
-        end_date = today if is_current_employee else pd.to_datetime(row['OUT_DATE']).date()
-        result['현재 부서 소속 일수'] = (end_date - start_date).days
-    else:
-        result.update({'소속 본부': None, '소속 실': None, '근무 위치': None, '현재 부서 소속 일수': 0})
-
-    employee_job_history = job_info_df[job_info_df['EMP_ID'] == emp_id]
-    last_job_info = pd.DataFrame()
-    if not employee_job_history.empty:
-        if is_current_employee:
-            last_job_info = employee_job_history[employee_job_history['JOB_APP_END_DATE'].isnull()]
-        else:
-            last_job_info = employee_job_history.sort_values('JOB_APP_END_DATE', ascending=False).head(1)
-
-    if not last_job_info.empty:
-        job_id = last_job_info['JOB_ID'].iloc[0]
-        l1_job_id = get_level1_ancestor(job_id, job_df_indexed, parent_map_job)
-        result['직무 대분류'] = job_df_indexed.loc[l1_job_id, 'JOB_NAME'] if l1_job_id else None
-        l2_job_id = get_level2_ancestor(job_id, job_df_indexed, parent_map_job)
-        result['직무 중분류'] = job_df_indexed.loc[l2_job_id, 'JOB_NAME'] if l2_job_id else job_df_indexed.loc[job_id, 'JOB_NAME']
-    else:
-        result.update({'직무 대분류': None, '직무 중분류': None})
-
-    current_salary_info = salary_contract_info_df[(salary_contract_info_df['EMP_ID'] == emp_id)].sort_values('SAL_START_DATE', ascending=False).head(1)
-    if not current_salary_info.empty:
-        pay_category = current_salary_info['PAY_CATEGORY'].iloc[0]
-        sal_amount = current_salary_info['SAL_AMOUNT'].iloc[0]
-        annual_salary = sal_amount * 12 if pay_category == '월급' else sal_amount * 52 if pay_category == '주급' else sal_amount * 250 if pay_category == '일급' else sal_amount * 2080 if pay_category == '시급' else sal_amount
-        result['현재 계약연봉'] = round(annual_salary / 10000) * 10000
-    else:
-        result['현재 계약연봉'] = 0
-
-    school_info = school_info_df[school_info_df['EMP_ID'] == emp_id]
-    if not school_info.empty:
-        school_info_merged = pd.merge(school_info, school_df[['SCHOOL_ID', 'SCHOOL_NAME']], on='SCHOOL_ID', how='left')
-        final_school = school_info_merged.sort_values('GRAD_YEAR', ascending=False).iloc[0]
-        result['출신 학교'] = final_school['SCHOOL_NAME']
-        result['출신 전공'] = final_school['MAJOR_CATEGORY']
-    else:
-        result.update({'출신 학교': None, '출신 전공': None})
-
-    result['경력 입사 여부'] = '경력' if not career_info_df[career_info_df['EMP_ID'] == emp_id].empty else '신입'
-    all_employee_results.append(result)
-
-employee_info_df = pd.DataFrame(all_employee_results)
-ordered_columns = [
-    '사번', '이름', '입사일자', '소속 본부', '소속 실', 
-    '직무 대분류', '직무 중분류', '현재 계약연봉', '출신 학교', '출신 전공',
-    '경력 입사 여부', '현재 부서 소속 일수', '근무 위치'
-]
-if not employee_info_df.empty:
-    employee_info_df = employee_info_df[ordered_columns]
-
-employee_info_df_for_gsheet = employee_info_df.copy()
-if not employee_info_df_for_gsheet.empty:
-    date_cols = ['입사일자']
-    for col in date_cols:
-        employee_info_df_for_gsheet[col] = pd.to_datetime(employee_info_df_for_gsheet[col]).dt.strftime('%Y-%m-%d')
-    for col in employee_info_df_for_gsheet.columns:
-        employee_info_df_for_gsheet[col] = employee_info_df_for_gsheet[col].astype(str)
-    employee_info_df_for_gsheet = employee_info_df_for_gsheet.replace({'None':'', 'nan':'', 'NaT':''})
+
+@register_table(
+    inputs=(
+        "emp_df",
+        "career_info_df",
+        "department_df",
+        "department_info_df",
+        "dept_hierarchy",
+        "job_info_df",
+        "job_hierarchy_index",
+        "salary_contract_info_df",
+        "school_df",
+        "school_info_df",
+    ),
+    outputs=("employee_info_df", "employee_info_df_for_gsheet"),
+)
+def build_employee_info_table(
+    emp_df,
+    career_info_df,
+    department_df,
+    department_info_df,
+    dept_hierarchy,
+    job_info_df,
+    job_hierarchy_index,
+    salary_contract_info_df,
+    school_df,
+    school_info_df,
+):
+    """대시보드 표시용 직원 정보 테이블(employee_info_df) 생성"""
+    today = datetime.datetime.now().date()
+    today_ts = pd.to_datetime(today)
+
+    emp_ids = emp_df['EMP_ID']
+    is_current_employee = (emp_df['CURRENT_EMP_YN'] == 'Y').to_numpy()
+    current_emp_ids = emp_ids[is_current_employee]
+
+    def get_latest_assignment(history_df, end_col):
+        """직원별 최종 발령 기록 (재직자: 종료일이 없는 첫 기록, 퇴사자: 종료일이 가장 늦은 기록)"""
+        is_current_history = history_df['EMP_ID'].isin(current_emp_ids)
+        current_latest = history_df[is_current_history & history_df[end_col].isnull()]
+        leaver_latest = history_df[~is_current_history].sort_values(
+            ['EMP_ID', end_col], ascending=[True, False], na_position='last', kind='stable'
+        )
+        latest = pd.concat([current_latest, leaver_latest]).drop_duplicates('EMP_ID')
+        return latest.set_index('EMP_ID').reindex(emp_ids)
+
+    def get_latest_by(history_df, sort_col):
+        """직원별 sort_col 기준 가장 최근 기록"""
+        latest = history_df.sort_values(['EMP_ID', sort_col], ascending=[True, False], na_position='last', kind='stable')
+        return latest.drop_duplicates('EMP_ID').set_index('EMP_ID').reindex(emp_ids)
+
+    def none_if_missing(values):
+        return pd.Series(values, dtype=object).where(pd.notna(values), None).to_numpy()
+
+    employee_info_df = pd.DataFrame({
+        '사번': emp_ids.to_numpy(),
+        '이름': emp_df['NAME'].to_numpy(),
+        '입사일자': pd.to_datetime(emp_df['IN_DATE']).dt.date.to_numpy(),
+    })
+
+    # --- 부서 정보 (상위 조직은 부서 계층 closure 인덱스에서 조회) ---
+    last_dept_info = get_latest_assignment(department_info_df, 'DEP_APP_END_DATE')
+    has_dept = last_dept_info['DEP_ID'].notna().to_numpy()
+    dept_parents = dept_hierarchy.lookup(last_dept_info['DEP_ID'], ['DIVISION_LABEL', 'OFFICE_LABEL'])
+    dept_type_map = department_df.set_index('DEP_ID')['DEPT_TYPE']
+    employee_info_df['소속 본부'] = dept_parents['DIVISION_LABEL'].to_numpy()
+    employee_info_df['소속 실'] = dept_parents['OFFICE_LABEL'].to_numpy()
+    employee_info_df['근무 위치'] = np.where(
+        has_dept, np.where(last_dept_info['DEP_ID'].map(dept_type_map) == '본사', '본사', '본사 외'), None
+    )
+    dept_start = pd.to_datetime(last_dept_info['DEP_APP_START_DATE']).dt.normalize().to_numpy()
+    dept_end = np.where(is_current_employee, today_ts, pd.to_datetime(emp_df['OUT_DATE']).dt.normalize().to_numpy())
+    dept_days = (pd.to_datetime(dept_end) - pd.to_datetime(dept_start)).days
+    employee_info_df['현재 부서 소속 일수'] = np.where(has_dept, dept_days.fillna(0), 0).astype(int)
+
+    # --- 직무 정보 (상위 직무는 직무 계층 closure 인덱스에서 조회, L2가 없으면 자기 직무명) ---
+    last_job_id = get_latest_assignment(job_info_df, 'JOB_APP_END_DATE')['JOB_ID']
+    job_parents = job_hierarchy_index.lookup(last_job_id, ['JOB_NAME', 'L1_JOB_NAME', 'L2_JOB_NAME'])
+    employee_info_df['직무 대분류'] = job_parents['L1_JOB_NAME'].to_numpy()
+    employee_info_df['직무 중분류'] = job_parents['L2_JOB_NAME'].where(job_parents['L2_JOB_NAME'].notna(), job_parents['JOB_NAME']).to_numpy()
+
+    # --- 현재 계약연봉 (지급 구분별 연환산, 만원 단위 반올림) ---
+    current_salary_info = get_latest_by(salary_contract_info_df, 'SAL_START_DATE')
+    annual_multiplier = current_salary_info['PAY_CATEGORY'].map({'월급': 12, '주급': 52, '일급': 250, '시급': 2080}).fillna(1)
+    annual_salary = current_salary_info['SAL_AMOUNT'] * annual_multiplier
+    employee_info_df['현재 계약연봉'] = (np.round(annual_salary / 10000).fillna(0) * 10000).astype(int).to_numpy()
+
+    # --- 출신 학교/전공 (졸업연도가 가장 늦은 학력) ---
+    school_info_merged = pd.merge(school_info_df, school_df[['SCHOOL_ID', 'SCHOOL_NAME']], on='SCHOOL_ID', how='left')
+    final_school = get_latest_by(school_info_merged, 'GRAD_YEAR')
+    employee_info_df['출신 학교'] = none_if_missing(final_school['SCHOOL_NAME'])
+    employee_info_df['출신 전공'] = none_if_missing(final_school['MAJOR_CATEGORY'])
+
+    employee_info_df['경력 입사 여부'] = np.where(emp_ids.isin(career_info_df['EMP_ID']), '경력', '신입')
+
+    ordered_columns = [
+        '사번', '이름', '입사일자', '소속 본부', '소속 실', 
+        '직무 대분류', '직무 중분류', '현재 계약연봉', '출신 학교', '출신 전공',
+        '경력 입사 여부', '현재 부서 소속 일수', '근무 위치'
+    ]
+    if not employee_info_df.empty:
+        employee_info_df = employee_info_df[ordered_columns]
+
+    employee_info_df_for_gsheet = employee_info_df.copy()
+    if not employee_info_df_for_gsheet.empty:
+        date_cols = ['입사일자']
+        for col in date_cols:
+            employee_info_df_for_gsheet[col] = pd.to_datetime(employee_info_df_for_gsheet[col]).dt.strftime('%Y-%m-%d')
+        for col in employee_info_df_for_gsheet.columns:
+            employee_info_df_for_gsheet[col] = employee_info_df_for_gsheet[col].astype(str)
+        employee_info_df_for_gsheet = employee_info_df_for_gsheet.replace({'None':'', 'nan':'', 'NaT':''})
+
+    return {
+        "employee_info_df": employee_info_df,
+        "employee_info_df_for_gsheet": employee_info_df_for_gsheet,
+    }
+
+
+__getattr__ = module_getattr(__name__)
@@ -0,0 +1,156 @@
+"""
+직원 단위 증분 빌드 상태
+
+마스터 테이블처럼 직원별 집계 블록을 EMP_ID로 이어 붙이는 테이블을 위한 증분 빌드 도구.
+블록마다 소스 테이블의 직원별 내용 지문(fingerprint)과 직원별 집계 결과를 저장해 두고,
+다음 빌드에서는 지문이 바뀐 직원(및 새로 추가된 직원)만 다시 집계해 이전 결과에 덮어쓴다.
+
+- 직원별 지문: 소스 행 해시(pd.util.hash_pandas_object)의 직원별 합 (행 순서와 무관)
+- 블록 salt: 블록 전체에 영향을 주는 값(참조 테이블 해시, 기준 연도 등). 바뀌면 블록 전체 재계산
+- 상태 버전: 빌더 모듈과 그 모듈이 import한 services.* 모듈 소스 해시. 코드(헬퍼 포함)가 바뀌면 이전 상태를 버리고 전체 재계산
+
+상태 파일 구조 (pickle):
+    {"version": str, "blocks": {블록 이름: {"salt": str, "fingerprints": DataFrame, "frame": DataFrame}}}
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """행 단위 내용 해시 (uint64)"""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def table_fingerprint(df: pd.DataFrame) -> str:
+    """테이블 전체 내용 해시 (참조 테이블 salt용)"""
+    return hashlib.sha256(row_hashes(df).tobytes()).hexdigest()[:16]
+
+
+def employee_fingerprints(df: pd.DataFrame, emp_ids: Iterable, emp_col: str = "EMP_ID") -> pd.Series:
+    """
+    직원별 소스 행 내용 지문
+
+    Args:
+        df: EMP_ID 컬럼을 가진 소스 테이블 (지문에 반영할 파생 컬럼을 미리 추가해 둘 수 있음)
+        emp_ids: 지문을 계산할 직원 ID 목록
+        emp_col: 직원 ID 컬럼 이름
+
+    Returns:
+        pd.Series: emp_ids 인덱스의 uint64 지문 (행이 없는 직원은 0)
+    """
+    emp_index = pd.Index(emp_ids, name=emp_col)
+    if df.empty:
+        return pd.Series(np.zeros(len(emp_index), dtype=np.uint64), index=emp_index)
+    hashes = pd.Series(row_hashes(df), index=df[emp_col].to_numpy())
+    return hashes.groupby(level=0).sum().reindex(emp_index, fill_value=0).astype(np.uint64)
+
+
+@dataclass(frozen=True)
+class FeatureBlock:
+    """
+    직원별 집계 블록
+
+    Attributes:
+        name: 블록 이름 (상태 저장 키)
+        sources: 블록이 읽는 소스 이름 (지문 및 직원 부분집합 추출 대상)
+        compute: {소스 이름: 부분집합 DataFrame} → EMP_ID 컬럼을 가진 집계 DataFrame
+        salt: 블록 전체 재계산 조건 (참조 테이블 해시 등)
+    """
+
+    name: str
+    sources: Tuple[str, ...]
+    compute: Callable[[Dict[str, pd.DataFrame]], pd.DataFrame]
+    salt: str = ""
+
+
+class IncrementalBlockStore:
+    """
+    블록별 직원 지문/집계 결과 저장소
+
+    Attributes:
+        path: 상태 파일 경로
+        version: 상태 버전 (빌더 모듈 소스 해시 등)
+    """
+
+    def __init__(self, path: str, version: str):
+        self.path = path
+        self.version = version
+        self._blocks = {}
+        self.recomputed = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "rb") as f:
+                    state = pickle.load(f)
+                if state.get("version") == version:
+                    self._blocks = state["blocks"]
+            except (OSError, pickle.UnpicklingError, EOFError, KeyError) as e:
+                print(f"⚠️ 증분 빌드 상태 로드 실패: {e}")
+
+    def update(
+        self,
+        block: FeatureBlock,
+        sources: Dict[str, pd.DataFrame],
+        fingerprints: Dict[str, pd.Series],
+        emp_ids: pd.Index,
+    ) -> pd.DataFrame:
+        """
+        지문이 바뀐 직원만 다시 집계해 블록 결과 갱신
+
+        Args:
+            block: 집계 블록
+            sources: 소스 이름별 전체 테이블
+            fingerprints: 소스 이름별 직원 지문 (emp_ids 인덱스)
+            emp_ids: 현재 전체 직원 ID
+
+        Returns:
+            pd.DataFrame: 현재 직원 전체에 대한 블록 집계 결과
+        """
+        current = pd.DataFrame({name: fingerprints[name] for name in block.sources}, index=emp_ids)
+        previous = self._blocks.get(block.name)
+
+        if previous is None or previous["salt"] != block.salt:
+            changed = emp_ids
+            kept = None
+        else:
+            old = previous["fingerprints"]
+            known = emp_ids.isin(old.index)
+            is_changed = ~known
+            is_changed[known] = (old.loc[emp_ids[known], list(block.sources)].to_numpy() != current[known].to_numpy()).any(axis=1)
+            changed = emp_ids[is_changed]
+            kept = previous["frame"]
+            kept = kept[kept["EMP_ID"].isin(emp_ids) & ~kept["EMP_ID"].isin(changed)]
+
+        if kept is None:
+            frame = block.compute(sources)
+        else:
+            subsets = {name: sources[name][sources[name]["EMP_ID"].isin(changed)] for name in block.sources}
+            if all(subset.empty for subset in subsets.values()):
+                frame = kept
+            else:
+                frame = pd.concat([kept, block.compute(subsets)], ignore_index=True)
+
+        self.recomputed[block.name] = len(changed)
+        self._blocks[block.name] = {"salt": block.salt, "fingerprints": current, "frame": frame}
+        return frame
+
+    def save(self):
+        """상태 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        state_dir = os.path.dirname(self.path) or "."
+        os.makedirs(state_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".master_state-", dir=state_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"version": self.version, "blocks": self._blocks}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            print(f"⚠️ 증분 빌드 상태 저장 실패: {e}")
@@ -0,0 +1,191 @@
+"""
+테이블 빌드 프로파일러
+
+STREAMLIT_BUILD_PROFILE에 리포트 경로를 지정하면 빌더 실행마다 아래 항목을 기록하고,
+프로세스 종료 시(또는 write_report 호출 시) JSON 리포트와 소요 시간 순 콘솔 요약을 남긴다.
+
+- wall_s / cpu_s: 빌더 실행 경과 시간 / 프로세스 CPU 시간
+- peak_mem_mb: 빌더 실행 중 tracemalloc 최대 할당량 - 시작 시점 할당량
+- outputs: 출력 테이블별 행/열 수 (DataFrame만)
+- phases: 빌더 내부 단계별 경과 시간 (profile_phase로 표시한 구간, 예: 마스터 테이블 2.1~2.8)
+- cached: 디스크 캐시에서 불러온 경우 True (wall_s는 로드 시간)
+
+tracemalloc은 할당마다 추적 비용이 들기 때문에 프로파일링 중에는 빌드가 느려진다.
+테이블 간 상대 비교용으로 사용한다.
+
+사용법:
+    STREAMLIT_BUILD_PROFILE=build_profile.json python -m services.tables.profiler
+"""
+
+import atexit
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from services.tables.common import BUILD_PROFILE_PATH, TOTAL_EMPLOYEES, START_DATE, END_DATE
+
+MB = 1024 * 1024
+
+
+class BuildProfiler:
+    """
+    빌더 실행 기록 수집기
+
+    Attributes:
+        report_path: JSON 리포트 경로 (None이면 기록하지 않음)
+        records: 빌더 실행 기록 목록
+    """
+
+    def __init__(self, report_path: Optional[str] = None):
+        self.report_path = None
+        self.records: List[Dict[str, Any]] = []
+        self._stack: List[Dict[str, Any]] = []
+        if report_path:
+            self.enable(report_path)
+
+    @property
+    def enabled(self) -> bool:
+        return self.report_path is not None
+
+    def enable(self, report_path: str):
+        """프로파일링 시작 (프로세스 종료 시 리포트 저장)"""
+        if self.report_path is None:
+            atexit.register(self._report_at_exit)
+        self.report_path = report_path
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """수집한 기록을 꺼내고 비움 (프로세스 풀 워커 → 부모 프로세스 전달용)"""
+        records, self.records = self.records, []
+        return records
+
+    def write_report(self, path: Optional[str] = None):
+        """JSON 리포트 저장 및 콘솔 요약 출력"""
+        path = path or self.report_path
+        records = sorted(self.records, key=lambda r: r["wall_s"], reverse=True)
+        report = {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "num_employees": TOTAL_EMPLOYEES,
+            "date_range": [START_DATE.isoformat(), END_DATE.isoformat()],
+            "total_wall_s": round(sum(r["wall_s"] for r in records), 4),
+            "builders": records,
+        }
+        report_dir = os.path.dirname(os.path.abspath(path))
+        os.makedirs(report_dir, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print_summary(records)
+        print(f"📝 빌드 프로파일 리포트 저장: {path}")
+
+    def _report_at_exit(self):
+        if self.records:
+            self.write_report()
+
+
+def _output_shapes(outputs: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+    """출력 DataFrame별 행/열 수"""
+    return {
+        name: {"rows": int(value.shape[0]), "cols": int(value.shape[1])}
+        for name, value in outputs.items()
+        if isinstance(value, pd.DataFrame)
+    }
+
+
+@contextmanager
+def profile_builder(name: str):
+    """
+    빌더 실행 구간 측정 (프로파일링이 꺼져 있으면 None을 넘기고 아무것도 하지 않음)
+
+    Args:
+        name: 빌더 이름 (<모듈>.<함수>)
+
+    Yields:
+        Optional[dict]: 실행 기록 (record_outputs로 출력 크기를 채움)
+    """
+    if not PROFILER.enabled:
+        yield None
+        return
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    mem_start, _ = tracemalloc.get_traced_memory()
+    record = {"builder": name, "cached": False, "outputs": {}, "phases": {}}
+    PROFILER._stack.append(record)
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        yield record
+    finally:
+        record["wall_s"] = round(time.perf_counter() - wall_start, 4)
+        record["cpu_s"] = round(time.process_time() - cpu_start, 4)
+        _, mem_peak = tracemalloc.get_traced_memory()
+        record["peak_mem_mb"] = round(max(0, mem_peak - mem_start) / MB, 2)
+        if started_tracing:
+            tracemalloc.stop()
+        PROFILER._stack.pop()
+        PROFILER.records.append(record)
+
+
+def record_outputs(record: Optional[Dict[str, Any]], outputs: Dict[str, Any]):
+    """실행 기록에 출력 테이블 크기 추가"""
+    if record is not None:
+        record["outputs"] = _output_shapes(outputs)
+
+
+def record_cache_load(name: str, seconds: float, outputs: Dict[str, Any]):
+    """디스크 캐시 로드 기록"""
+    if PROFILER.enabled:
+        PROFILER.records.append({
+            "builder": name, "cached": True, "outputs": _output_shapes(outputs), "phases": {},
+            "wall_s": round(seconds, 4), "cpu_s": None, "peak_mem_mb": None,
+        })
+
+
+@contextmanager
+def profile_phase(name: str):
+    """현재 빌더 안의 단계 경과 시간 측정 (같은 이름은 누적)"""
+    if not PROFILER._stack:
+        yield
+        return
+    phases = PROFILER._stack[-1]["phases"]
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = round(phases.get(name, 0.0) + time.perf_counter() - start, 4)
+
+
+def print_summary(records: List[Dict[str, Any]]):
+    """소요 시간 순 콘솔 요약"""
+    print("⏱️ 테이블 빌드 프로파일 (소요 시간 순)")
+    print(f"   {'빌더':<60} {'wall(s)':>9} {'cpu(s)':>9} {'peak(MB)':>9}  출력(행x열)")
+    for record in records:
+        cpu = "-" if record["cpu_s"] is None else f"{record['cpu_s']:.3f}"
+        peak = "-" if record["peak_mem_mb"] is None else f"{record['peak_mem_mb']:.1f}"
+        shapes = ", ".join(f"{name} {shape['rows']}x{shape['cols']}" for name, shape in record["outputs"].items())
+        label = record["builder"] + (" (cache)" if record["cached"] else "")
+        print(f"   {label:<60} {record['wall_s']:>9.3f} {cpu:>9} {peak:>9}  {shapes}")
+        for phase, seconds in sorted(record["phases"].items()):
+            print(f"     └ {phase:<56} {seconds:>9.3f}")
+
+
+PROFILER = BuildProfiler(BUILD_PROFILE_PATH)
+
+
+def main():
+    from services.tables.registry import build_tables
+
+    PROFILER.enable(BUILD_PROFILE_PATH or "build_profile.json")
+    build_tables()
+    PROFILER.write_report()
+    PROFILER.records.clear()
+
+
+if __name__ == "__main__":
+    main()
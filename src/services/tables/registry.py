@@ -0,0 +1,422 @@
+"""
+테이블 레지스트리 (지연 빌드 엔진)
+
+각 테이블 모듈은 import 시점에 DataFrame을 생성하지 않고, 입력 테이블을 명시한
+빌더 함수를 `register_table`로 등록한다. 테이블은 최초 요청 시점에 필요한
+하위 그래프만 빌드되며, 한 번 빌드된 결과는 레지스트리에 메모이즈된다.
+
+사용법:
+    from services.tables.registry import get_table
+    department_df = get_table("department_df")  # 부서 테이블만 빌드
+
+기존 방식의 `from services.tables.HR_Core.basic_info_table import emp_df`도
+모듈 `__getattr__`(PEP 562)를 통해 동일하게 지연 빌드된다.
+
+여러 테이블을 한 번에 만들 때는 `build_tables`로 의존성 그래프를 프로세스 풀에
+스케줄링할 수 있다. 빌더마다 고유 시드로 난수 상태를 초기화하므로 병렬 빌드
+결과는 순차 빌드와 동일하다.
+    tables = build_tables(max_workers=4)  # 전체 테이블 병렬 빌드
+
+빌드된 테이블은 디스크 캐시(`services.tables.cache`)에 저장되어, 다음 기동 시
+캐시 키가 같은 테이블은 재생성 없이 memory-map으로 로드된다.
+"""
+
+import importlib
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from faker import Faker
+
+from services.tables.cache import TableCache
+from services.tables.common import BUILD_WORKERS, CACHE_DIR, RANDOM_SEED
+from services.tables.profiler import PROFILER, profile_builder, record_cache_load, record_outputs
+
+# ==============================================================================
+# 테이블 모듈 목록 (빌더 등록을 위해 최초 조회 시 import)
+# ==============================================================================
+
+TABLE_MODULES: Tuple[str, ...] = (
+    # HR_Core
+    "services.tables.HR_Core.basic_info_table",
+    "services.tables.HR_Core.department_table",
+    "services.tables.HR_Core.department_info_table",
+    "services.tables.HR_Core.job_table",
+    "services.tables.HR_Core.job_info_table",
+    "services.tables.HR_Core.position_table",
+    "services.tables.HR_Core.position_info_table",
+    "services.tables.HR_Core.absence_table",
+    "services.tables.HR_Core.absence_info_table",
+    "services.tables.HR_Core.career_table",
+    "services.tables.HR_Core.career_info_table",
+    "services.tables.HR_Core.school_table",
+    "services.tables.HR_Core.school_info_table",
+    "services.tables.HR_Core.contract_info_table",
+    "services.tables.HR_Core.salary_contract_info_table",
+    "services.tables.HR_Core.corporation_branch_table",
+    "services.tables.HR_Core.corp_branch_info_table",
+    "services.tables.HR_Core.project_table",
+    "services.tables.HR_Core.pjt_info_table",
+    "services.tables.HR_Core.region_table",
+    "services.tables.HR_Core.region_info_table",
+    # Time_Attendance
+    "services.tables.Time_Attendance.working_system_table",
+    "services.tables.Time_Attendance.working_type_table",
+    "services.tables.Time_Attendance.working_info_table",
+    "services.tables.Time_Attendance.detailed_working_info_table",
+    "services.tables.Time_Attendance.daily_working_info_table",
+    "services.tables.Time_Attendance.attendance_summary_table",
+    "services.tables.Time_Attendance.leave_type_table",
+    "services.tables.Time_Attendance.detailed_leave_info_table",
+    # Performance
+    "services.tables.Performance.evaluation_system_table",
+    "services.tables.Performance.evaluation_apply_table",
+    "services.tables.Performance.evaluation_original_score_info_table",
+    "services.tables.Performance.evaluation_modified_score_info_table",
+    # Payroll
+    "services.tables.Payroll.payroll_item_table",
+    "services.tables.Payroll.detailed_monthly_payroll_info_table",
+    "services.tables.Payroll.yearly_payroll_info_table",
+    # Master
+    "services.tables.create_master_table",
+)
+
+
+# ==============================================================================
+# 빌더 명세 및 등록
+# ==============================================================================
+
+
+@dataclass(frozen=True)
+class TableBuilder:
+    """
+    테이블 빌더 명세
+
+    Attributes:
+        func: 입력 테이블을 키워드 인자로 받아 {출력 이름: 값} dict를 반환하는 함수
+        inputs: 빌더가 필요로 하는 입력 테이블 이름
+        outputs: 빌더가 생성하는 테이블(및 헬퍼 맵) 이름
+        seed: 빌더 실행 직전에 적용할 난수 시드
+    """
+
+    func: Callable[..., Dict[str, Any]]
+    inputs: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+    seed: int = RANDOM_SEED
+
+    @property
+    def module(self) -> str:
+        return self.func.__module__
+
+    @property
+    def name(self) -> str:
+        return self.module.rsplit(".", 1)[-1]
+
+
+_BUILDERS: Dict[str, TableBuilder] = {}
+
+
+def register_table(
+    inputs: Iterable[str] = (), outputs: Iterable[str] = (), seed: int = RANDOM_SEED
+):
+    """
+    테이블 빌더 등록 데코레이터
+
+    Args:
+        inputs: 입력 테이블 이름 (빌더 함수의 키워드 인자 이름과 동일)
+        outputs: 빌더가 반환하는 dict의 키
+        seed: 빌더별 난수 시드 (순차/병렬 빌드 모두 동일하게 적용)
+
+    Returns:
+        Callable: 원본 함수를 그대로 반환하는 데코레이터
+    """
+
+    def decorator(func):
+        builder = TableBuilder(
+            func=func, inputs=tuple(inputs), outputs=tuple(outputs), seed=seed
+        )
+        for output in builder.outputs:
+            existing = _BUILDERS.get(output)
+            if existing is not None and existing.module != builder.module:
+                raise ValueError(
+                    f"'{output}' 테이블이 {existing.module}와 {builder.module}에 중복 등록되었습니다."
+                )
+            _BUILDERS[output] = builder
+        return func
+
+    return decorator
+
+
+def _discover_builders():
+    """모든 테이블 모듈을 import하여 빌더를 등록 (import 자체는 가벼움)"""
+    for module_name in TABLE_MODULES:
+        importlib.import_module(module_name)
+
+
+def get_builder(name: str) -> TableBuilder:
+    """테이블 이름으로 빌더 명세 조회"""
+    if name not in _BUILDERS:
+        _discover_builders()
+    if name not in _BUILDERS:
+        raise KeyError(f"등록되지 않은 테이블입니다: {name}")
+    return _BUILDERS[name]
+
+
+def resolve_builders(names: Iterable[str]) -> List[TableBuilder]:
+    """
+    요청한 테이블을 만드는 데 필요한 빌더를 의존성 순서(위상 정렬)로 반환
+
+    Args:
+        names: 테이블 이름 목록
+
+    Returns:
+        List[TableBuilder]: 입력 빌더가 항상 먼저 오도록 정렬된 빌더 목록
+    """
+    ordered: List[TableBuilder] = []
+    visiting: List[TableBuilder] = []
+
+    def visit(builder: TableBuilder):
+        if builder in ordered:
+            return
+        if builder in visiting:
+            cycle = " -> ".join(b.func.__name__ for b in visiting + [builder])
+            raise RuntimeError(f"테이블 의존성에 순환이 있습니다: {cycle}")
+        visiting.append(builder)
+        for input_name in builder.inputs:
+            visit(get_builder(input_name))
+        visiting.pop()
+        ordered.append(builder)
+
+    for name in names:
+        visit(get_builder(name))
+    return ordered
+
+
+def seed_random_state(seed: int = RANDOM_SEED):
+    """
+    빌더 실행 전 전역 난수 상태 초기화
+
+    모든 빌더가 자신의 시드에서 시작하므로, 빌드 순서나 실행 프로세스와
+    관계없이 각 테이블의 결과가 재현 가능하다.
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    Faker.seed(seed)
+
+
+def run_builder(builder: TableBuilder, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """시드를 초기화한 뒤 빌더를 실행하고 등록된 출력만 반환"""
+    seed_random_state(builder.seed)
+    with profile_builder(_builder_name(builder)) as record:
+        outputs = builder.func(**inputs)
+    record_outputs(record, outputs)
+
+    missing = [name for name in builder.outputs if name not in outputs]
+    if missing:
+        raise KeyError(f"{builder.module} 빌더가 다음 출력을 반환하지 않았습니다: {missing}")
+    return {name: outputs[name] for name in builder.outputs}
+
+
+def _run_builder_in_worker(module_name: str, func_name: str, inputs: Dict[str, Any]):
+    """프로세스 풀 워커 진입점 (빌더 함수는 모듈 경로로 다시 찾는다, 프로파일 기록도 함께 반환)"""
+    func = getattr(importlib.import_module(module_name), func_name)
+    builder = next(b for b in _BUILDERS.values() if b.func is func)
+    return run_builder(builder, inputs), PROFILER.drain()
+
+
+def _builder_name(builder: TableBuilder) -> str:
+    """프로파일 리포트용 빌더 이름 (<모듈>.<함수>)"""
+    return f"{builder.module.rsplit('.', 1)[-1]}.{builder.func.__name__}"
+
+
+# ==============================================================================
+# 레지스트리 (지연 빌드 + 메모이즈)
+# ==============================================================================
+
+
+class TableRegistry:
+    """
+    테이블 지연 빌드 및 메모이즈 저장소
+
+    - get(name): 테이블이 없으면 입력 테이블부터 재귀적으로 빌드
+    - 빌더 단위로 결과를 저장하므로 한 빌더의 출력은 한 번만 계산됨
+    - cache가 주어지면 캐시 히트 시 입력 테이블을 빌드하지 않고 바로 로드
+    """
+
+    def __init__(self, cache: Optional[TableCache] = None):
+        self._tables: Dict[str, Any] = {}
+        self._building: List[TableBuilder] = []
+        self._cache = cache
+        self._cache_keys: Dict[TableBuilder, str] = {}
+
+    def get(self, name: str) -> Any:
+        """
+        테이블 조회 (필요 시 빌드)
+
+        Args:
+            name: 테이블 이름 (e.g., "emp_df", "department_info_df")
+
+        Returns:
+            Any: 빌드된 테이블 또는 헬퍼 객체
+        """
+        if name not in self._tables:
+            self._build(get_builder(name))
+        return self._tables[name]
+
+    def get_many(self, names: Iterable[str]) -> Dict[str, Any]:
+        """여러 테이블을 한 번에 조회"""
+        return {name: self.get(name) for name in names}
+
+    def is_built(self, name: str) -> bool:
+        """테이블이 이미 빌드되었는지 여부"""
+        return name in self._tables
+
+    def clear(self):
+        """메모이즈된 테이블 전체 삭제"""
+        self._tables.clear()
+        self._cache_keys.clear()
+
+    def build(self, names: Iterable[str], max_workers: int = 1) -> Dict[str, Any]:
+        """
+        여러 테이블을 한 번에 빌드
+
+        max_workers > 1이면 의존성 그래프를 프로세스 풀에 스케줄링하여,
+        입력이 모두 준비된 빌더(HR_Core 이력, 평가, 근태 등 독립 분기)를
+        동시에 실행한다.
+
+        Args:
+            names: 테이블 이름 목록
+            max_workers: 프로세스 풀 크기 (1이면 현재 프로세스에서 순차 빌드)
+
+        Returns:
+            Dict[str, Any]: {테이블 이름: 테이블}
+        """
+        names = list(names)
+        if max_workers <= 1:
+            return self.get_many(names)
+
+        # 캐시에서 로드 가능한 빌더의 상위 그래프는 빌드하지 않음
+        required = {get_builder(name) for name in names}
+        pending = []
+        for builder in reversed(resolve_builders(names)):
+            if builder not in required or self._is_complete(builder):
+                continue
+            if self._load_cached(builder):
+                continue
+            pending.insert(0, builder)
+            required.update(get_builder(name) for name in builder.inputs)
+
+        running = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                ready = [b for b in pending if all(self.is_built(n) for n in b.inputs)]
+                for builder in ready:
+                    pending.remove(builder)
+                    inputs = {name: self._tables[name] for name in builder.inputs}
+                    future = executor.submit(
+                        _run_builder_in_worker, builder.module, builder.func.__name__, inputs
+                    )
+                    running[future] = builder
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    outputs, records = future.result()
+                    PROFILER.records.extend(records)
+                    self._store(running.pop(future), outputs)
+
+        return {name: self._tables[name] for name in names}
+
+    def _build(self, builder: TableBuilder):
+        if builder in self._building:
+            cycle = " -> ".join(b.func.__name__ for b in self._building + [builder])
+            raise RuntimeError(f"테이블 의존성에 순환이 있습니다: {cycle}")
+        if self._load_cached(builder):
+            return
+
+        self._building.append(builder)
+        try:
+            inputs = {name: self.get(name) for name in builder.inputs}
+            self._store(builder, run_builder(builder, inputs))
+        finally:
+            self._building.pop()
+
+    def _is_complete(self, builder: TableBuilder) -> bool:
+        return all(self.is_built(output) for output in builder.outputs)
+
+    def _cache_key(self, builder: TableBuilder) -> str:
+        """입력 빌더 키까지 포함한 캐시 키 (상위 변경 시 하위도 무효화)"""
+        if builder not in self._cache_keys:
+            input_keys = [self._cache_key(get_builder(name)) for name in builder.inputs]
+            self._cache_keys[builder] = self._cache.key(builder, input_keys)
+        return self._cache_keys[builder]
+
+    def _load_cached(self, builder: TableBuilder) -> bool:
+        if self._cache is None:
+            return False
+        start = time.perf_counter()
+        outputs = self._cache.load(builder, self._cache_key(builder))
+        if outputs is None:
+            return False
+        record_cache_load(_builder_name(builder), time.perf_counter() - start, outputs)
+        self._tables.update(outputs)
+        return True
+
+    def _store(self, builder: TableBuilder, outputs: Dict[str, Any]):
+        self._tables.update(outputs)
+        if self._cache is not None:
+            self._cache.save(builder, self._cache_key(builder), outputs)
+
+
+_registry = TableRegistry(cache=TableCache(CACHE_DIR) if CACHE_DIR else None)
+
+
+def get_registry() -> TableRegistry:
+    """기본 테이블 레지스트리 반환"""
+    return _registry
+
+
+def get_table(name: str) -> Any:
+    """기본 레지스트리에서 테이블 조회 (필요 시 빌드)"""
+    return _registry.get(name)
+
+
+def get_tables(*names: str) -> Dict[str, Any]:
+    """기본 레지스트리에서 여러 테이블 조회"""
+    return _registry.get_many(names)
+
+
+def build_tables(names: Iterable[str] = None, max_workers: int = BUILD_WORKERS) -> Dict[str, Any]:
+    """
+    기본 레지스트리에서 여러 테이블을 빌드 (병렬 빌드 지원)
+
+    Args:
+        names: 테이블 이름 목록 (None이면 등록된 전체 테이블)
+        max_workers: 프로세스 풀 크기 (기본값: STREAMLIT_TABLE_BUILD_WORKERS)
+
+    Returns:
+        Dict[str, Any]: {테이블 이름: 테이블}
+    """
+    if names is None:
+        _discover_builders()
+        names = list(_BUILDERS)
+    return _registry.build(names, max_workers=max_workers)
+
+
+def module_getattr(module_name: str) -> Callable[[str], Any]:
+    """
+    테이블 모듈용 `__getattr__` 생성 (PEP 562)
+
+    `from <모듈> import <테이블>` 형태의 기존 import가 레지스트리를 통해
+    지연 빌드되도록 한다. 해당 모듈이 등록한 출력 이름만 허용한다.
+    """
+
+    def __getattr__(name: str) -> Any:
+        builder = _BUILDERS.get(name)
+        if builder is None or builder.module != module_name:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        return get_table(name)
+
+    return __getattr__
@@ -0,0 +1,192 @@
+"""
+직원 구간 샤드 생성
+
+대규모 규모 프로파일(10k/100k/1m)은 전체 직원을 한 프로세스에서 생성하면 메모리가 직원 수에
+비례해 늘어나므로, 직원 ID 구간별 샤드를 각각 별도 프로세스에서 생성한 뒤 테이블별로 이어 붙인다.
+
+- 샤드 i: 직원 ID 오프셋 = 앞 샤드 직원 수 합, 직원 단위 테이블 시드 = RANDOM_SEED + i
+  (부서/직무 등 참조 테이블은 모든 샤드에서 같으므로 샤드 0의 파일을 사용)
+- 샤드 프로세스는 요청한 테이블만 Parquet으로 저장하고 종료 (피크 메모리 ≈ 샤드 하나)
+- 병합은 샤드 파일을 하나씩 읽어 ParquetWriter에 이어 쓰므로 전체 테이블을 메모리에 올리지 않음
+- master_df_encoded처럼 샤드마다 원-핫 컬럼이 다를 수 있는 테이블은 컬럼 합집합으로 맞추고
+  없는 더미 컬럼은 False로 채움
+- 모집단 통계(연봉 분위수 구간, 평가점수 중앙값 대체 등)는 샤드 안에서 계산됨
+
+디렉터리 구조:
+    <output_dir>/shards/shard-<번호>/<테이블 이름>.parquet
+    <output_dir>/<테이블 이름>.parquet
+
+사용법:
+    python -m services.tables.shards --profile 100k --output /data/stress_100k --workers 2
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from services.config.dev_config import SCALE_PROFILES
+from services.tables.registry import get_builder, resolve_builders
+
+DEFAULT_SHARD_TABLES = ("emp_df", "employee_info_df", "master_df", "master_df_encoded")
+
+PARQUET_SUFFIX = ".parquet"
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def plan_shards(num_employees: int, shard_size: int) -> List[Tuple[int, int, int]]:
+    """(샤드 번호, 직원 ID 오프셋, 직원 수) 목록 (shard_size가 0이면 샤드 하나)"""
+    shard_size = shard_size if shard_size > 0 else num_employees
+    return [
+        (index, offset, min(shard_size, num_employees - offset))
+        for index, offset in enumerate(range(0, num_employees, shard_size))
+    ]
+
+
+def _is_employee_table(name: str) -> bool:
+    """직원 기본정보(emp_df)에서 파생되는 테이블인지 여부 (아니면 참조 테이블)"""
+    emp_builder = get_builder("emp_df")
+    return emp_builder in resolve_builders([name])
+
+
+def _shard_env(profile: dict, shard: Tuple[int, int, int]) -> Dict[str, str]:
+    """샤드 프로세스 환경변수 (직원 수·시드·ID 오프셋 지정, 캐시/병렬 빌드 비활성화)"""
+    index, offset, size = shard
+    env = dict(os.environ)
+    env.pop("STREAMLIT_SCALE_PROFILE", None)
+    env.update({
+        "STREAMLIT_DEV_MODE": "true",
+        "STREAMLIT_NUM_EMPLOYEES": str(size),
+        "STREAMLIT_DATE_START": profile["date_start"],
+        "STREAMLIT_SHARD_INDEX": str(index),
+        "STREAMLIT_SHARD_EMPLOYEE_OFFSET": str(offset),
+        "STREAMLIT_ENABLE_DATA_CACHING": "false",
+        "STREAMLIT_TABLE_BUILD_WORKERS": "1",
+    })
+    env.setdefault("STREAMLIT_ATTENDANCE_CHUNK_SIZE", str(profile["attendance_chunk_size"]))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_DIR, env.get("PYTHONPATH")]))
+    return env
+
+
+def _run_shard(shard_dir: str, tables: Tuple[str, ...], env: Dict[str, str]):
+    """샤드 하나를 별도 프로세스에서 생성 (이미 모든 테이블 파일이 있으면 건너뜀)"""
+    if all(os.path.exists(os.path.join(shard_dir, name + PARQUET_SUFFIX)) for name in tables):
+        return
+    subprocess.run(
+        [sys.executable, "-m", "services.tables.shards", "--worker", "--output", shard_dir, "--tables", *tables],
+        env=env, cwd=SRC_DIR, check=True,
+    )
+
+
+def _write_shard_tables(shard_dir: str, tables: Iterable[str]):
+    """샤드 프로세스 진입점: 현재 설정(환경변수)으로 테이블을 빌드해 Parquet으로 저장"""
+    from services.tables.registry import get_tables
+
+    os.makedirs(shard_dir, exist_ok=True)
+    for name, table in get_tables(*tables).items():
+        path = os.path.join(shard_dir, name + PARQUET_SUFFIX)
+        pq.write_table(pa.Table.from_pandas(table, preserve_index=False), path + ".tmp")
+        os.replace(path + ".tmp", path)
+
+
+def _merge_table(paths: List[str], output_path: str):
+    """샤드 파일을 컬럼 합집합 스키마로 맞춰 하나의 Parquet 파일로 이어 쓰기"""
+    schemas = [pq.read_schema(path).remove_metadata() for path in paths]
+    fields = {}
+    for schema in schemas:
+        for field in schema:
+            fields.setdefault(field.name, field)
+    schema = pa.schema(list(fields.values()))
+
+    with pq.ParquetWriter(output_path + ".tmp", schema) as writer:
+        for path in paths:
+            table = pq.read_table(path)
+            columns = []
+            for field in schema:
+                if field.name in table.column_names:
+                    columns.append(table[field.name].cast(field.type))
+                elif pa.types.is_boolean(field.type):
+                    columns.append(pa.array([False] * table.num_rows, type=field.type))
+                else:
+                    columns.append(pa.nulls(table.num_rows, type=field.type))
+            writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+            del table, columns
+    os.replace(output_path + ".tmp", output_path)
+
+
+def build_sharded_tables(
+    profile_name: str,
+    output_dir: str,
+    tables: Iterable[str] = DEFAULT_SHARD_TABLES,
+    max_workers: int = 1,
+    keep_shards: bool = False,
+) -> Dict[str, str]:
+    """
+    규모 프로파일 크기의 테이블을 직원 구간 샤드로 나누어 생성하고 테이블별로 병합
+
+    Args:
+        profile_name: SCALE_PROFILES 이름 (예: '100k')
+        output_dir: 병합된 테이블(및 샤드 파일) 저장 경로
+        tables: 생성할 테이블 이름 (DataFrame 출력만)
+        max_workers: 동시에 실행할 샤드 프로세스 수 (메모리 예산 ≈ 샤드 메모리 x max_workers)
+        keep_shards: 병합 후 샤드 파일을 남길지 여부 (남겨 두면 다시 실행할 때 건너뜀)
+
+    Returns:
+        Dict[str, str]: {테이블 이름: 병합된 Parquet 경로}
+    """
+    profile = SCALE_PROFILES[profile_name]
+    tables = tuple(tables)
+    shards = plan_shards(profile["num_employees"], profile["shard_size"])
+    shard_root = os.path.join(output_dir, "shards")
+    shard_dirs = [os.path.join(shard_root, f"shard-{index:05d}") for index, _, _ in shards]
+    print(f"🧩 [{profile_name}] 직원 {profile['num_employees']}명을 샤드 {len(shards)}개로 생성: {output_dir}")
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [
+            executor.submit(_run_shard, shard_dir, tables, _shard_env(profile, shard))
+            for shard_dir, shard in zip(shard_dirs, shards)
+        ]
+        for future in futures:
+            future.result()
+
+    outputs = {}
+    for name in tables:
+        output_path = os.path.join(output_dir, name + PARQUET_SUFFIX)
+        paths = [os.path.join(shard_dir, name + PARQUET_SUFFIX) for shard_dir in shard_dirs]
+        if _is_employee_table(name):
+            _merge_table(paths, output_path)
+        else:
+            shutil.copyfile(paths[0], output_path)
+        outputs[name] = output_path
+
+    if not keep_shards:
+        shutil.rmtree(shard_root, ignore_errors=True)
+    return outputs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="규모 프로파일 크기의 합성 데이터를 직원 구간 샤드로 생성")
+    parser.add_argument("--profile", choices=list(SCALE_PROFILES), help="규모 프로파일 이름")
+    parser.add_argument("--output", required=True, help="출력 경로")
+    parser.add_argument("--tables", nargs="+", default=list(DEFAULT_SHARD_TABLES), help="생성할 테이블 이름")
+    parser.add_argument("--workers", type=int, default=1, help="동시에 실행할 샤드 프로세스 수")
+    parser.add_argument("--keep-shards", action="store_true", help="병합 후 샤드 파일 유지")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        _write_shard_tables(args.output, args.tables)
+    else:
+        if not args.profile:
+            parser.error("--profile이 필요합니다.")
+        build_sharded_tables(args.profile, args.output, args.tables, args.workers, args.keep_shards)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+"""
+마스터 테이블 시점(as-of) 스냅샷
+
+기준일(as_of)마다 그 날짜 이전에 유효했던 기록만으로 master_df / master_df_encoded를 만들어
+버전별·기준일별로 파티션된 Parquet 데이터셋에 저장한다.
+
+기준일마다 전체 생성 스크립트를 다시 돌리지 않도록, 입력 테이블은 한 번만 빌드하고
+유효일 순으로 한 번만 정렬해 둔다 (SortedHistory). 기준일별 소스는 정렬된 유효일 배열에서
+이분 탐색으로 찾은 앞쪽 구간이고, 일별 근무 행은 직원 x 일자 순 누적합(CumulativeWorkIndex)으로
+기준일별 평균 초과/야간 근무를 직원 수만큼의 이분 탐색으로 계산한다.
+
+- 직원: 기준일 이전 입사자만 포함, 기준일 이후 퇴사는 재직 중으로 간주
+- 발령/프로젝트/휴직 등 기간 기록: 기준일 이전 시작 기록만 포함, 종료일이 기준일 이후면
+  진행 중(종료일 없음)으로 보고 기간을 기준일까지로 자름
+- 급여: 기준일 연도 이전 지급분 / 평가·휴가: 기준일 이전 기록
+- 부서/직무 계층과 코드 테이블은 현재 구조를 그대로 사용 (이력 없음)
+
+디렉터리 구조:
+    <snapshot_dir>/<출력 이름>/version=<버전>/as_of=<YYYY-MM-DD>/part-0.parquet
+
+버전은 스냅샷 모듈과 그 모듈이 import한 services.* 모듈(마스터 빌더, 헬퍼 등) 소스 해시와
+입력 테이블 내용 해시로 정해진다. 같은 버전에서 이미 저장된 기준일은 다시 계산하지 않는다.
+"""
+
+import datetime
+import hashlib
+import os
+import tempfile
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from services.tables.cache import module_dependency_hash
+from services.tables.common import MASTER_SNAPSHOT_PATH
+from services.tables.create_master_table import build_master_table
+from services.tables.incremental import table_fingerprint
+from services.tables.registry import get_builder, get_tables, seed_random_state
+
+SNAPSHOT_OUTPUTS = ("master_df", "master_df_encoded")
+
+# 마스터 빌더 입력 중 근태 집계는 기준일마다 일별 근무 행에서 다시 계산
+SNAPSHOT_INPUTS = (
+    "emp_df",
+    "absence_info_df",
+    "career_info_df",
+    "dept_hierarchy",
+    "department_info_df",
+    "job_hierarchy_index",
+    "job_info_df",
+    "position_df",
+    "position_info_df",
+    "pjt_info_df",
+    "school_df",
+    "school_info_df",
+    "yearly_payroll_df",
+    "evaluation_modified_score_df",
+    "daily_work_info_df",
+    "detailed_leave_info_df",
+    "leave_type_df",
+)
+
+PART_FILE_NAME = "part-0.parquet"
+
+
+def _day_numbers(values) -> np.ndarray:
+    """날짜 배열 → 1970-01-01 기준 일수 (int64, 결측은 int64 최솟값)"""
+    return pd.to_datetime(pd.Series(values)).to_numpy(dtype="datetime64[D]").astype(np.int64)
+
+
+def _day_number(day) -> int:
+    """단일 날짜 → 1970-01-01 기준 일수"""
+    return int(np.datetime64(pd.Timestamp(day).date(), "D").astype(np.int64))
+
+
+class SortedHistory:
+    """
+    유효 시점 순으로 한 번 정렬해 둔 기간 기록 테이블
+
+    기준일 이전 기록은 정렬된 테이블의 앞쪽 연속 구간이므로, 기준일마다 필터링하지 않고
+    searchsorted 한 번으로 잘라 쓴다. 유효 시점이 없는 행은 어떤 기준일에도 포함되지 않는다.
+
+    Attributes:
+        df: 유효 시점 순으로 정렬된 테이블
+        end_cols: 기준일 이후면 결측(진행 중)으로 바꿀 종료일 컬럼
+        duration: (기간 컬럼, 시작일 컬럼) - 기준일까지로 자를 기간(일수)
+    """
+
+    def __init__(self, df: pd.DataFrame, keys, end_cols: Iterable[str] = (), duration=None):
+        keys = np.asarray(keys, dtype=np.int64)
+        valid = keys != np.iinfo(np.int64).min
+        order = np.argsort(np.where(valid, keys, np.iinfo(np.int64).max), kind="stable")
+        self.df = df.iloc[order[valid[order]]].reset_index(drop=True)
+        self._keys = keys[order[valid[order]]]
+        self.end_cols = tuple(end_cols)
+        self.duration = duration
+
+    def until(self, key: int, as_of_ts: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """유효 시점이 key 이하인 기록 (as_of_ts가 있으면 종료일/기간을 기준일 시점으로 보정)"""
+        df = self.df.iloc[:np.searchsorted(self._keys, key, side="right")]
+        if as_of_ts is None or not (self.end_cols or self.duration):
+            return df
+        df = df.copy()
+        for col in self.end_cols:
+            df[col] = df[col].mask(df[col] > as_of_ts)
+        if self.duration:
+            duration_col, start_col = self.duration
+            elapsed = (as_of_ts - pd.to_datetime(df[start_col])).dt.days
+            df[duration_col] = np.minimum(df[duration_col], elapsed).astype(df[duration_col].dtype)
+        return df
+
+
+class CumulativeWorkIndex:
+    """
+    직원 x 일자 순 일별 근무 누적합
+
+    기준일별 직원 평균 초과/야간 근무, 최근 1년/2년 평균 초과근무
+    (attendance_summary_df와 같은 컬럼)를 누적합 차이로 계산한다.
+    """
+
+    def __init__(self, daily_work_info_df: pd.DataFrame):
+        emp_codes, self._emp_ids = pd.factorize(daily_work_info_df["EMP_ID"], sort=True)
+        days = _day_numbers(daily_work_info_df["DATE"])
+        self._day_min = int(days.min()) if len(days) else 0
+        # 직원 구간 안에서 일자가 넘치지 않도록 기간 길이 + 여유 1일을 직원별 키 간격으로 사용
+        self._stride = (int(days.max()) - self._day_min + 2) if len(days) else 1
+        keys = emp_codes.astype(np.int64) * self._stride + (days - self._day_min)
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+
+        def cumulative(values):
+            values = np.asarray(values, dtype=np.float64)[order]
+            has_value = ~np.isnan(values)
+            return (
+                np.concatenate([[0.0], np.cumsum(np.where(has_value, values, 0.0))]),
+                np.concatenate([[0], np.cumsum(has_value)]),
+            )
+
+        self._overtime_sum, self._overtime_count = cumulative(daily_work_info_df["OVERTIME_MINUTES"])
+        self._night_sum, self._night_count = cumulative(daily_work_info_df["NIGHT_WORK_MINUTES"])
+
+    def _positions(self, day: int) -> np.ndarray:
+        """직원별로 일자가 day 이하인 마지막 행 다음 위치"""
+        offset = min(max(day - self._day_min, -1), self._stride - 1)
+        probes = np.arange(len(self._emp_ids), dtype=np.int64) * self._stride + offset
+        return np.searchsorted(self._keys, probes, side="right")
+
+    def summary(self, as_of_ts: pd.Timestamp) -> pd.DataFrame:
+        """기준일 시점 직원별 근태 집계 (기준일 이전 근무 기록이 있는 직원만)"""
+        end = self._positions(_day_number(as_of_ts))
+        start = self._positions(self._day_min - 1)
+        start_1y = self._positions(_day_number(as_of_ts - pd.DateOffset(years=1)) - 1)
+        start_2y = self._positions(_day_number(as_of_ts - pd.DateOffset(years=2)) - 1)
+
+        def window_mean(total, count, lo):
+            n = count[end] - count[lo]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return np.where(n > 0, (total[end] - total[lo]) / np.maximum(n, 1), np.nan)
+
+        summary = pd.DataFrame({
+            "EMP_ID": self._emp_ids.to_numpy(),
+            "AVG_OVERTIME_MINUTES": window_mean(self._overtime_sum, self._overtime_count, start),
+            "AVG_NIGHT_WORK_MINUTES": window_mean(self._night_sum, self._night_count, start),
+            "OVERTIME_1Y": window_mean(self._overtime_sum, self._overtime_count, start_1y),
+            "OVERTIME_2Y": window_mean(self._overtime_sum, self._overtime_count, start_2y),
+        })
+        return summary[end > start].reset_index(drop=True)
+
+
+class MasterSnapshotBuilder:
+    """
+    입력 테이블을 한 번 정렬해 두고 기준일별 마스터 테이블을 만드는 빌더
+
+    Attributes:
+        tables: SNAPSHOT_INPUTS 이름별 입력 테이블
+        version: 스냅샷 버전 (마스터/스냅샷 모듈 소스 해시 + 입력 내용 해시)
+    """
+
+    def __init__(self, tables: Dict[str, object]):
+        self.tables = tables
+        self.version = self._version(tables)
+
+        emp_df = tables["emp_df"]
+        self._emp_in_days = _day_numbers(emp_df["IN_DATE"])
+
+        eval_df = tables["evaluation_modified_score_df"]
+        eval_dates = eval_df["EVAL_TIME"].str.replace("상반기", "-06-01").str.replace("하반기", "-12-01")
+        payroll_df = tables["yearly_payroll_df"]
+        school_info_df = tables["school_info_df"]
+
+        self._histories = {
+            "absence_info_df": SortedHistory(
+                tables["absence_info_df"], _day_numbers(tables["absence_info_df"]["ABSENCE_START_DATE"]),
+                end_cols=("ABSENCE_END_DATE",), duration=("ABSENCE_DURATION", "ABSENCE_START_DATE"),
+            ),
+            "career_info_df": SortedHistory(
+                tables["career_info_df"], _day_numbers(tables["career_info_df"]["CAREER_IN_DATE"]),
+                end_cols=("CAREER_OUT_DATE",), duration=("CAREER_DURATION", "CAREER_IN_DATE"),
+            ),
+            "department_info_df": SortedHistory(
+                tables["department_info_df"], _day_numbers(tables["department_info_df"]["DEP_APP_START_DATE"]),
+                end_cols=("DEP_APP_END_DATE",), duration=("DEP_DURATION", "DEP_APP_START_DATE"),
+            ),
+            "job_info_df": SortedHistory(
+                tables["job_info_df"], _day_numbers(tables["job_info_df"]["JOB_APP_START_DATE"]),
+                end_cols=("JOB_APP_END_DATE",),
+            ),
+            "position_info_df": SortedHistory(
+                tables["position_info_df"], _day_numbers(tables["position_info_df"]["GRADE_START_DATE"]),
+                end_cols=("POSITION_END_DATE", "GRADE_END_DATE"), duration=("GRADE_DURATION", "GRADE_START_DATE"),
+            ),
+            "pjt_info_df": SortedHistory(
+                tables["pjt_info_df"], _day_numbers(tables["pjt_info_df"]["PJT_APP_START_DATE"]),
+                end_cols=("PJT_APP_END_DATE",), duration=("PJT_DURATION", "PJT_APP_START_DATE"),
+            ),
+            "evaluation_modified_score_df": SortedHistory(eval_df, _day_numbers(eval_dates)),
+            "detailed_leave_info_df": SortedHistory(
+                tables["detailed_leave_info_df"], _day_numbers(tables["detailed_leave_info_df"]["DATE"])
+            ),
+        }
+        # 연 단위 기록은 연도를 유효 시점 키로 사용
+        self._yearly_histories = {
+            "yearly_payroll_df": SortedHistory(payroll_df, pd.to_numeric(payroll_df["PAY_YEAR"]).to_numpy()),
+            "school_info_df": SortedHistory(school_info_df, school_info_df["ADM_YEAR"].to_numpy()),
+        }
+        self._work_index = CumulativeWorkIndex(tables["daily_work_info_df"])
+
+    @staticmethod
+    def _version(tables: Dict[str, object]) -> str:
+        """마스터/스냅샷 모듈 소스 해시와 입력 테이블 내용 해시로 스냅샷 버전 계산"""
+        digest = hashlib.sha256()
+        # 스냅샷 모듈이 import하는 마스터 빌더와 헬퍼 모듈 소스까지 포함
+        digest.update(module_dependency_hash(__name__).encode())
+        for name in SNAPSHOT_INPUTS:
+            table = tables[name]
+            table = table if isinstance(table, pd.DataFrame) else table.closure_df
+            digest.update(f"{name}:{table_fingerprint(table)}".encode())
+        return digest.hexdigest()[:12]
+
+    def sources_as_of(self, as_of: datetime.date) -> Dict[str, object]:
+        """기준일 시점의 마스터 빌더 입력"""
+        as_of_ts = pd.Timestamp(as_of)
+        as_of_day = _day_number(as_of_ts)
+
+        emp_df = self.tables["emp_df"][self._emp_in_days <= as_of_day].copy()
+        left = emp_df["OUT_DATE"] <= as_of_ts
+        emp_df["CURRENT_EMP_YN"] = np.where(left, "N", "Y")
+        emp_df["OUT_DATE"] = emp_df["OUT_DATE"].where(left)
+        emp_ids = emp_df["EMP_ID"]
+
+        def of_employees(df):
+            return df[df["EMP_ID"].isin(emp_ids)].reset_index(drop=True)
+
+        sources = {name: self.tables[name] for name in ("dept_hierarchy", "job_hierarchy_index", "position_df", "school_df", "leave_type_df")}
+        sources["emp_df"] = emp_df.reset_index(drop=True)
+        for name, history in self._histories.items():
+            sources[name] = of_employees(history.until(as_of_day, as_of_ts))
+        for name, history in self._yearly_histories.items():
+            sources[name] = of_employees(history.until(as_of.year))
+        sources["attendance_summary_df"] = of_employees(self._work_index.summary(as_of_ts))
+        return sources
+
+    def build(self, as_of: datetime.date) -> Dict[str, pd.DataFrame]:
+        """기준일 시점 master_df / master_df_encoded 생성 (기준일과 무관하게 같은 시드에서 시작)"""
+        seed_random_state(get_builder("master_df").seed)
+        return build_master_table(**self.sources_as_of(as_of), as_of=as_of)
+
+
+def snapshot_partition_dir(root: str, output: str, version: str, as_of: datetime.date) -> str:
+    """스냅샷 파티션 디렉터리 경로"""
+    return os.path.join(root, output, f"version={version}", f"as_of={as_of.isoformat()}")
+
+
+def _write_partition(df: pd.DataFrame, partition_dir: str):
+    """파티션 Parquet 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+    os.makedirs(partition_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".part-", dir=partition_dir)
+    os.close(fd)
+    try:
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp_path)
+        os.replace(tmp_path, os.path.join(partition_dir, PART_FILE_NAME))
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def monthly_as_of_dates(start, end) -> List[datetime.date]:
+    """start~end 사이 월말 기준일 목록"""
+    return [ts.date() for ts in pd.date_range(start, end, freq="ME")]
+
+
+def build_master_snapshots(
+    as_of_dates: Iterable[datetime.date],
+    snapshot_dir: str = MASTER_SNAPSHOT_PATH,
+    overwrite: bool = False,
+) -> Dict[datetime.date, Dict[str, str]]:
+    """
+    기준일별 마스터 테이블 스냅샷을 Parquet 파티션으로 저장
+
+    Args:
+        as_of_dates: 기준일 목록 (예: monthly_as_of_dates(...))
+        snapshot_dir: 스냅샷 데이터셋 루트 경로
+        overwrite: 같은 버전에 이미 저장된 기준일도 다시 계산할지 여부
+
+    Returns:
+        Dict[datetime.date, Dict[str, str]]: {기준일: {출력 이름: 파티션 디렉터리}}
+    """
+    builder = MasterSnapshotBuilder(get_tables(*SNAPSHOT_INPUTS))
+    partitions = {}
+    for as_of in sorted(set(as_of_dates)):
+        dirs = {output: snapshot_partition_dir(snapshot_dir, output, builder.version, as_of) for output in SNAPSHOT_OUTPUTS}
+        exists = all(os.path.exists(os.path.join(path, PART_FILE_NAME)) for path in dirs.values())
+        if overwrite or not exists:
+            outputs = builder.build(as_of)
+            for output, path in dirs.items():
+                _write_partition(outputs[output], path)
+        partitions[as_of] = dirs
+    print(f"📸 마스터 테이블 스냅샷 {len(partitions)}개 (버전 {builder.version}): {snapshot_dir}")
+    return partitions
+
+
+def load_master_snapshot(
+    as_of: datetime.date,
+    output: str = "master_df",
+    version: Optional[str] = None,
+    snapshot_dir: str = MASTER_SNAPSHOT_PATH,
+) -> pd.DataFrame:
+    """
+    저장된 기준일 스냅샷 불러오기
+
+    Args:
+        as_of: 기준일
+        output: 'master_df' 또는 'master_df_encoded'
+        version: 스냅샷 버전 (기본값: 해당 기준일이 있는 가장 최근 버전)
+        snapshot_dir: 스냅샷 데이터셋 루트 경로
+
+    Returns:
+        pd.DataFrame: 스냅샷 테이블
+    """
+    if version is None:
+        output_dir = os.path.join(snapshot_dir, output)
+        candidates = [
+            os.path.join(output_dir, name) for name in os.listdir(output_dir)
+            if os.path.exists(os.path.join(output_dir, name, f"as_of={as_of.isoformat()}", PART_FILE_NAME))
+        ] if os.path.isdir(output_dir) else []
+        if not candidates:
+            raise FileNotFoundError(f"{as_of} 기준 {output} 스냅샷이 없습니다: {output_dir}")
+        version = os.path.basename(max(candidates, key=os.path.getmtime)).split("=", 1)[1]
+    path = os.path.join(snapshot_partition_dir(snapshot_dir, output, version, as_of), PART_FILE_NAME)
+    return pq.read_table(path).to_pandas()
@@ -63,14 +63,12 @@ def render_local_waterfall(
     st.markdown("---")
 
     # 위험도 정보 가져오기
-    employee_risk_row = employee_risk_df[employee_risk_df["사번"] == selected_employee]
+    risk_score = xai_service.get_employee_risk(selected_employee)
 
-    if employee_risk_row.empty:
+    if risk_score is None:
         st.error(f"사번 {selected_employee}의 데이터를 찾을 수 없습니다.")
         return
 
-    risk_score = employee_risk_row["PREDICTED_RISK"].iloc[0]
-
     # 직원 정보 가져오기
     employee_info = xai_service.get_employee_info_for_display(
         selected_employee, employee_info_df
@@ -161,11 +159,14 @@ def render_local_waterfall(
     st.subheader("해석 가이드")
 
     base_value = shap_values.base_values[0]
+    # native 백엔드의 base value는 트리 cover 기준값 σ(bias)로, 배경 데이터 평균 퇴사율이 아님
+    native_backend = xai_service.shap_backend == "native"
+    base_label = "Base Value (트리 기준값)" if native_backend else "Base Value (평균 퇴사율)"
 
     st.markdown(f"""
     | 항목 | 값 |
     |------|-----|
-    | **Base Value (평균 퇴사율)** | {base_value:.1f}% |
+    | **{base_label}** | {base_value:.1f}% |
     | **최종 예측 퇴사율** | {risk_score * 100:.1f}% |
     | **차이** | {(risk_score * 100) - base_value:+.1f}%p |
 
@@ -176,6 +177,12 @@ def render_local_waterfall(
     - 막대의 길이: 해당 요인이 미치는 영향의 크기 (%p)
     """)
 
+    if native_backend:
+        st.caption(
+            "ℹ️ native SHAP 백엔드의 Base Value는 부스터 bias의 확률 변환값으로, 평균 퇴사율이 아닙니다. "
+            "interventional 백엔드의 Base Value(배경 데이터 평균 예측)와 비교할 수 없습니다."
+        )
+
     # 주요 위험/보호 요인 분석
     with st.expander("주요 요인 상세 분석", expanded=False):
         shap_df = pd.DataFrame({
@@ -0,0 +1,19 @@
+"""
+테스트 공통 설정
+
+services 패키지를 src/에서 불러오고, 데이터 생성 규모를 작게 고정한다.
+환경 변수는 services.config.dev_config import 시점에 읽히므로 테스트 모듈보다 먼저 설정한다.
+"""
+
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+os.environ.setdefault("STREAMLIT_DEV_MODE", "true")
+os.environ.setdefault("STREAMLIT_NUM_EMPLOYEES", "20")
+os.environ.setdefault("STREAMLIT_DATE_START", "2022-01-01")
+os.environ.setdefault("STREAMLIT_ENABLE_DATA_CACHING", "false")
+os.environ.setdefault("STREAMLIT_TABLE_BUILD_WORKERS", "1")
@@ -0,0 +1,39 @@
+import datetime
+
+import pandas as pd
+
+from services.tables.common import START_DATE
+from services.tables.registry import get_tables
+from services.tables.Time_Attendance import detailed_working_info_table
+from services.tables.Time_Attendance.detailed_working_info_table import generate_seeded_work_info
+
+WORK_INFO_INPUTS = (
+    "dept_hierarchy",
+    "department_info_df",
+    "work_sys_df",
+    "work_type_df",
+    "work_info_df",
+    "burnout_leaver_ids",
+    "low_engagement_leaver_ids",
+)
+SEED_BLOCK = 5
+
+
+def test_chunked_work_info_matches_full_build(monkeypatch):
+    """시드 블록 경계에서 나눈 청크로 생성한 근무 행은 전체 직원으로 한 번에 생성한 행과 같음"""
+    # 테스트 규모(직원 20명)에서도 청크가 여러 개 나오도록 시드 블록을 줄임
+    monkeypatch.setattr(detailed_working_info_table, "ATTENDANCE_SEED_BLOCK_EMPLOYEES", SEED_BLOCK)
+    tables = get_tables("emp_df", *WORK_INFO_INPUTS)
+    emp_df = tables["emp_df"]
+    args = [tables[name] for name in WORK_INFO_INPUTS] + [START_DATE, datetime.date.today()]
+    chunk_size = 2 * SEED_BLOCK
+
+    full = generate_seeded_work_info(emp_df, *args)
+    chunks = [
+        generate_seeded_work_info(emp_df.iloc[start:start + chunk_size], *args, first_position=start)
+        for start in range(0, len(emp_df), chunk_size)
+    ]
+    chunked = pd.concat(chunks, ignore_index=True).sort_values(["DATE", "EMP_ID"], kind="stable").reset_index(drop=True)
+
+    assert len(chunks) > 1
+    pd.testing.assert_frame_equal(full, chunked)
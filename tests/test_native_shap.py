@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+
+from services.ml.native_shap import NativeTreeExplainer
+
+FEATURES = ["f0", "f1", "f2"]
+
+
+class _FixedContribBooster:
+    """pred_contribs 결과를 고정값으로 돌려주는 부스터"""
+
+    def __init__(self, contribs):
+        self.contribs = np.asarray(contribs, dtype=np.float32)
+        self.feature_names = FEATURES
+
+    def predict(self, dmatrix, pred_contribs=False):
+        return self.contribs
+
+
+def _explainer(contribs=None):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(200, len(FEATURES))), columns=FEATURES)
+    y = (X["f0"] + 0.5 * X["f1"] > 0).astype(int)
+    model = xgb.XGBClassifier(n_estimators=20, max_depth=3).fit(X, y)
+    explainer = NativeTreeExplainer(model, FEATURES)
+    if contribs is not None:
+        explainer.booster = _FixedContribBooster(contribs)
+    return explainer, X
+
+
+def test_probability_contributions_are_additive():
+    explainer, X = _explainer()
+
+    explanation = explainer(X.head(20))
+
+    predicted = explainer.model.predict_proba(X.head(20))[:, 1]
+    np.testing.assert_allclose(explanation.values.sum(axis=1) + explanation.base_values, predicted, atol=1e-6)
+
+
+def test_zero_margin_delta_keeps_contributions():
+    """기여도 합이 0이어도 개별 기여도를 0으로 지우지 않고 σ'(bias)로 변환"""
+    bias = 0.8
+    explainer, X = _explainer(contribs=[[0.5, -0.3, -0.2, bias]])
+
+    explanation = explainer(X.head(1))
+
+    sigmoid_bias = 1.0 / (1.0 + np.exp(-bias))
+    np.testing.assert_allclose(explanation.values[0], np.array([0.5, -0.3, -0.2]) * sigmoid_bias * (1 - sigmoid_bias), rtol=1e-6)
+    np.testing.assert_allclose(explanation.base_values[0], sigmoid_bias)
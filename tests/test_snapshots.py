@@ -0,0 +1,43 @@
+import datetime
+
+import pandas as pd
+import pytest
+
+from services.tables.registry import get_tables
+from services.tables.snapshots import SNAPSHOT_INPUTS, MasterSnapshotBuilder
+
+
+@pytest.fixture(scope="module")
+def snapshot_builder():
+    return MasterSnapshotBuilder(get_tables(*SNAPSHOT_INPUTS))
+
+
+def _first_hire_date(builder) -> pd.Timestamp:
+    return pd.to_datetime(builder.tables["emp_df"]["IN_DATE"]).min()
+
+
+def test_early_as_of_without_payroll_and_career(snapshot_builder):
+    """급여 지급 이전 기준일: 경력/급여 블록이 비어 있어도 총경력·연봉 수준을 계산"""
+    as_of = (_first_hire_date(snapshot_builder) + pd.Timedelta(days=1)).date()
+    assert snapshot_builder.sources_as_of(as_of)["yearly_payroll_df"].empty
+
+    master_df = snapshot_builder.build(as_of)["master_df"]
+
+    assert len(master_df) >= 1
+    assert master_df["총경력연수"].notna().all()
+    assert (master_df["경력대비연봉수준"] == "정보 없음").all()
+
+
+def test_as_of_before_first_hire_is_empty(snapshot_builder):
+    as_of = (_first_hire_date(snapshot_builder) - pd.Timedelta(days=1)).date()
+
+    outputs = snapshot_builder.build(as_of)
+
+    assert outputs["master_df"].empty
+    assert outputs["master_df_encoded"].empty
+
+
+def test_today_snapshot_has_all_employees(snapshot_builder):
+    master_df = snapshot_builder.build(datetime.date.today())["master_df"]
+
+    assert len(master_df) == len(snapshot_builder.tables["emp_df"])
@@ -0,0 +1,62 @@
+import importlib
+import sys
+import textwrap
+
+import pandas as pd
+import pytest
+
+from services.tables import cache
+from services.tables.cache import TableCache
+from services.tables.registry import TableBuilder
+
+PACKAGE = "cachetestpkg"
+
+
+@pytest.fixture
+def builder_package(tmp_path, monkeypatch):
+    """helper 모듈을 import하는 빌더 모듈 하나짜리 임시 패키지"""
+    package_dir = tmp_path / PACKAGE
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "helper.py").write_text("def scale(x):\n    return x * 2\n")
+    (package_dir / "builder.py").write_text(textwrap.dedent(f"""
+        import pandas as pd
+
+        from {PACKAGE}.helper import scale
+
+
+        def build_scaled():
+            return {{"scaled_df": pd.DataFrame({{"value": [scale(1), scale(2)]}})}}
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(cache, "SOURCE_PACKAGE", PACKAGE)
+    yield package_dir
+    for name in [name for name in sys.modules if name.split(".")[0] == PACKAGE]:
+        del sys.modules[name]
+
+
+def test_helper_edit_changes_cache_key(builder_package, tmp_path):
+    module = importlib.import_module(f"{PACKAGE}.builder")
+    builder = TableBuilder(func=module.build_scaled, inputs=(), outputs=("scaled_df",))
+    table_cache = TableCache(str(tmp_path / "cache"))
+
+    key = table_cache.key(builder, [])
+    table_cache.save(builder, key, builder.func())
+    assert table_cache.key(builder, []) == key
+    pd.testing.assert_frame_equal(table_cache.load(builder, key)["scaled_df"], builder.func()["scaled_df"])
+
+    (builder_package / "helper.py").write_text("def scale(x):\n    return x * 3\n")
+
+    new_key = table_cache.key(builder, [])
+    assert new_key != key
+    assert table_cache.load(builder, new_key) is None
+
+
+def test_dependency_hash_covers_constant_imports():
+    """상수만 import한 모듈(services.tables.common)도 의존 모듈에 포함"""
+    importlib.import_module("services.tables.HR_Core.absence_info_table")
+
+    deps = cache._imported_modules("services.tables.HR_Core.absence_info_table")
+
+    assert "services.tables.common" in deps
+    assert "services.tables.registry" in deps
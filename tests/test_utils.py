@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+from services.helpers.utils import calculate_grouped_slope
+
+
+def _evaluations():
+    rng = np.random.default_rng(0)
+    days = pd.date_range("2015-01-01", periods=12, freq="180D").map(pd.Timestamp.toordinal)
+    return pd.DataFrame({
+        "EMP_ID": np.repeat(["E00001", "E00002", "E00003"], 4),
+        "DAY": np.asarray(days, dtype=np.int64),
+        "SCORE": rng.normal(80, 5, 12),
+    })
+
+
+def test_grouped_slope_matches_polyfit():
+    df = _evaluations()
+
+    slopes = calculate_grouped_slope(df, "EMP_ID", "DAY", "SCORE")
+
+    for emp_id, group in df.groupby("EMP_ID"):
+        expected = np.polyfit(group["DAY"].astype(float), group["SCORE"], 1)[0]
+        assert np.isclose(slopes[emp_id], expected, rtol=1e-12, atol=0)
+
+
+def test_grouped_slope_independent_of_other_groups():
+    """다른 직원의 행이 바뀌어도 기울기가 비트 단위로 같아야 증분 빌드와 전체 빌드가 일치"""
+    df = _evaluations()
+    subset = df[df["EMP_ID"] != "E00001"]
+
+    full = calculate_grouped_slope(df, "EMP_ID", "DAY", "SCORE")
+    partial = calculate_grouped_slope(subset, "EMP_ID", "DAY", "SCORE")
+
+    assert (full[partial.index] == partial).all()
+
+
+def test_grouped_slope_degenerate_groups_are_zero():
+    df = pd.DataFrame({"EMP_ID": ["A", "B", "B"], "DAY": [1, 5, 5], "SCORE": [70.0, 80.0, 90.0]})
+
+    slopes = calculate_grouped_slope(df, "EMP_ID", "DAY", "SCORE")
+
+    assert slopes.to_dict() == {"A": 0.0, "B": 0.0}